@@ -0,0 +1,165 @@
+"""
+Archival benchmark: hot-table size and query time before and after
+`archive_bookings`.
+
+Seeds --years academic years of confirmed, paid bookings (--bookings-per-year
+each) across --rooms rooms, then times the queries that run on every request
+against the live tables:
+
+  * overlap  - the capacity check BookingSerializer runs for a new booking
+  * revenue  - the dashboard's confirmed-revenue aggregate
+
+and reports the row counts and on-disk size of core_booking and core_payment.
+It then archives everything that checked out more than BOOKING_ARCHIVE_AFTER_DAYS
+ago and measures again.
+
+Uses the database in DATABASE_URL, which is flushed first, e.g.
+
+    DATABASE_URL=sqlite:////tmp/bench.sqlite3 python benchmarks/archive.py --years 5
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hostel_booking.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.db.models import Sum  # noqa: E402
+from django.utils import timezone  # noqa: E402
+from core.models import Booking, Payment, ProviderProfile, Room, StudentProfile, User  # noqa: E402
+from core.services.archive import archive_batch, archive_cutoff  # noqa: E402
+
+
+def seed(rooms, years, bookings_per_year):
+    call_command('migrate', verbosity=0)
+    call_command('flush', interactive=False, verbosity=0)
+    user = User.objects.create_user(username='bench-provider', email='provider@example.com', password='password', role='provider')
+    provider = ProviderProfile.objects.create(
+        user=user, business_name='Bench Hostel', contact_person='Bench', email='provider@example.com',
+        phone_number='0000000000', address='Bench St', bank_details='Bench'
+    )
+    room_ids = [
+        room.id for room in Room.objects.bulk_create([
+            Room(provider=provider, hostel_name='Bench Hostel', room_number=str(i), price_per_night=100, max_occupancy=4)
+            for i in range(rooms)
+        ])
+    ]
+    student_users = User.objects.bulk_create([
+        User(username=f'bench-student-{i}', email=f'student{i}@example.com', role='student') for i in range(200)
+    ])
+    student_ids = [
+        student.id for student in StudentProfile.objects.bulk_create([
+            StudentProfile(user=u, phone_number='0000000000', date_of_birth='2000-01-01', program='Bench') for u in student_users
+        ])
+    ]
+
+    rng = random.Random(42)
+    today = timezone.localdate()
+    for year in range(years):
+        bookings = []
+        for i in range(bookings_per_year):
+            check_in = today - timedelta(days=365 * year + rng.randrange(365))
+            nights = rng.randint(1, 120)
+            bookings.append(Booking(
+                student_id=student_ids[i % len(student_ids)], room_id=rng.choice(room_ids),
+                check_in_date=check_in, check_out_date=check_in + timedelta(days=nights),
+                booking_status='confirmed', total_amount=nights * 100,
+            ))
+        bookings = Booking.objects.bulk_create(bookings, batch_size=2000)
+        Payment.objects.bulk_create([
+            Payment(booking=b, amount=(b.check_out_date - b.check_in_date).days * 100, payment_method='card',
+                    transaction_id=f'bench-{b.id}', status='success')
+            for b in bookings
+        ], batch_size=2000)
+    return provider, room_ids
+
+
+def table_bytes(table):
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute("SELECT pg_total_relation_size(%s)", [table])
+            return cursor.fetchone()[0]
+        if connection.vendor == 'sqlite':
+            cursor.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = %s OR name IN "
+                           "(SELECT name FROM sqlite_master WHERE tbl_name = %s AND type = 'index')", [table, table])
+            return cursor.fetchone()[0]
+    return None
+
+
+def timed(fn, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def measure(provider, room_ids, repeat):
+    today = timezone.localdate()
+
+    def overlap():
+        Booking.objects.filter(
+            room_id=room_ids[0], check_in_date__lt=today + timedelta(days=30), check_out_date__gt=today,
+            booking_status__in=['approved', 'confirmed'], payment__status='success',
+        ).count()
+
+    def revenue():
+        Payment.objects.filter(
+            booking__room__provider=provider, booking__booking_status='confirmed', status='success'
+        ).aggregate(total=Sum('amount'))
+
+    return {
+        'bookings': Booking.objects.count(),
+        'payments': Payment.objects.count(),
+        'booking_kb': (table_bytes('core_booking') or 0) // 1024,
+        'payment_kb': (table_bytes('core_payment') or 0) // 1024,
+        'overlap_ms': timed(overlap, repeat),
+        'revenue_ms': timed(revenue, repeat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rooms', type=int, default=200)
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--bookings-per-year', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    provider, room_ids = seed(args.rooms, args.years, args.bookings_per_year)
+    before = measure(provider, room_ids, args.repeat)
+
+    cutoff = archive_cutoff()
+    started = time.perf_counter()
+    while archive_batch(cutoff, settings.BOOKING_ARCHIVE_BATCH_SIZE)[0]:
+        pass
+    archive_seconds = time.perf_counter() - started
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute('VACUUM')
+    elif connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('VACUUM FULL core_booking')
+            cursor.execute('VACUUM FULL core_payment')
+    after = measure(provider, room_ids, args.repeat)
+
+    print(f"{connection.vendor}, {args.years} years x {args.bookings_per_year} bookings, archive horizon "
+          f"{settings.BOOKING_ARCHIVE_AFTER_DAYS} days (cutoff {cutoff}), archived in {archive_seconds:.1f}s")
+    print(f"{'':12}{'bookings':>10}{'payments':>10}{'booking KB':>12}{'payment KB':>12}{'overlap ms':>12}{'revenue ms':>12}")
+    for label, result in (('before', before), ('after', after)):
+        print(f"{label:12}{result['bookings']:>10}{result['payments']:>10}{result['booking_kb']:>12}"
+              f"{result['payment_kb']:>12}{result['overlap_ms']:>12.2f}{result['revenue_ms']:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
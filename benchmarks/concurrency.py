@@ -0,0 +1,167 @@
+"""
+Concurrent-connection benchmark: sync (gunicorn sync workers, WSGI) vs async
+(gunicorn + uvicorn workers, ASGI with ASYNC_VIEWS=True).
+
+Starts a fake Paystack that answers after --paystack-latency-ms, then serves
+the app both ways with the same number of worker processes and fires
+--concurrency simultaneous payment-initiation requests at each. Every request
+spends most of its time waiting on Paystack, so the sync stack can only have
+`workers` requests in flight while the async stack keeps accepting more.
+
+Uses the database in DATABASE_URL (migrated and seeded with one booking), e.g.
+
+    DATABASE_URL=sqlite:////tmp/bench.sqlite3 python benchmarks/concurrency.py --workers 2 --concurrency 200
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hostel_booking.settings')
+
+
+async def fake_paystack(scope, receive, send):
+    """Minimal ASGI app standing in for api.paystack.co/transaction/initialize."""
+    if scope['type'] != 'http':
+        return
+    await asyncio.sleep(float(os.environ.get('FAKE_PAYSTACK_LATENCY', '0.3')))
+    await send({'type': 'http.response.start', 'status': 200, 'headers': [(b'content-type', b'application/json')]})
+    await send({'type': 'http.response.body', 'body': b'{"status": true, "data": {"authorization_url": "https://paystack.test/x"}}'})
+
+
+def seed():
+    """Migrate the database and create a student with an approved booking. Returns (token, payload)."""
+    import django
+    django.setup()
+    from django.core.management import call_command
+    from rest_framework_simplejwt.tokens import AccessToken
+    from core.models import User, StudentProfile, ProviderProfile, Room, Booking
+
+    call_command('migrate', verbosity=0)
+    student, _ = User.objects.get_or_create(
+        username='bench-student', defaults={'email': 'bench-student@example.com', 'role': 'student'}
+    )
+    profile, _ = StudentProfile.objects.get_or_create(
+        user=student, defaults={'phone_number': '0000000000', 'date_of_birth': '2000-01-01', 'program': 'Bench'}
+    )
+    provider, _ = User.objects.get_or_create(
+        username='bench-provider', defaults={'email': 'bench-provider@example.com', 'role': 'provider'}
+    )
+    provider_profile, _ = ProviderProfile.objects.get_or_create(user=provider, defaults={
+        'business_name': 'Bench Hostel', 'contact_person': 'Bench', 'email': 'bench-provider@example.com',
+        'phone_number': '0000000000', 'address': 'Bench St', 'bank_details': 'Bench',
+    })
+    room, _ = Room.objects.get_or_create(provider=provider_profile, room_number='B1', defaults={
+        'hostel_name': 'Bench Hostel', 'price_per_night': 100, 'max_occupancy': 10,
+    })
+    check_in = date.today() + timedelta(days=30)
+    booking, _ = Booking.objects.get_or_create(
+        student=profile, room=room, check_in_date=check_in, check_out_date=check_in + timedelta(days=1),
+        defaults={'booking_status': 'approved'},
+    )
+    payload = {'booking_id': booking.id, 'email': student.email, 'amount': str(booking.total_amount)}
+    return str(AccessToken.for_user(student)), payload
+
+
+def start(args, env, port):
+    process = subprocess.Popen(args, cwd=ROOT, env={**os.environ, **env, 'PORT': str(port)},
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return process
+
+
+async def wait_until_up(url, timeout=30):
+    import httpx
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up")
+
+
+async def fire(url, token, payload, concurrency, timeout):
+    import httpx
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=0)
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+        async def one():
+            started = time.perf_counter()
+            try:
+                response = await client.post(url, json=payload, headers={'Authorization': f'Bearer {token}'})
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            return ok, time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(one() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    latencies = sorted(latency for ok, latency in results if ok)
+    return elapsed, len(latencies), latencies
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else float('nan')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--paystack-latency-ms', type=float, default=300)
+    parser.add_argument('--timeout', type=float, default=30, help="Client timeout per request, in seconds.")
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    token, payload = seed()
+    asyncio.run(compare(args, token, payload))
+
+
+async def compare(args, token, payload):
+    paystack_port, app_port = args.port, args.port + 1
+    env = {
+        'PAYSTACK_API_URL': f'http://127.0.0.1:{paystack_port}',
+        'WEB_CONCURRENCY': str(args.workers),
+        'GUNICORN_TIMEOUT': str(int(args.timeout) + 5),
+        'DEBUG': 'True',
+        'ENABLE_SWAGGER': 'False',
+    }
+    paystack = start(
+        [sys.executable, '-m', 'uvicorn', 'benchmarks.concurrency:fake_paystack', '--port', str(paystack_port),
+         '--log-level', 'warning', '--backlog', '4096'],
+        {'FAKE_PAYSTACK_LATENCY': str(args.paystack_latency_ms / 1000)}, paystack_port,
+    )
+    try:
+        await wait_until_up(f'http://127.0.0.1:{paystack_port}/')
+        print(f"{args.concurrency} concurrent payment initiations, {args.workers} workers, "
+              f"Paystack latency {args.paystack_latency_ms:.0f} ms")
+        for name, mode_env in (('sync (wsgi)', {'SERVER_MODE': 'wsgi', 'ASYNC_VIEWS': 'False'}),
+                               ('async (asgi)', {'SERVER_MODE': 'asgi', 'ASYNC_VIEWS': 'True'})):
+            server = start([sys.executable, '-m', 'gunicorn', '--backlog', '4096'], {**env, **mode_env}, app_port)
+            try:
+                await wait_until_up(f'http://127.0.0.1:{app_port}/api/')
+                elapsed, succeeded, latencies = await fire(
+                    f'http://127.0.0.1:{app_port}/api/payments/initiate/', token, payload, args.concurrency, args.timeout
+                )
+            finally:
+                server.send_signal(signal.SIGTERM)
+                server.wait()
+            print(f"  {name:<13} {elapsed:7.2f} s  {succeeded / elapsed:7.1f} req/s  "
+                  f"{succeeded}/{args.concurrency} ok  p50 {percentile(latencies, 0.5) * 1000:7.0f} ms  "
+                  f"p95 {percentile(latencies, 0.95) * 1000:7.0f} ms")
+    finally:
+        paystack.send_signal(signal.SIGTERM)
+        paystack.wait()
+
+
+if __name__ == '__main__':
+    main()
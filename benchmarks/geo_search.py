@@ -0,0 +1,88 @@
+"""
+Room distance search benchmark: bounding-box prefilter on the indexed
+latitude/longitude columns plus exact haversine (core/services/geo.py, what
+/api/rooms/?lat=&lng=&radius_km= uses) against computing the haversine
+distance for every room.
+
+Seeds --rooms rooms scattered over Ghana, runs --searches random 2 km
+searches both ways and checks they return the same rooms.
+
+Uses the database in DATABASE_URL, which is flushed first, e.g.
+
+    DATABASE_URL=sqlite:////tmp/bench.sqlite3 python benchmarks/geo_search.py --rooms 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hostel_booking.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+from core.models import ProviderProfile, Room, User  # noqa: E402
+from core.services.geo import distance_km, within_radius  # noqa: E402
+
+# Roughly Ghana
+SOUTH, NORTH, WEST, EAST = 4.7, 11.2, -3.3, 1.2
+
+
+def seed(rooms, rng):
+    call_command('migrate', verbosity=0)
+    call_command('flush', interactive=False, verbosity=0)
+    user = User.objects.create_user(username='bench-provider', email='provider@example.com', password='password', role='provider')
+    provider = ProviderProfile.objects.create(
+        user=user, business_name='Bench Hostel', contact_person='Bench', email='provider@example.com',
+        phone_number='0000000000', address='Bench St', bank_details='Bench'
+    )
+    Room.objects.bulk_create([
+        Room(provider=provider, hostel_name='Bench Hostel', room_number=str(i), price_per_night=100, max_occupancy=4,
+             latitude=rng.uniform(SOUTH, NORTH), longitude=rng.uniform(WEST, EAST))
+        for i in range(rooms)
+    ], batch_size=2000)
+
+
+def full_scan(rooms, lat, lng, radius_km):
+    return (
+        rooms.filter(latitude__isnull=False)
+        .annotate(distance_km=distance_km(lat, lng))
+        .filter(distance_km__lte=radius_km)
+        .order_by('distance_km', 'id')
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rooms', type=int, default=100000)
+    parser.add_argument('--searches', type=int, default=50)
+    parser.add_argument('--radius-km', type=float, default=2)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    seed(args.rooms, rng)
+    points = [(rng.uniform(SOUTH, NORTH), rng.uniform(WEST, EAST)) for _ in range(args.searches)]
+
+    results = {}
+    for label, search in (('bbox', within_radius), ('full', full_scan)):
+        started = time.perf_counter()
+        results[label] = [
+            list(search(Room.objects.all(), lat, lng, args.radius_km).values_list('id', flat=True))
+            for lat, lng in points
+        ]
+        results[label + '_ms'] = (time.perf_counter() - started) / args.searches * 1000
+
+    assert results['bbox'] == results['full'], "bounding-box and full-scan searches differ"
+    found = sum(len(ids) for ids in results['bbox'])
+    print(f"{args.rooms} rooms, {args.searches} searches of {args.radius_km:g} km, {found} rooms found")
+    print(f"bounding box + haversine: {results['bbox_ms']:8.2f} ms/search")
+    print(f"haversine on every room:  {results['full_ms']:8.2f} ms/search")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Occupancy calendar benchmark: one query plus a difference array
+(core/services/occupancy.py, what /api/rooms/calendar/ uses) against one
+grouped COUNT query per day.
+
+Seeds one provider with --rooms rooms and --bookings confirmed bookings spread
+over the next year, then builds the --days calendar both ways and checks they
+agree.
+
+Uses the database in DATABASE_URL, which is flushed first, e.g.
+
+    DATABASE_URL=sqlite:////tmp/bench.sqlite3 python benchmarks/occupancy_calendar.py --rooms 500 --days 365
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hostel_booking.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.management import call_command  # noqa: E402
+from django.db.models import Count  # noqa: E402
+from django.utils import timezone  # noqa: E402
+from core.models import Booking, ProviderProfile, Room, StudentProfile, User  # noqa: E402
+from core.services.occupancy import occupancy_by_night, window_stays  # noqa: E402
+
+
+def seed(rooms, bookings):
+    call_command('migrate', verbosity=0)
+    call_command('flush', interactive=False, verbosity=0)
+    user = User.objects.create_user(username='bench-provider', email='provider@example.com', password='password', role='provider')
+    provider = ProviderProfile.objects.create(
+        user=user, business_name='Bench Hostel', contact_person='Bench', email='provider@example.com',
+        phone_number='0000000000', address='Bench St', bank_details='Bench'
+    )
+    room_ids = [
+        room.id for room in Room.objects.bulk_create([
+            Room(provider=provider, hostel_name='Bench Hostel', room_number=str(i), price_per_night=100, max_occupancy=4)
+            for i in range(rooms)
+        ])
+    ]
+    student_users = User.objects.bulk_create([
+        User(username=f'bench-student-{i}', email=f'student{i}@example.com', role='student') for i in range(500)
+    ])
+    student_ids = [
+        student.id for student in StudentProfile.objects.bulk_create([
+            StudentProfile(user=u, phone_number='0000000000', date_of_birth='2000-01-01', program='Bench') for u in student_users
+        ])
+    ]
+
+    rng = random.Random(42)
+    today = timezone.localdate()
+    seen = set()
+    rows = []
+    while len(rows) < bookings:
+        check_in = today + timedelta(days=rng.randrange(-30, 365))
+        booking = (rng.choice(student_ids), rng.choice(room_ids), check_in, check_in + timedelta(days=rng.randint(1, 120)))
+        if booking in seen:
+            continue
+        seen.add(booking)
+        rows.append(Booking(student_id=booking[0], room_id=booking[1], check_in_date=booking[2],
+                            check_out_date=booking[3], booking_status='confirmed',
+                            total_amount=(booking[3] - booking[2]).days * 100))
+    Booking.objects.bulk_create(rows, batch_size=2000)
+    return provider
+
+
+def sweep(bookings, start, days):
+    return occupancy_by_night(window_stays(bookings, start, days), start, days)
+
+
+def per_day(bookings, start, days):
+    occupancy = {}
+    for day in range(days):
+        night = start + timedelta(days=day)
+        counts = bookings.filter(check_in_date__lte=night, check_out_date__gt=night).values('room_id').annotate(n=Count('id')).order_by()
+        for row in counts:
+            occupancy.setdefault(row['room_id'], [0] * days)[day] = row['n']
+    return occupancy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rooms', type=int, default=500)
+    parser.add_argument('--bookings', type=int, default=20000)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    provider = seed(args.rooms, args.bookings)
+    bookings = Booking.objects.filter(room__provider=provider, booking_status='confirmed')
+    start = timezone.localdate()
+
+    results = {}
+    for label, build in (('sweep', sweep), ('per-day', per_day)):
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            results[label] = build(bookings, start, args.days)
+        results[label + '_ms'] = (time.perf_counter() - started) / args.repeat * 1000
+
+    assert results['sweep'] == results['per-day'], "sweep and per-day occupancy differ"
+    print(f"{args.rooms} rooms x {args.days} days, {args.bookings} confirmed bookings")
+    print(f"sweep (1 query):          {results['sweep_ms']:8.1f} ms")
+    print(f"per-day ({args.days} queries):   {results['per-day_ms']:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
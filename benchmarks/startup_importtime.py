@@ -0,0 +1,95 @@
+"""
+Startup-time benchmark.
+
+Runs `python -X importtime manage.py check` several times and compares the
+median import time and wall-clock time against the budget tracked in
+benchmarks/startup_budget.json. It also fails if a module that is supposed to
+load lazily (Swagger, the Cloudinary uploader/admin API, ...) is imported at
+startup.
+
+Usage (from the repository root, with the usual environment variables set):
+
+    python benchmarks/startup_importtime.py [--runs 5] [--update-budget]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGET_FILE = Path(__file__).resolve().parent / 'startup_budget.json'
+COMMAND = [sys.executable, '-X', 'importtime', 'manage.py', 'check']
+
+
+def parse_importtime(stderr):
+    """Return {module: (self_us, cumulative_us, depth)} from -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, self_us, cumulative_us, name = (line.split(':', 1)[0],) + tuple(line.split(':', 1)[1].split('|'))
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    return modules
+
+
+def run_once():
+    started = time.perf_counter()
+    result = subprocess.run(COMMAND, cwd=ROOT, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - started) * 1000
+    if result.returncode != 0:
+        sys.stderr.write(result.stdout + result.stderr)
+        raise SystemExit(f"`{' '.join(COMMAND[1:])}` failed")
+    modules = parse_importtime(result.stderr)
+    import_ms = sum(cumulative for _, cumulative, depth in modules.values() if depth == 0) / 1000
+    return wall_ms, import_ms, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--update-budget', action='store_true',
+                        help="Record the measured medians (plus 25%% headroom) as the new budget.")
+    args = parser.parse_args()
+
+    budget = json.loads(BUDGET_FILE.read_text())
+    runs = [run_once() for _ in range(args.runs)]
+    wall_ms = statistics.median(run[0] for run in runs)
+    import_ms = statistics.median(run[1] for run in runs)
+    modules = runs[-1][2]
+
+    print(f"manage.py check over {args.runs} runs (median)")
+    print(f"  wall clock : {wall_ms:8.1f} ms  (budget {budget['wall_ms']} ms)")
+    print(f"  imports    : {import_ms:8.1f} ms  (budget {budget['import_ms']} ms)")
+    print("  heaviest top-level imports:")
+    top_level = sorted(((cum, name) for name, (_, cum, depth) in modules.items() if depth == 0), reverse=True)
+    for cumulative, name in top_level[:10]:
+        print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+    if args.update_budget:
+        budget['wall_ms'] = round(wall_ms * 1.25)
+        budget['import_ms'] = round(import_ms * 1.25)
+        BUDGET_FILE.write_text(json.dumps(budget, indent=2) + '\n')
+        print(f"Budget updated in {BUDGET_FILE.name}")
+        return 0
+
+    failures = []
+    if wall_ms > budget['wall_ms']:
+        failures.append(f"wall clock {wall_ms:.1f} ms exceeds budget of {budget['wall_ms']} ms")
+    if import_ms > budget['import_ms']:
+        failures.append(f"import time {import_ms:.1f} ms exceeds budget of {budget['import_ms']} ms")
+    for module in budget['lazy_modules']:
+        if module in modules:
+            failures.append(f"{module} is imported at startup but should load lazily")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
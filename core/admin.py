@@ -1,10 +1,63 @@
-from django.contrib import admin
-from .models import StudentProfile, ProviderProfile, Room, Booking, Payment, Facility
+from django import forms
+from django.conf import settings
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
+from django.contrib.admin.models import CHANGE, LogEntry
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.utils.functional import cached_property
+from .models import StudentProfile, ProviderProfile, Room, Booking, Payment, Facility, WaitlistEntry, PricingRule
+from .services.booking_state import ACTIVE_STATUSES, transition_many
+from .services.facets import invalidate_facets
+from .services.payments import refund_booking_payments
+from .services.waitlist import promote_released
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for changelists of very large tables.
+
+    An unfiltered changelist on PostgreSQL uses the planner's row estimate
+    (pg_class.reltuples) instead of COUNT(*), once the table holds at least
+    ADMIN_ESTIMATED_COUNT_MIN rows. Filtered lists and other databases count
+    exactly.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= settings.ADMIN_ESTIMATED_COUNT_MIN:
+                return row[0]
+        return super().count
+
+
+def log_bulk_change(request, queryset, fields):
+    """One admin history entry per changed object, written with a single INSERT."""
+    LogEntry.objects.log_actions(request.user.id, queryset, CHANGE, [{"changed": {"fields": fields}}])
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """Changelist settings for tables with hundreds of thousands of rows."""
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False  # skips the second, unfiltered COUNT(*)
+    ordering = ('-id',)
+
 
 @admin.register(StudentProfile)
 class StudentAdmin(admin.ModelAdmin):
     list_display = ('get_username', 'get_email', 'program', 'phone_number')
+    list_select_related = ('user',)
     search_fields = ('user__username', 'user__email')
+    raw_id_fields = ('user',)
 
     def get_username(self, obj):
         return obj.user.username
@@ -18,31 +71,124 @@ class StudentAdmin(admin.ModelAdmin):
 @admin.register(ProviderProfile)
 class RoomProviderAdmin(admin.ModelAdmin):
     list_display = ('business_name', 'get_email', 'phone_number')
+    list_select_related = ('user',)
     search_fields = ('business_name', 'user__email')
+    raw_id_fields = ('user',)
 
     def get_email(self, obj):
         return obj.user.email
     get_email.short_description = 'Email'
 
 
+class RoomActionForm(ActionForm):
+    price_per_night = forms.DecimalField(
+        required=False, max_digits=8, decimal_places=2,
+        help_text="New price per night, for the \"Set price\" action.",
+    )
+
+
 @admin.register(Room)
 class RoomAdmin(admin.ModelAdmin):
-    list_display = ('hostel_name', 'room_number', 'price_per_night', 'max_occupancy', 'is_available')
-    list_filter = ('is_available',)
+    """Bulk actions each run as one UPDATE plus one audit INSERT, in a single transaction."""
+    list_display = ('hostel_name', 'room_number', 'provider', 'price_per_night', 'max_occupancy', 'is_listed')
+    list_select_related = ('provider',)
+    list_filter = ('is_listed',)
+    search_fields = ('hostel_name', 'room_number')
+    autocomplete_fields = ('provider',)
+    action_form = RoomActionForm
+    actions = ['list_rooms', 'unlist_rooms', 'set_price']
+
+    def update_rooms(self, request, queryset, **changes):
+        """
+        Apply changes to the selected rooms and log them. The ids are read first:
+        the changelist queryset may be filtered on the very field being changed.
+        """
+        ids = list(queryset.values_list('pk', flat=True))
+        with transaction.atomic():
+            updated = Room.objects.filter(pk__in=ids).update(**changes)
+            log_bulk_change(request, Room.objects.filter(pk__in=ids), list(changes))
+        invalidate_facets()
+        return updated
+
+    def set_listed(self, request, queryset, is_listed):
+        updated = self.update_rooms(request, queryset, is_listed=is_listed)
+        self.message_user(request, f"{'Listed' if is_listed else 'Unlisted'} {updated} room(s).", messages.SUCCESS)
+
+    @admin.action(description="List selected rooms", permissions=['change'])
+    def list_rooms(self, request, queryset):
+        self.set_listed(request, queryset, True)
 
+    @admin.action(description="Unlist selected rooms", permissions=['change'])
+    def unlist_rooms(self, request, queryset):
+        self.set_listed(request, queryset, False)
+
+    @admin.action(description="Set price per night of selected rooms", permissions=['change'])
+    def set_price(self, request, queryset):
+        field = RoomActionForm.base_fields['price_per_night']
+        try:
+            price = field.clean(request.POST.get('price_per_night'))
+        except ValidationError as e:
+            self.message_user(request, f"Invalid price: {' '.join(e.messages)}", messages.ERROR)
+            return
+        if price is None or price <= 0:
+            self.message_user(request, "Invalid price: enter a price per night above zero next to the action.", messages.ERROR)
+            return
+        updated = self.update_rooms(request, queryset, price_per_night=price)
+        self.message_user(request, f"Set the price of {updated} room(s) to {price}.", messages.SUCCESS)
 
 
 @admin.register(Booking)
-class BookingAdmin(admin.ModelAdmin):
+class BookingAdmin(LargeTableAdmin):
     list_display = ('student', 'room', 'check_in_date', 'check_out_date', 'booking_status')
+    list_select_related = ('student__user', 'room')
     list_filter = ('booking_status',)
+    date_hierarchy = 'check_in_date'
+    search_fields = ('=id', 'student__user__username')
+    autocomplete_fields = ('student', 'room')
+    actions = ['cancel_bookings']
+
+    @admin.action(description="Cancel selected bookings and refund their payments", permissions=['change'])
+    def cancel_bookings(self, request, queryset):
+        booking_ids = list(queryset.values_list('id', flat=True))
+        with transaction.atomic():
+            cancelled = transition_many(booking_ids, ACTIVE_STATUSES, 'cancelled', actor=request.user, source='admin')
+            cancelled_ids = [booking_id for booking_id, _, _, _ in cancelled]
+            refunded = refund_booking_payments(cancelled_ids)
+            promote_released(cancelled)
+            log_bulk_change(request, Booking.objects.filter(id__in=cancelled_ids).select_related('student__user', 'room'), ['booking_status'])
+        skipped = len(booking_ids) - len(cancelled_ids)
+        message = f"Cancelled {len(cancelled_ids)} booking(s) and refunded {refunded} payment(s)."
+        if skipped:
+            message += f" {skipped} were already cancelled, rejected or expired."
+        self.message_user(request, message, messages.SUCCESS)
 
 
 @admin.register(Payment)
-class PaymentAdmin(admin.ModelAdmin):
+class PaymentAdmin(LargeTableAdmin):
     list_display = ('booking', 'amount', 'payment_method', 'status', 'payment_date')
+    list_select_related = ('booking__student__user', 'booking__room')
     list_filter = ('status', 'payment_method')
+    date_hierarchy = 'payment_date'
+    search_fields = ('=transaction_id', '=booking__id')
+    raw_id_fields = ('booking',)
 
 @admin.register(Facility)
 class FacilityAdmin(admin.ModelAdmin):
-    list_display = ('name',)
\ No newline at end of file
+    list_display = ('name',)
+
+@admin.register(PricingRule)
+class PricingRuleAdmin(admin.ModelAdmin):
+    list_display = ('provider', 'hostel_name', 'kind', 'start_date', 'end_date', 'nightly_price', 'percent', 'min_nights', 'priority', 'is_active')
+    list_select_related = ('provider',)
+    list_filter = ('kind', 'is_active')
+    search_fields = ('hostel_name', 'provider__business_name')
+    autocomplete_fields = ('provider',)
+
+@admin.register(WaitlistEntry)
+class WaitlistEntryAdmin(LargeTableAdmin):
+    list_display = ('student', 'room', 'check_in_date', 'check_out_date', 'status', 'created_at')
+    list_select_related = ('student__user', 'room')
+    list_filter = ('status',)
+    date_hierarchy = 'created_at'
+    autocomplete_fields = ('student', 'room')
+    raw_id_fields = ('booking',)
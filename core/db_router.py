@@ -0,0 +1,61 @@
+# core/db_router.py
+"""
+Primary/replica database routing.
+
+Everything reads from and writes to the primary ('default') unless a view has
+opted in to replica reads for the current request (see ReplicaReadMixin), a
+'replica' database is configured, and the requesting user has not written
+anything in the last REPLICA_STICKY_SECONDS (read-your-writes).
+"""
+from contextvars import ContextVar
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+REPLICA = 'replica'
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def replica_configured():
+    return REPLICA in connections.settings
+
+
+def enable_replica_reads():
+    """Route reads for the rest of the current request to the replica. Returns a token for reset_replica_reads()."""
+    return _replica_reads.set(replica_configured())
+
+
+def reset_replica_reads(token):
+    _replica_reads.reset(token)
+
+
+def _sticky_key(user_id):
+    return f"db:sticky-primary:{user_id}"
+
+
+def mark_primary_sticky(user):
+    """Pin the user's reads to the primary for a short while after a write."""
+    if user is not None and user.is_authenticated:
+        cache.set(_sticky_key(user.pk), True, settings.REPLICA_STICKY_SECONDS)
+
+
+def is_primary_sticky(user):
+    return user is not None and user.is_authenticated and bool(cache.get(_sticky_key(user.pk)))
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _replica_reads.get():
+            return REPLICA
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica is a copy of the primary, so objects from either can be related
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
@@ -0,0 +1,45 @@
+from datetime import date
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from core.models import Payment
+from core.services.archive import archivable, archive_batch, archive_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        "Move bookings whose check-out date is older than BOOKING_ARCHIVE_AFTER_DAYS, and their payments, "
+        "into the archive tables in batched transactions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--before', help="Archive bookings that checked out before this date (YYYY-MM-DD) instead of the configured horizon")
+        parser.add_argument('--batch-size', type=int, default=settings.BOOKING_ARCHIVE_BATCH_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help="Report what would be archived without moving anything")
+
+    def handle(self, *args, **options):
+        before = archive_cutoff()
+        if options['before']:
+            try:
+                before = date.fromisoformat(options['before'])
+            except ValueError:
+                raise CommandError("--before must be a date in YYYY-MM-DD format.")
+
+        if options['dry_run']:
+            bookings = archivable(before).count()
+            payments = Payment.objects.filter(booking__check_out_date__lt=before).count()
+            self.stdout.write(self.style.SUCCESS(
+                f"Would archive {bookings} booking(s) and {payments} payment(s) that checked out before {before}"
+            ))
+            return
+
+        bookings = payments = 0
+        while True:
+            moved_bookings, moved_payments = archive_batch(before, options['batch_size'])
+            bookings += moved_bookings
+            payments += moved_payments
+            if moved_bookings < options['batch_size']:
+                break
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Archived {bookings} booking(s) and {payments} payment(s) that checked out before {before}"
+        ))
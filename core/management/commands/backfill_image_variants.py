@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from core.models import Room
+from core.services.room_images import cloudinary_variants
+
+
+class Command(BaseCommand):
+    help = "Precompute image variant URLs for rooms whose photo was uploaded before the image pipeline existed."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        rooms = Room.objects.filter(image_variants={}).exclude(image__isnull=True).exclude(image='').only('id', 'image')
+
+        batch = []
+        updated = 0
+        for room in rooms.iterator(chunk_size=batch_size):
+            room.image_variants = cloudinary_variants(room.image)
+            batch.append(room)
+            if len(batch) >= batch_size:
+                Room.objects.bulk_update(batch, ['image_variants'])
+                updated += len(batch)
+                batch = []
+        if batch:
+            Room.objects.bulk_update(batch, ['image_variants'])
+            updated += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Stored image variants for {updated} room(s)"))
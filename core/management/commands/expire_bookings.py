@@ -0,0 +1,64 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from core.models import Booking
+from core.services.booking_state import transition_many
+from core.services.waitlist import promote_released
+
+
+class Command(BaseCommand):
+    help = (
+        "Expire pending/approved bookings that were never paid, oldest first, in batches. "
+        "Safe to run from cron while the site is live: rows locked by another transaction are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=settings.BOOKING_EXPIRY_BATCH_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help="Report what would be expired without changing anything")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        now = timezone.now()
+
+        expired = {}
+        nights = 0
+        promoted = 0
+        for from_status, hours in settings.BOOKING_EXPIRY_HOURS.items():
+            if not hours:
+                continue
+            stale = Booking.objects.filter(
+                booking_status=from_status, created_at__lt=now - timedelta(hours=hours)
+            ).exclude(payment__status='success')
+
+            if options['dry_run']:
+                count = 0
+                for check_in, check_out in stale.values_list('check_in_date', 'check_out_date').iterator(chunk_size=batch_size):
+                    count += 1
+                    nights += (check_out - check_in).days
+                expired[from_status] = count
+                continue
+
+            expired[from_status] = 0
+            while True:
+                with transaction.atomic():
+                    booking_ids = list(
+                        stale.select_for_update(skip_locked=True, of=('self',))
+                        .order_by('created_at', 'id')
+                        .values_list('id', flat=True)[:batch_size]
+                    )
+                    rows = transition_many(booking_ids, from_status, 'expired', source='system')
+                    promoted += len(promote_released(rows))
+                expired[from_status] += len(rows)
+                nights += sum((check_out - check_in).days for _, _, check_in, check_out in rows)
+                if len(booking_ids) < batch_size or not rows:
+                    break
+
+        total = sum(expired.values())
+        breakdown = ', '.join(f"{count} {from_status}" for from_status, count in expired.items())
+        prefix = "Would expire" if options['dry_run'] else "Expired"
+        message = f"{prefix} {total} booking(s) ({breakdown or 'expiry disabled'}), freeing {nights} room-night(s)"
+        if not options['dry_run']:
+            message += f"; promoted {promoted} waitlist entr{'y' if promoted == 1 else 'ies'}"
+        self.stdout.write(self.style.SUCCESS(message))
@@ -0,0 +1,58 @@
+from collections import Counter
+from django.core.management.base import BaseCommand, CommandError
+from core.models import Room
+from core.services.geo import geocode, load_gazetteer
+
+
+class Command(BaseCommand):
+    help = (
+        "Set room latitude/longitude by matching Room.location against an offline CSV gazetteer "
+        "with name, latitude and longitude columns. Rooms that already have coordinates are "
+        "skipped unless --overwrite is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('gazetteer', help="Path to the gazetteer CSV")
+        parser.add_argument('--overwrite', action='store_true', help="Also re-geocode rooms that have coordinates")
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help="Report matches without saving them")
+
+    def handle(self, *args, **options):
+        try:
+            with open(options['gazetteer'], newline='', encoding='utf-8-sig') as f:
+                places = load_gazetteer(f)
+        except OSError as e:
+            raise CommandError(f"Cannot read {options['gazetteer']}: {e}")
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        batch_size = options['batch_size']
+        rooms = Room.objects.exclude(location='').only('id', 'location', 'latitude', 'longitude').order_by('id')
+        if not options['overwrite']:
+            rooms = rooms.filter(latitude__isnull=True)
+
+        batch = []
+        matched = 0
+        unmatched = Counter()
+        for room in rooms.iterator(chunk_size=batch_size):
+            coordinates = geocode(room.location, places)
+            if coordinates is None:
+                unmatched[room.location] += 1
+                continue
+            matched += 1
+            if options['dry_run']:
+                continue
+            room.latitude, room.longitude = coordinates
+            batch.append(room)
+            if len(batch) >= batch_size:
+                Room.objects.bulk_update(batch, ['latitude', 'longitude'])
+                batch = []
+        if batch:
+            Room.objects.bulk_update(batch, ['latitude', 'longitude'])
+
+        for location, count in unmatched.most_common(20):
+            self.stdout.write(f"No match for {location!r} ({count} room(s))")
+        verb = "Would geocode" if options['dry_run'] else "Geocoded"
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {matched} room(s); {sum(unmatched.values())} room(s) had no gazetteer match"
+        ))
@@ -0,0 +1,22 @@
+import time
+from django.core.management.base import BaseCommand
+from core.services.room_images import process_pending_uploads
+
+
+class Command(BaseCommand):
+    help = "Resize, recompress and publish queued room photos until the queue is empty. Use --loop to run as a long-lived worker."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=20, help="Uploads claimed per batch.")
+        parser.add_argument('--loop', action='store_true', help="Keep polling for new uploads instead of exiting.")
+        parser.add_argument('--interval', type=float, default=5.0, help="Seconds to sleep when the queue is empty (with --loop).")
+
+    def handle(self, *args, **options):
+        while True:
+            processed, failed = process_pending_uploads(options['batch_size'])
+            if processed or failed:
+                self.stdout.write(f"Processed {processed} image(s), {failed} failed")
+                continue
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
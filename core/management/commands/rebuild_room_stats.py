@@ -0,0 +1,36 @@
+from datetime import date, timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from core.services.analytics import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the daily occupancy/revenue rollups for a date range from bookings and payments. "
+        "Run nightly to correct drift; by default covers ANALYTICS_REBUILD_DAYS_BACK days ago to "
+        "ANALYTICS_REBUILD_DAYS_AHEAD days ahead."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', help="First date to rebuild (YYYY-MM-DD)")
+        parser.add_argument('--end', help="Last date to rebuild (YYYY-MM-DD)")
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+        dates = {
+            'start': today - timedelta(days=settings.ANALYTICS_REBUILD_DAYS_BACK),
+            'end': today + timedelta(days=settings.ANALYTICS_REBUILD_DAYS_AHEAD),
+        }
+        for name in dates:
+            if options[name]:
+                try:
+                    dates[name] = date.fromisoformat(options[name])
+                except ValueError:
+                    raise CommandError(f"--{name} must be a date in YYYY-MM-DD format.")
+        if dates['end'] < dates['start']:
+            raise CommandError("--start must be on or before --end.")
+
+        rows = rebuild(dates['start'], dates['end'], options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} room stat row(s) for {dates['start']} to {dates['end']}"))
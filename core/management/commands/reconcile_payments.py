@@ -0,0 +1,86 @@
+import csv
+import json
+from datetime import date
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import OuterRef, Subquery
+from core.models import Booking, Payment
+
+COLUMNS = ['issue', 'booking_id', 'payment_id', 'booking_status', 'payment_status', 'amount', 'expected', 'transaction_id']
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream payment/booking discrepancies: successful payments on cancelled or rejected bookings, "
+        "confirmed bookings without a successful payment, and payments that do not match the booking total."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=['csv', 'ndjson'], default='csv')
+        parser.add_argument('--since', help="Only check bookings created on or after this date (YYYY-MM-DD)")
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        since = None
+        if options['since']:
+            try:
+                since = date.fromisoformat(options['since'])
+            except ValueError:
+                raise CommandError("--since must be a date in YYYY-MM-DD format.")
+
+        write = self.csv_writer() if options['format'] == 'csv' else self.ndjson_writer()
+        found = 0
+        for row in self.discrepancies(since, options['batch_size']):
+            write(row)
+            found += 1
+        self.stderr.write(f"{found} discrepancy(ies) found")
+
+    def csv_writer(self):
+        writer = csv.writer(self.stdout, lineterminator='\n')
+        writer.writerow(COLUMNS)
+        return lambda row: writer.writerow([row[column] for column in COLUMNS])
+
+    def ndjson_writer(self):
+        return lambda row: self.stdout.write(json.dumps(row))
+
+    def discrepancies(self, since, batch_size):
+        payments = Payment.objects.all()
+        bookings = Booking.objects.all()
+        if since:
+            payments = payments.filter(booking__created_at__date__gte=since)
+            bookings = bookings.filter(created_at__date__gte=since)
+
+        fields = ('id', 'booking_id', 'booking__booking_status', 'status', 'amount', 'transaction_id')
+
+        # Money kept for a booking that no longer holds a place
+        paid_inactive = payments.filter(
+            status='success', booking__booking_status__in=['cancelled', 'rejected']
+        ).order_by('id').values_list(*fields)
+        for payment_id, booking_id, booking_status, payment_status, amount, transaction_id in paid_inactive.iterator(chunk_size=batch_size):
+            yield self.row('paid_inactive_booking', booking_id, payment_id, booking_status, payment_status, amount, None, transaction_id)
+
+        # Confirmed without money (refunded, failed or missing payment), once per
+        # booking with its latest payment
+        latest = Payment.objects.filter(booking=OuterRef('pk')).order_by('-payment_date', '-id')
+        unpaid = bookings.filter(booking_status='confirmed').exclude(payment__status='success').annotate(
+            **{f'latest_{field}': Subquery(latest.values(field)[:1]) for field in ('id', 'status', 'amount', 'transaction_id')}
+        ).order_by('id').values_list('id', 'latest_id', 'latest_status', 'latest_amount', 'latest_transaction_id')
+        for booking_id, payment_id, payment_status, amount, transaction_id in unpaid.iterator(chunk_size=batch_size):
+            yield self.row('confirmed_without_payment', booking_id, payment_id, 'confirmed', payment_status, amount, None, transaction_id)
+
+        # Successful payments that do not match the booking's stored total
+        paid = payments.filter(status='success').order_by('id').values_list(*fields, 'booking__total_amount')
+        for payment_id, booking_id, booking_status, payment_status, amount, transaction_id, expected in paid.iterator(chunk_size=batch_size):
+            if amount != expected:
+                yield self.row('amount_mismatch', booking_id, payment_id, booking_status, payment_status, amount, expected, transaction_id)
+
+    def row(self, issue, booking_id, payment_id, booking_status, payment_status, amount, expected, transaction_id):
+        return {
+            'issue': issue,
+            'booking_id': booking_id,
+            'payment_id': payment_id,
+            'booking_status': booking_status,
+            'payment_status': payment_status,
+            'amount': str(amount) if amount is not None else None,
+            'expected': str(expected) if expected is not None else None,
+            'transaction_id': transaction_id,
+        }
@@ -0,0 +1,22 @@
+# core/middleware.py
+from core.db_router import mark_primary_sticky
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class StickyPrimaryMiddleware:
+    """
+    After a successful write, keep the user's reads on the primary database
+    for REPLICA_STICKY_SECONDS so they never see stale replica data.
+
+    Runs after the view, so request.user is the DRF (JWT) authenticated user.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            mark_primary_sticky(getattr(request, 'user', None))
+        return response
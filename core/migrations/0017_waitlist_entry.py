@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2026-10-19 14:28
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_room_image_upload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WaitlistEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('check_in_date', models.DateField()),
+                ('check_out_date', models.DateField()),
+                ('status', models.CharField(choices=[('waiting', 'Waiting'), ('promoted', 'Promoted'), ('cancelled', 'Cancelled')], default='waiting', max_length=20)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('promoted_at', models.DateTimeField(blank=True, null=True)),
+                ('booking', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='waitlist_entry', to='core.booking')),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist_entries', to='core.room')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='waitlist_entries', to='core.studentprofile')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('status', 'waiting')), fields=['room', 'check_in_date', 'check_out_date', 'created_at'], name='waitlist_waiting_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('check_in_date__lt', models.F('check_out_date'))), name='waitlist_check_in_before_check_out'), models.UniqueConstraint(condition=models.Q(('status', 'waiting')), fields=('student', 'room', 'check_in_date', 'check_out_date'), name='unique_waiting_student_room_dates')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 14:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_waitlist_entry'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='room',
+            old_name='is_available',
+            new_name='is_listed',
+        ),
+    ]
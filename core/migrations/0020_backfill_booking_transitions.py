@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2026-10-19 14:35
+
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+def backfill(apps, schema_editor):
+    """
+    Seed the transition log for existing bookings: a creation entry at
+    created_at and, if the booking has moved on, one entry for its current
+    status at updated_at (intermediate steps were never recorded).
+    """
+    Booking = apps.get_model('core', 'Booking')
+    BookingTransition = apps.get_model('core', 'BookingTransition')
+
+    batch = []
+    bookings = Booking.objects.values_list(
+        'id', 'room_id', 'room__provider_id', 'booking_status', 'created_at', 'updated_at'
+    ).order_by('id')
+    for booking_id, room_id, provider_id, status, created_at, updated_at in bookings.iterator(chunk_size=BATCH_SIZE):
+        common = {'booking_id': booking_id, 'room_id': room_id, 'provider_id': provider_id, 'source': 'system'}
+        batch.append(BookingTransition(from_status='', to_status='pending', created_at=created_at, **common))
+        if status != 'pending':
+            batch.append(BookingTransition(from_status='pending', to_status=status, created_at=updated_at, **common))
+        if len(batch) >= BATCH_SIZE:
+            BookingTransition.objects.bulk_create(batch)
+            batch = []
+    BookingTransition.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_booking_transition'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
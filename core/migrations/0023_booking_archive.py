@@ -0,0 +1,76 @@
+# Generated by Django 5.2.4 on 2026-10-19 14:45
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_booking_expiry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedBooking',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('check_in_date', models.DateField()),
+                ('check_out_date', models.DateField()),
+                ('booking_status', models.CharField(max_length=20)),
+                ('price_per_night', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedPayment',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('payment_method', models.CharField(choices=[('card', 'Card'), ('momo', 'Mobile Money'), ('paypal', 'PayPal')], max_length=10)),
+                ('transaction_id', models.CharField(max_length=100)),
+                ('payment_date', models.DateTimeField()),
+                ('status', models.CharField(choices=[('success', 'Success'), ('failed', 'Failed'), ('refunded', 'Refunded')], max_length=10)),
+                ('refunded_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['check_out_date'], name='booking_check_out_idx'),
+        ),
+        migrations.AddField(
+            model_name='archivedbooking',
+            name='provider',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.providerprofile'),
+        ),
+        migrations.AddField(
+            model_name='archivedbooking',
+            name='room',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.room'),
+        ),
+        migrations.AddField(
+            model_name='archivedbooking',
+            name='student',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='core.studentprofile'),
+        ),
+        migrations.AddField(
+            model_name='archivedpayment',
+            name='booking',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='payment', to='core.archivedbooking'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedbooking',
+            index=models.Index(fields=['provider', 'check_out_date'], name='archived_booking_prov_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedbooking',
+            index=models.Index(fields=['check_out_date'], name='archived_booking_checkout_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedpayment',
+            index=models.Index(fields=['payment_date'], name='archived_payment_date_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.4 on 2026-10-19 14:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0023_booking_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoomDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('nights_sold', models.IntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('cancellations', models.IntegerField(default=0)),
+                ('provider', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.providerprofile')),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='core.room')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['provider', 'date'], name='room_daily_stat_prov_idx')],
+                'constraints': [models.UniqueConstraint(fields=('room', 'date'), name='unique_room_daily_stat')],
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.4 on 2026-10-19 15:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0026_room_coordinates'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedbooking',
+            name='quoted_total',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='quoted_total',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.CreateModel(
+            name='PricingRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('hostel_name', models.CharField(blank=True, max_length=100)),
+                ('kind', models.CharField(choices=[('override', 'Nightly price override'), ('seasonal', 'Seasonal rate'), ('length_of_stay', 'Length-of-stay discount')], max_length=20)),
+                ('start_date', models.DateField(blank=True, null=True)),
+                ('end_date', models.DateField(blank=True, null=True)),
+                ('nightly_price', models.DecimalField(blank=True, decimal_places=2, max_digits=8, null=True)),
+                ('percent', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True)),
+                ('min_nights', models.PositiveIntegerField(blank=True, null=True)),
+                ('priority', models.IntegerField(default=0)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('provider', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pricing_rules', to='core.providerprofile')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['provider', 'is_active'], name='pricing_rule_provider_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:02
+
+from django.db import migrations, models
+import core.models.booking
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_pricing_rules'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='booking',
+            old_name='quoted_total',
+            new_name='total_amount',
+        ),
+        migrations.RenameField(
+            model_name='archivedbooking',
+            old_name='quoted_total',
+            new_name='total_amount',
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='currency',
+            field=models.CharField(default=core.models.booking.default_currency, max_length=3),
+        ),
+        migrations.AddField(
+            model_name='archivedbooking',
+            name='currency',
+            field=models.CharField(default='GHS', max_length=3),
+            preserve_default=False,
+        ),
+    ]
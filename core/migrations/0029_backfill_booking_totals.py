@@ -0,0 +1,49 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:02
+
+from django.db import migrations, transaction
+
+BATCH_SIZE = 1000
+
+
+def backfill_model(model, price_field, using):
+    last_id = 0
+    while True:
+        rows = list(
+            model.objects.using(using)
+            .filter(total_amount__isnull=True, id__gt=last_id)
+            .order_by('id')
+            .values_list('id', 'check_in_date', 'check_out_date', price_field)[:BATCH_SIZE]
+        )
+        if not rows:
+            return
+        with transaction.atomic(using=using):
+            model.objects.using(using).bulk_update([
+                model(id=pk, total_amount=(check_out - check_in).days * price)
+                for pk, check_in, check_out, price in rows
+            ], ['total_amount'])
+        last_id = rows[-1][0]
+
+
+def backfill(apps, schema_editor):
+    """
+    Fill total_amount for bookings made before pricing rules with what payments
+    were checked against then: nights * the room's (or the archived) nightly
+    price. Each batch commits on its own (the migration is not atomic), so the
+    bookings table is never locked for the whole backfill and an interrupted
+    run resumes where it stopped.
+    """
+    using = schema_editor.connection.alias
+    backfill_model(apps.get_model('core', 'Booking'), 'room__price_per_night', using)
+    backfill_model(apps.get_model('core', 'ArchivedBooking'), 'price_per_night', using)
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('core', '0028_booking_total_amount'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0029_backfill_booking_totals'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='total_amount',
+            field=models.DecimalField(decimal_places=2, max_digits=10),
+        ),
+        migrations.AlterField(
+            model_name='archivedbooking',
+            name='total_amount',
+            field=models.DecimalField(decimal_places=2, max_digits=10),
+        ),
+    ]
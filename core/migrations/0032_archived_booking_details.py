@@ -0,0 +1,58 @@
+# Generated by Django 5.2.4 on 2026-10-19 15:58
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef, Subquery
+
+
+def backfill(apps, schema_editor):
+    """
+    Copy the details in for rows archived before they were stored, from the
+    rooms and students that still exist. Rows whose room or student is already
+    gone keep blank values.
+    """
+    using = schema_editor.connection.alias
+    ArchivedBooking = apps.get_model('core', 'ArchivedBooking')
+    Room = apps.get_model('core', 'Room')
+    StudentProfile = apps.get_model('core', 'StudentProfile')
+
+    room = Room.objects.using(using).filter(id=OuterRef('room_id'))
+    ArchivedBooking.objects.using(using).filter(Exists(room)).update(
+        hostel_name=Subquery(room.values('hostel_name')[:1]),
+        room_number=Subquery(room.values('room_number')[:1]),
+    )
+    student = StudentProfile.objects.using(using).filter(id=OuterRef('student_id'))
+    ArchivedBooking.objects.using(using).filter(Exists(student)).update(
+        student_username=Subquery(student.values('user__username')[:1]),
+        student_email=Subquery(student.values('user__email')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0031_payment_history'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedbooking',
+            name='hostel_name',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='archivedbooking',
+            name='room_number',
+            field=models.CharField(blank=True, default='', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='archivedbooking',
+            name='student_email',
+            field=models.EmailField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='archivedbooking',
+            name='student_username',
+            field=models.CharField(blank=True, default='', max_length=150),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
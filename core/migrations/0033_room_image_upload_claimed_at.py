@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0032_archived_booking_details'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='roomimageupload',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
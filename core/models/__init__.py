@@ -4,4 +4,11 @@ from .provider_profile import ProviderProfile
 from .room import Room
 from .booking import Booking
 from .payment import Payment
-from .facility import Facility  
+from .facility import Facility
+from .room_image_upload import RoomImageUpload
+from .waitlist_entry import WaitlistEntry
+from .booking_transition import BookingTransition
+from .archived_booking import ArchivedBooking
+from .archived_payment import ArchivedPayment
+from .room_daily_stat import RoomDailyStat
+from .pricing_rule import PricingRule
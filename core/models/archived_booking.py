@@ -0,0 +1,42 @@
+from django.db import models
+from django.utils.timezone import now
+from .provider_profile import ProviderProfile
+from .room import Room
+from .student_profile import StudentProfile
+
+
+class ArchivedBooking(models.Model):
+    """
+    Booking moved out of the hot table by `archive_bookings` once its check-out
+    date is past BOOKING_ARCHIVE_AFTER_DAYS.
+
+    Keeps the original id, copies in the provider, the nightly price and the
+    room and student details at archive time so reports need no joins, and has
+    no FK constraints so rooms and students can still be deleted.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    student = models.ForeignKey(StudentProfile, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    room = models.ForeignKey(Room, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    provider = models.ForeignKey(ProviderProfile, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    check_in_date = models.DateField()
+    check_out_date = models.DateField()
+    booking_status = models.CharField(max_length=20)
+    price_per_night = models.DecimalField(max_digits=10, decimal_places=2)
+    hostel_name = models.CharField(max_length=100, blank=True, default='')
+    room_number = models.CharField(max_length=50, blank=True, default='')
+    student_username = models.CharField(max_length=150, blank=True, default='')
+    student_email = models.EmailField(max_length=255, blank=True, default='')
+    total_amount = models.DecimalField(max_digits=10, decimal_places=2)
+    currency = models.CharField(max_length=3)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['provider', 'check_out_date'], name='archived_booking_prov_idx'),
+            models.Index(fields=['check_out_date'], name='archived_booking_checkout_idx'),
+        ]
+
+    def __str__(self):
+        return f"Archived booking #{self.id}"
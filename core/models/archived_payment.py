@@ -0,0 +1,23 @@
+from django.db import models
+from .archived_booking import ArchivedBooking
+from .payment import Payment
+
+
+class ArchivedPayment(models.Model):
+    """Payment of an ArchivedBooking, moved in the same transaction as its booking."""
+    id = models.BigIntegerField(primary_key=True)
+    booking = models.ForeignKey(ArchivedBooking, on_delete=models.CASCADE, related_name='payments', related_query_name='payment')
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    payment_method = models.CharField(max_length=10, choices=Payment.PAYMENT_METHODS)
+    transaction_id = models.CharField(max_length=100)
+    payment_date = models.DateTimeField()
+    status = models.CharField(max_length=10, choices=Payment.STATUS_CHOICES)
+    refunded_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['payment_date'], name='archived_payment_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"Archived payment for booking #{self.booking_id}"
@@ -1,9 +1,34 @@
+from django.conf import settings
 from django.db import models
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 from django.utils.timezone import now
 from .room import Room
 from .student_profile import StudentProfile
 
+def default_currency():
+    return settings.BOOKING_CURRENCY
+
+
+class BookingQuerySet(models.QuerySet):
+    def occupying(self, check_in, check_out):
+        """
+        Bookings that take a place in their room during [check_in, check_out).
+
+        Paid approved/confirmed bookings, plus bookings created from the
+        waitlist that are still waiting to be paid, so a freed place is only
+        handed out once. Booking validation, room availability and waitlist
+        promotion all count capacity with this.
+        """
+        from .payment import Payment
+
+        return self.filter(
+            Q(Exists(Payment.objects.filter(booking=OuterRef('pk'), status='success')), booking_status__in=['approved', 'confirmed'])
+            | Q(waitlist_entry__isnull=False, booking_status__in=['pending', 'approved']),
+            check_in_date__lt=check_out,
+            check_out_date__gt=check_in,
+        )
+
+
 class Booking(models.Model):
     student = models.ForeignKey(StudentProfile, on_delete=models.CASCADE, related_name='bookings')
     room = models.ForeignKey(Room, on_delete=models.CASCADE, related_name='bookings')
@@ -16,12 +41,19 @@ class Booking(models.Model):
             ('approved', 'Approved'),
             ('rejected', 'Rejected'),
             ('confirmed', 'Confirmed'),
-            ('cancelled', 'Cancelled')
+            ('cancelled', 'Cancelled'),
+            ('expired', 'Expired'),  # left unpaid past the expiry policy (expire_bookings)
         ],
         default='pending'
     )
     created_at = models.DateTimeField(default=now)
     updated_at = models.DateTimeField(auto_now=True)
+    # Price of the stay when it was booked, from core/services/pricing.py; later
+    # room price or rule changes do not touch it. Payments are checked against it.
+    total_amount = models.DecimalField(max_digits=10, decimal_places=2)
+    currency = models.CharField(max_length=3, default=default_currency)
+
+    objects = BookingQuerySet.as_manager()
 
     class Meta:
         constraints = [
@@ -35,11 +67,20 @@ class Booking(models.Model):
                 name='unique_student_room_dates'
             )
         ]
+        indexes = [
+            # expire_bookings walks stale pending/approved bookings by age
+            models.Index(fields=['booking_status', 'created_at'], name='booking_status_created_idx'),
+            # archive_bookings walks finished stays by check-out date
+            models.Index(fields=['check_out_date'], name='booking_check_out_idx'),
+            # Admin date hierarchy and date range filters
+            models.Index(fields=['check_in_date'], name='booking_check_in_idx'),
+        ]
 
-    @property
-    def total_amount(self):
-        days = (self.check_out_date - self.check_in_date).days
-        return days * self.room.price_per_night
+    def save(self, *args, **kwargs):
+        if self.total_amount is None:
+            from core.services.pricing import quote_room
+            self.total_amount = quote_room(self.room, self.check_in_date, self.check_out_date)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"Booking #{self.id} by {self.student} for {self.room}"
\ No newline at end of file
@@ -0,0 +1,33 @@
+from django.db import models
+from django.utils.timezone import now
+from .booking import Booking
+from .provider_profile import ProviderProfile
+from .room import Room
+from .user import User
+
+
+class BookingTransition(models.Model):
+    """
+    Append-only log of booking status changes, written by core/services/booking_state.py.
+
+    Rows outlive their bookings (no FK constraints, nothing cascades), and room
+    and provider are copied in so reports never have to join back to Booking.
+    """
+    booking = models.ForeignKey(Booking, on_delete=models.DO_NOTHING, db_constraint=False, related_name='transitions')
+    room = models.ForeignKey(Room, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    provider = models.ForeignKey(ProviderProfile, on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    from_status = models.CharField(max_length=20, blank=True)  # blank when the booking was created
+    to_status = models.CharField(max_length=20)
+    actor = models.ForeignKey(User, on_delete=models.DO_NOTHING, db_constraint=False, null=True, blank=True, related_name='+')
+    source = models.CharField(max_length=20, blank=True)  # student, provider, admin, paystack, waitlist, system
+    created_at = models.DateTimeField(default=now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['booking', 'created_at'], name='booking_transition_hist_idx'),
+            models.Index(fields=['to_status', 'created_at'], name='booking_transition_status_idx'),
+            models.Index(fields=['provider', 'to_status', 'created_at'], name='booking_transition_prov_idx'),
+        ]
+
+    def __str__(self):
+        return f"Booking #{self.booking_id}: {self.from_status or 'new'} -> {self.to_status}"
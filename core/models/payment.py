@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from .booking import Booking
 
 class Payment(models.Model):
@@ -14,12 +15,28 @@ class Payment(models.Model):
         ('refunded', 'Refunded'),
     ]
 
-    booking = models.OneToOneField(Booking, on_delete=models.CASCADE, related_name='payment')
+    # A booking keeps every charge made for it: refunded payments are never
+    # rewritten, and paying again after a refund adds a new row. At most one
+    # payment per booking is 'success' (payment_one_success_per_booking).
+    booking = models.ForeignKey(Booking, on_delete=models.CASCADE, related_name='payments', related_query_name='payment')
     amount = models.DecimalField(max_digits=10, decimal_places=2)  # Full payment amount
     payment_method = models.CharField(max_length=10, choices=PAYMENT_METHODS)
     transaction_id = models.CharField(max_length=100)
     payment_date = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES)
+    # Refunded payments are kept (status='refunded') rather than deleted
+    refunded_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['booking'], condition=Q(status='success'), name='payment_one_success_per_booking'),
+        ]
+        indexes = [
+            # Revenue only ever sums successful payments
+            models.Index(fields=['booking', 'amount'], condition=Q(status='success'), name='payment_success_idx'),
+            # Admin status filter and date hierarchy, exports by payment date
+            models.Index(fields=['status', 'payment_date'], name='payment_status_date_idx'),
+        ]
 
     def __str__(self):
         return f"Payment for Booking #{self.booking_id}"
\ No newline at end of file
@@ -0,0 +1,59 @@
+from django.core.exceptions import ValidationError
+from django.db import models
+from .provider_profile import ProviderProfile
+
+
+class PricingRule(models.Model):
+    """
+    Adjusts a provider's room prices; evaluated by core/services/pricing.py.
+
+    override        nightly_price replaces the room's price_per_night on nights in the date range
+    seasonal        percent is added to the nightly price on nights in the date range (negative for discounts)
+    length_of_stay  percent is taken off the stay total for stays of at least min_nights nights
+
+    A rule with a hostel_name applies to that hostel only and wins over the
+    provider's hostel-wide rules; ties are broken by priority. Empty start or
+    end dates leave the range open on that side.
+    """
+    KIND_CHOICES = [
+        ('override', 'Nightly price override'),
+        ('seasonal', 'Seasonal rate'),
+        ('length_of_stay', 'Length-of-stay discount'),
+    ]
+
+    provider = models.ForeignKey(ProviderProfile, on_delete=models.CASCADE, related_name='pricing_rules')
+    hostel_name = models.CharField(max_length=100, blank=True)  # blank: all of the provider's hostels
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    start_date = models.DateField(null=True, blank=True)
+    end_date = models.DateField(null=True, blank=True)  # last night the rule covers
+    nightly_price = models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True)
+    percent = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
+    min_nights = models.PositiveIntegerField(null=True, blank=True)
+    priority = models.IntegerField(default=0)
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['provider', 'is_active'], name='pricing_rule_provider_idx'),
+        ]
+
+    def clean(self):
+        errors = {}
+        if self.start_date and self.end_date and self.end_date < self.start_date:
+            errors['end_date'] = "End date must be on or after the start date."
+        if self.kind == 'override' and (self.nightly_price is None or self.nightly_price <= 0):
+            errors['nightly_price'] = "Override rules need a nightly price above zero."
+        if self.kind == 'seasonal' and (self.percent is None or self.percent <= -100):
+            errors['percent'] = "Seasonal rules need a percent above -100."
+        if self.kind == 'length_of_stay':
+            if self.percent is None or not 0 < self.percent < 100:
+                errors['percent'] = "Length-of-stay discounts need a percent between 0 and 100."
+            if not self.min_nights:
+                errors['min_nights'] = "Length-of-stay discounts need a minimum number of nights."
+        if errors:
+            raise ValidationError(errors)
+
+    def __str__(self):
+        scope = self.hostel_name or f"all hostels of {self.provider}"
+        return f"{self.get_kind_display()} for {scope}"
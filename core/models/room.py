@@ -1,9 +1,51 @@
 # core/models/room.py
+from datetime import timedelta
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import Count, ExpressionWrapper, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from .provider_profile import ProviderProfile
 from .facility import Facility
 from cloudinary.models import CloudinaryField
 
+class RoomQuerySet(models.QuerySet):
+    def annotate_availability(self, check_in=None, check_out=None):
+        """
+        Annotate each room with date-aware capacity for [check_in, check_out)
+        (tonight if no dates are given):
+
+            booked_count  bookings holding a place on the dates (Booking.objects.occupying)
+            is_available  listed by the provider and booked_count < max_occupancy
+
+        Availability is computed when read, so bookings, payments and
+        cancellations never have to write to the room row.
+        """
+        from .booking import Booking
+
+        if check_in is None:
+            check_in = timezone.localdate()
+        if check_out is None:
+            check_out = check_in + timedelta(days=1)
+
+        booked = (
+            Booking.objects.occupying(check_in, check_out)
+            .filter(room=OuterRef('pk'))
+            .order_by()
+            .values('room')
+            .annotate(count=Count('pk'))
+            .values('count')
+        )
+        return self.annotate(
+            booked_count=Coalesce(Subquery(booked), Value(0)),
+        ).annotate(
+            is_available=ExpressionWrapper(
+                Q(is_listed=True) & Q(booked_count__lt=F('max_occupancy')),
+                output_field=models.BooleanField(),
+            ),
+        )
+
+
 class Room(models.Model):
     room_number = models.CharField(max_length=50)
     hostel_name = models.CharField(max_length=100)
@@ -12,10 +54,25 @@ class Room(models.Model):
     description = models.TextField(blank=True)
     facilities = models.ManyToManyField(Facility, related_name='rooms', blank=True)
     image = CloudinaryField('image', blank=True, null=True)  # Updated to use CloudinaryField
-    is_available = models.BooleanField(default=True)
+    image_variants = models.JSONField(default=dict, blank=True)  # Processed image URLs keyed by variant name
+    # Provider's listing switch. Whether the room has space is date-dependent,
+    # see RoomQuerySet.annotate_availability().
+    is_listed = models.BooleanField(default=True)
     location = models.CharField(max_length=255, blank=True)
+    # Coordinates for distance search, set by the provider or by the
+    # geocode_rooms command from an offline gazetteer
+    latitude = models.FloatField(null=True, blank=True, validators=[MinValueValidator(-90), MaxValueValidator(90)])
+    longitude = models.FloatField(null=True, blank=True, validators=[MinValueValidator(-180), MaxValueValidator(180)])
     provider = models.ForeignKey(ProviderProfile, on_delete=models.CASCADE, related_name='rooms')
 
+    objects = RoomQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Bounding-box prefilter of the distance search
+            models.Index(fields=['latitude', 'longitude'], name='room_lat_lng_idx'),
+        ]
+
     def __str__(self):
         return f"{self.hostel_name} - {self.room_number}"
     
\ No newline at end of file
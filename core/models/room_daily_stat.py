@@ -0,0 +1,30 @@
+from django.db import models
+from .provider_profile import ProviderProfile
+from .room import Room
+
+
+class RoomDailyStat(models.Model):
+    """
+    One room's numbers for one night, maintained by core/services/analytics.py
+    so reports sum a few hundred rollup rows instead of scanning bookings.
+
+    nights_sold and revenue belong to the night stayed (a booking's payment is
+    spread evenly over its nights); cancellations to the day they happened.
+    """
+    room = models.ForeignKey(Room, on_delete=models.CASCADE, related_name='daily_stats')
+    provider = models.ForeignKey(ProviderProfile, on_delete=models.CASCADE, related_name='+')
+    date = models.DateField()
+    nights_sold = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    cancellations = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['room', 'date'], name='unique_room_daily_stat'),
+        ]
+        indexes = [
+            models.Index(fields=['provider', 'date'], name='room_daily_stat_prov_idx'),
+        ]
+
+    def __str__(self):
+        return f"Room {self.room_id} on {self.date}"
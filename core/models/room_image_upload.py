@@ -0,0 +1,36 @@
+from django.core.files.storage import FileSystemStorage
+from django.db import models
+from .room import Room
+
+
+def staging_storage():
+    """Local disk under MEDIA_ROOT where uploads wait for the image worker."""
+    return FileSystemStorage()
+
+
+class RoomImageUpload(models.Model):
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('ready', 'Ready'),
+        ('failed', 'Failed'),
+    ]
+
+    room = models.ForeignKey(Room, on_delete=models.CASCADE, related_name='image_uploads')
+    file = models.FileField(upload_to='room_uploads/', storage=staging_storage, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # When a worker last claimed it; a 'processing' upload whose claim is older
+    # than ROOM_IMAGE_LEASE_SECONDS is taken over by the next worker
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='room_image_upload_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"Image upload #{self.id} for {self.room} ({self.status})"
@@ -0,0 +1,50 @@
+from django.db import models
+from django.db.models import Q
+from django.utils.timezone import now
+from .booking import Booking
+from .room import Room
+from .student_profile import StudentProfile
+
+
+class WaitlistEntry(models.Model):
+    STATUS_CHOICES = [
+        ('waiting', 'Waiting'),
+        ('promoted', 'Promoted'),
+        ('cancelled', 'Cancelled'),
+    ]
+
+    student = models.ForeignKey(StudentProfile, on_delete=models.CASCADE, related_name='waitlist_entries')
+    room = models.ForeignKey(Room, on_delete=models.CASCADE, related_name='waitlist_entries')
+    check_in_date = models.DateField()
+    check_out_date = models.DateField()
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='waiting')
+    # Pending booking created for the student when a place frees up
+    booking = models.OneToOneField(Booking, on_delete=models.SET_NULL, null=True, blank=True, related_name='waitlist_entry')
+    created_at = models.DateTimeField(default=now)
+    promoted_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                check=Q(check_in_date__lt=models.F('check_out_date')),
+                name='waitlist_check_in_before_check_out'
+            ),
+            models.UniqueConstraint(
+                fields=['student', 'room', 'check_in_date', 'check_out_date'],
+                condition=Q(status='waiting'),
+                name='unique_waiting_student_room_dates'
+            ),
+        ]
+        indexes = [
+            # Promotion lookup: waiting entries for a room whose dates fit a freed window, oldest first
+            models.Index(
+                fields=['room', 'check_in_date', 'check_out_date', 'created_at'],
+                condition=Q(status='waiting'),
+                name='waitlist_waiting_idx'
+            ),
+            # Admin status filter and date hierarchy
+            models.Index(fields=['status', 'created_at'], name='waitlist_status_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"Waitlist #{self.id} {self.student} for {self.room} ({self.status})"
@@ -0,0 +1,32 @@
+import csv
+import io
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class CSVParser(BaseParser):
+    """
+    Parses a text/csv body with a header row into a list of dicts,
+    one per row, so it can be validated like a JSON array. Empty cells are
+    left out, as if the column were missing from that row, so partial
+    updates only need the cells they change.
+    """
+    media_type = 'text/csv'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        try:
+            text = stream.read().decode(encoding)
+        except UnicodeDecodeError as exc:
+            raise ParseError(f"CSV parse error - {exc}")
+
+        reader = csv.DictReader(io.StringIO(text.lstrip('\ufeff')))
+        try:
+            return [
+                {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+                for row in reader
+            ]
+        except csv.Error as exc:
+            raise ParseError(f"CSV parse error - {exc}")
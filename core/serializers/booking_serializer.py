@@ -1,19 +1,19 @@
 from rest_framework import serializers
 from core.models import Booking, Room, StudentProfile
 from core.serializers.room_serializer import RoomSerializer
+from core.services.pricing import quote_room
 
 class BookingSerializer(serializers.ModelSerializer):
     room = RoomSerializer(read_only=True)
     student_info = serializers.SerializerMethodField()
     booking_status_display = serializers.SerializerMethodField()
     room_id = serializers.IntegerField(write_only=True)
-    total_amount = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
 
     class Meta:
         model = Booking
-        fields = ['id', 'student', 'room', 'check_in_date', 'check_out_date', 'total_amount',
+        fields = ['id', 'student', 'room', 'check_in_date', 'check_out_date', 'total_amount', 'currency',
                   'booking_status', 'created_at', 'student_info', 'booking_status_display', 'room_id']
-        read_only_fields = ['student', 'total_amount', 'created_at']
+        read_only_fields = ['student', 'total_amount', 'currency', 'created_at']
 
     def get_student_info(self, obj):
         user = obj.student.user
@@ -31,7 +31,8 @@ class BookingSerializer(serializers.ModelSerializer):
         check_out = data.get('check_out_date')
 
         try:
-            room = Room.objects.get(id=room_id)
+            # Annotated so the nested room in the response needs no query of its own
+            room = Room.objects.annotate_availability().get(id=room_id)
         except Room.DoesNotExist:
             raise serializers.ValidationError({"room_id": "Room does not exist. Please select a valid room."})
 
@@ -40,18 +41,10 @@ class BookingSerializer(serializers.ModelSerializer):
         if check_out <= check_in:
             raise serializers.ValidationError({"check_out_date": "Check-out date must be after check-in date. Please adjust the dates."})
 
-        if not room.is_available:
+        if not room.is_listed:
             raise serializers.ValidationError({"room_id": "This room is currently unavailable. Please choose another room."})
 
-        paid_bookings = Booking.objects.filter(
-            room=room,
-            check_in_date__lt=check_out,
-            check_out_date__gt=check_in,
-            payment__status='success',
-            booking_status__in=['approved', 'confirmed']
-        ).count()
-
-        if paid_bookings >= room.max_occupancy:
+        if Booking.objects.occupying(check_in, check_out).filter(room=room).count() >= room.max_occupancy:
             raise serializers.ValidationError({"room_id": f"Room has reached its maximum occupancy of {room.max_occupancy} for the selected dates."})
 
         student_profile = self.context['request'].user.student_profile
@@ -75,5 +68,7 @@ class BookingSerializer(serializers.ModelSerializer):
 
         validated_data['student'] = student_profile
         validated_data['room'] = room
+        # Price is fixed at booking time; payment checks use it as is
+        validated_data['total_amount'] = quote_room(room, validated_data['check_in_date'], validated_data['check_out_date'])
 
         return super().create(validated_data)
\ No newline at end of file
@@ -1,7 +1,22 @@
 from rest_framework import serializers
 from core.models import Facility
+from core.services.facility_catalogue import facilities_by_id
 
 class FacilitySerializer(serializers.ModelSerializer):
     class Meta:
         model = Facility
         fields = ['id', 'name']
+
+
+class CatalogueFacilityField(serializers.PrimaryKeyRelatedField):
+    """Facility by id, looked up in the in-process facility catalogue instead of the database."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return facilities_by_id()[int(data)]
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
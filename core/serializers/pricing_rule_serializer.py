@@ -0,0 +1,23 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework import serializers
+from core.models import PricingRule
+
+
+class PricingRuleSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PricingRule
+        fields = ['id', 'hostel_name', 'kind', 'start_date', 'end_date', 'nightly_price', 'percent',
+                  'min_nights', 'priority', 'is_active', 'created_at']
+        read_only_fields = ['created_at']
+
+    def validate(self, data):
+        # Per-kind requirements live in PricingRule.clean(), shared with the admin.
+        # Partial updates are checked together with the rule's current values.
+        values = {}
+        if self.instance is not None:
+            values = {field: getattr(self.instance, field) for field in self.Meta.fields if field not in ('id', 'created_at')}
+        try:
+            PricingRule(**{**values, **data}).clean()
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(e.message_dict)
+        return data
@@ -0,0 +1,42 @@
+from rest_framework import serializers
+from core.models import Room
+
+
+class FacilityIdsField(serializers.ListField):
+    """Facility ids as a JSON list or a ';'-separated CSV cell. Existence is checked once per batch by the view."""
+    child = serializers.IntegerField(min_value=1)
+
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            data = [value for value in data.replace(',', ';').split(';') if value.strip()]
+        return super().to_internal_value(data)
+
+
+class RoomBulkCreateSerializer(serializers.ModelSerializer):
+    facilities = FacilityIdsField(required=False)
+
+    class Meta:
+        model = Room
+        fields = ['room_number', 'hostel_name', 'price_per_night', 'max_occupancy',
+                  'description', 'location', 'facilities']
+
+    def validate_max_occupancy(self, value):
+        if value < 1:
+            raise serializers.ValidationError("Max occupancy must be at least 1.")
+        return value
+
+    def validate_price_per_night(self, value):
+        if value < 0:
+            raise serializers.ValidationError("Price per night cannot be negative.")
+        return value
+
+
+class RoomBulkUpdateSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    price_per_night = serializers.DecimalField(max_digits=8, decimal_places=2, min_value=0, required=False)
+    is_listed = serializers.BooleanField(required=False)
+
+    def validate(self, data):
+        if 'price_per_night' not in data and 'is_listed' not in data:
+            raise serializers.ValidationError("Provide price_per_night and/or is_listed to update.")
+        return data
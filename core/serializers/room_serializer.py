@@ -1,37 +1,51 @@
 from rest_framework import serializers
-from core.models import Room
+from core.models import Facility, Room
+from core.serializers.facility_serializer import CatalogueFacilityField, FacilitySerializer
+from core.services.room_images import queue_upload
 
 class RoomSerializer(serializers.ModelSerializer):
     image = serializers.SerializerMethodField()
     image_upload = serializers.ImageField(write_only=True, required=False)
+    is_available = serializers.SerializerMethodField()
+    facilities = CatalogueFacilityField(many=True, required=False, queryset=Facility.objects.all())
 
     class Meta:
         model = Room
         fields = '__all__'
-        read_only_fields = ['provider']
+        read_only_fields = ['provider', 'image_variants']
 
     def get_image(self, obj):
-        """Return the Cloudinary URL for the image"""
+        """Return the stored full-size image URL, falling back to the legacy Cloudinary image"""
+        if obj.image_variants.get('full'):
+            return obj.image_variants['full']
         if obj.image:
             return obj.image.url
         return None
 
+    def get_is_available(self, obj):
+        """
+        Listed and not fully booked for the requested dates (tonight by default).
+        Views load rooms through Room.objects.annotate_availability(); a room
+        without the annotation reports its listing switch rather than querying.
+        """
+        return getattr(obj, 'is_available', obj.is_listed)
+
     def create(self, validated_data):
         image_file = validated_data.pop('image_upload', None)
         facilities = validated_data.pop('facilities', [])  # Extract facilities
         
-        # Ensure new rooms are always available
-        validated_data['is_available'] = True
-        
         room = Room.objects.create(**validated_data)
         
+        # The photo is processed and uploaded by the image worker (process_room_images)
         if image_file:
-            room.image = image_file
-            room.save()
+            queue_upload(room, image_file)
         
         if facilities:
             room.facilities.set(facilities)  # Set facilities after creation
-        
+
+        # A new room has no bookings
+        room.booked_count = 0
+        room.is_available = room.is_listed
         return room
 
     def update(self, instance, validated_data):
@@ -40,8 +54,42 @@ class RoomSerializer(serializers.ModelSerializer):
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         
-        if image_file:
-            instance.image = image_file
-        
         instance.save()
-        return instance
\ No newline at end of file
+
+        if image_file:
+            queue_upload(instance, image_file)
+
+        return instance
+
+
+class RoomListSerializer(RoomSerializer):
+    """
+    Room listings: sends the card-sized image and a thumbnail instead of the
+    full-size photo. Both come from the precomputed variant URLs. Facilities
+    are listed with their names, from the view's prefetch_related('facilities').
+    """
+    image = serializers.SerializerMethodField()
+    facilities = FacilitySerializer(many=True, read_only=True)
+    thumbnail = serializers.SerializerMethodField()
+    distance_km = serializers.SerializerMethodField()
+    quoted_total = serializers.SerializerMethodField()
+
+    class Meta(RoomSerializer.Meta):
+        fields = None
+        exclude = ['image_variants']
+
+    def get_image(self, obj):
+        return obj.image_variants.get('card') or super().get_image(obj)
+
+    def get_thumbnail(self, obj):
+        return obj.image_variants.get('thumbnail') or self.get_image(obj)
+
+    def get_distance_km(self, obj):
+        """Distance from the searched point, for distance searches (lat/lng); otherwise null"""
+        distance = getattr(obj, 'distance_km', None)
+        return round(distance, 3) if distance is not None else None
+
+    def get_quoted_total(self, obj):
+        """Price of the searched stay (check_in/check_out) with pricing rules applied; otherwise null"""
+        quote = self.context.get('quotes', {}).get(obj.id)
+        return str(quote) if quote is not None else None
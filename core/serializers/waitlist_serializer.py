@@ -0,0 +1,54 @@
+from rest_framework import serializers
+from core.models import Booking, Room, WaitlistEntry
+
+
+class WaitlistEntrySerializer(serializers.ModelSerializer):
+    room_id = serializers.IntegerField()
+    hostel_name = serializers.CharField(source='room.hostel_name', read_only=True)
+    room_number = serializers.CharField(source='room.room_number', read_only=True)
+    booking_id = serializers.IntegerField(read_only=True)
+    position = serializers.SerializerMethodField()
+
+    class Meta:
+        model = WaitlistEntry
+        fields = ['id', 'room_id', 'hostel_name', 'room_number', 'check_in_date', 'check_out_date',
+                  'status', 'position', 'booking_id', 'created_at', 'promoted_at']
+        read_only_fields = ['status', 'created_at', 'promoted_at']
+
+    def get_position(self, obj):
+        """
+        1-based place in the queue for overlapping dates, or None once promoted/cancelled.
+        Waiting entries must be loaded through with_queue_position().
+        """
+        if obj.status != 'waiting':
+            return None
+        return obj.queue_position
+
+    def validate(self, data):
+        check_in = data.get('check_in_date')
+        check_out = data.get('check_out_date')
+
+        try:
+            room = Room.objects.get(id=data.get('room_id'))
+        except Room.DoesNotExist:
+            raise serializers.ValidationError({"room_id": "Room does not exist. Please select a valid room."})
+
+        if check_out <= check_in:
+            raise serializers.ValidationError({"check_out_date": "Check-out date must be after check-in date. Please adjust the dates."})
+
+        if Booking.objects.occupying(check_in, check_out).filter(room=room).count() < room.max_occupancy:
+            raise serializers.ValidationError({"room_id": "Room has space for the selected dates. Please book it directly."})
+
+        student_profile = self.context['request'].user.student_profile
+        if WaitlistEntry.objects.filter(
+            student=student_profile, room=room, check_in_date=check_in, check_out_date=check_out, status='waiting'
+        ).exists():
+            raise serializers.ValidationError({"non_field_errors": "You are already on the waitlist for this room and dates."})
+
+        data['room'] = room
+        return data
+
+    def create(self, validated_data):
+        validated_data.pop('room_id')
+        validated_data['student'] = self.context['request'].user.student_profile
+        return super().create(validated_data)
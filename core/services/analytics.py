@@ -0,0 +1,205 @@
+"""
+Occupancy and revenue rollups.
+
+RoomDailyStat rows are kept current from booking transitions (record_transitions,
+called by core/services/booking_state.py) and rebuilt for a date range by the
+nightly `rebuild_room_stats` command (rebuild), which corrects any drift. Both
+paths spread a stay's payment over its nights with nightly_revenue, so they
+agree to the cent.
+
+record_transitions is set-based: the changes of a whole batch of transitions
+are summed per (room, night) first and then applied with one payments query,
+one INSERT for missing rows and one CASE UPDATE per ROLLUP_BATCH_SIZE rows,
+however many bookings the batch holds.
+"""
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import ROUND_DOWN, Decimal
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, DecimalField, F, IntegerField, OuterRef, Subquery, Value, When
+from django.utils import timezone
+from core.models import ArchivedBooking, ArchivedPayment, Booking, BookingTransition, Payment, RoomDailyStat
+
+logger = logging.getLogger(__name__)
+
+# A stay's payment counts towards revenue while the stay is confirmed; refunded
+# payments are still subtracted when the booking is cancelled. A booking paid
+# again after a refund counts its latest payment.
+REVENUE_PAYMENT_STATUSES = ['success', 'refunded']
+
+
+def stay_payment(payments):
+    """The latest revenue payment among payments, as a one-row values('amount') queryset (usable as a Subquery)."""
+    return payments.filter(status__in=REVENUE_PAYMENT_STATUSES).order_by('-id').values('amount')[:1]
+
+PERIODS = ['week', 'month', 'semester']
+
+# Rollup rows changed per UPDATE statement
+ROLLUP_BATCH_SIZE = 500
+
+
+def nightly_revenue(amount, nights):
+    """Split amount over nights: (per night, first night), the first night taking the rounding remainder."""
+    amount = Decimal(amount or 0)
+    per_night = (amount / nights).quantize(Decimal('0.01'), rounding=ROUND_DOWN)
+    return per_night, amount - per_night * (nights - 1)
+
+
+def stay_nights(check_in, check_out):
+    return [check_in + timedelta(days=i) for i in range((check_out - check_in).days)]
+
+
+def add_stay(deltas, room_id, check_in, check_out, amount, sign=1):
+    """Add (sign=1) or remove (sign=-1) one confirmed stay to deltas, {(room_id, night): [nights, revenue, cancellations]}."""
+    nights = stay_nights(check_in, check_out)
+    per_night, first_night = nightly_revenue(amount, len(nights))
+    for night in nights:
+        row = deltas[room_id, night]
+        row[0] += sign
+        row[1] += sign * (first_night if night == check_in else per_night)
+
+
+def apply_deltas(deltas, providers):
+    """Add deltas to the RoomDailyStat rows, creating missing rows, with atomic increments."""
+    deltas = {key: delta for key, delta in deltas.items() if any(delta)}
+    if not deltas:
+        return
+    RoomDailyStat.objects.bulk_create(
+        [RoomDailyStat(room_id=room_id, provider_id=providers[room_id], date=day) for room_id, day in deltas],
+        ignore_conflicts=True, batch_size=ROLLUP_BATCH_SIZE,
+    )
+    rows = RoomDailyStat.objects.filter(
+        room_id__in={room_id for room_id, _ in deltas}, date__in={day for _, day in deltas},
+    ).values_list('id', 'room_id', 'date')
+    ids = {(room_id, day): pk for pk, room_id, day in rows if (room_id, day) in deltas}
+    keys = list(deltas)
+    for start in range(0, len(keys), ROLLUP_BATCH_SIZE):
+        batch = keys[start:start + ROLLUP_BATCH_SIZE]
+
+        def increment(field, index, output_field):
+            return F(field) + Case(
+                *(When(id=ids[key], then=Value(deltas[key][index])) for key in batch),
+                default=Value(0), output_field=output_field,
+            )
+
+        RoomDailyStat.objects.filter(id__in=[ids[key] for key in batch]).update(
+            nights_sold=increment('nights_sold', 0, IntegerField()),
+            revenue=increment('revenue', 1, DecimalField(max_digits=12, decimal_places=2)),
+            cancellations=increment('cancellations', 2, IntegerField()),
+        )
+
+
+def record_transitions(transitions):
+    """
+    Update the rollups for many booking status changes, each given as
+    (booking_id, room_id, provider_id, check_in, check_out, from_status, to_status).
+    No queries unless confirmed/cancelled is involved.
+    """
+    transitions = [
+        t for t in transitions
+        if 'confirmed' in (t[5], t[6]) or t[6] == 'cancelled'
+    ]
+    if not transitions:
+        return
+    stays = [t[0] for t in transitions if 'confirmed' in (t[5], t[6])]
+    amounts = {}
+    if stays:
+        payments = (
+            Payment.objects.filter(booking_id__in=stays, status__in=REVENUE_PAYMENT_STATUSES)
+            .order_by('booking_id', 'id').values_list('booking_id', 'amount')
+        )
+        # Ordered by id, so each booking ends up with its latest payment
+        amounts = dict(payments)
+
+    deltas = defaultdict(lambda: [0, Decimal('0'), 0])
+    providers = {}
+    today = timezone.localdate()
+    for booking_id, room_id, provider_id, check_in, check_out, from_status, to_status in transitions:
+        providers[room_id] = provider_id
+        if 'confirmed' in (from_status, to_status):
+            add_stay(deltas, room_id, check_in, check_out, amounts.get(booking_id), 1 if to_status == 'confirmed' else -1)
+        if to_status == 'cancelled':
+            deltas[room_id, today][2] += 1
+    apply_deltas(deltas, providers)
+
+
+def record_transition(booking_id, room_id, provider_id, check_in, check_out, from_status, to_status):
+    """Update the rollups for one booking status change."""
+    record_transitions([(booking_id, room_id, provider_id, check_in, check_out, from_status, to_status)])
+
+
+def rebuild(start_date, end_date, batch_size=2000):
+    """Recompute every RoomDailyStat row for start_date..end_date (inclusive) from bookings, payments and the transition log."""
+    end = end_date + timedelta(days=1)
+    stats = defaultdict(lambda: [0, Decimal('0'), 0])
+    providers = {}
+
+    sources = (
+        (Booking.objects.all(), Payment, 'room__provider_id'),
+        (ArchivedBooking.objects.all(), ArchivedPayment, 'provider_id'),
+    )
+    for bookings, payment_model, provider_field in sources:
+        stays = bookings.filter(
+            booking_status='confirmed', check_in_date__lt=end, check_out_date__gt=start_date,
+        ).annotate(
+            paid=Subquery(stay_payment(payment_model.objects.filter(booking=OuterRef('pk'))))
+        ).values_list('room_id', provider_field, 'check_in_date', 'check_out_date', 'paid')
+        for room_id, provider_id, check_in, check_out, amount in stays.iterator(chunk_size=batch_size):
+            providers[room_id] = provider_id
+            nights = stay_nights(check_in, check_out)
+            per_night, first_night = nightly_revenue(amount, len(nights))
+            for night in nights:
+                if start_date <= night < end:
+                    row = stats[room_id, night]
+                    row[0] += 1
+                    row[1] += first_night if night == check_in else per_night
+
+    cancellations = BookingTransition.objects.filter(
+        to_status='cancelled', created_at__date__gte=start_date, created_at__date__lt=end,
+    ).values_list('room_id', 'provider_id', 'created_at')
+    for room_id, provider_id, created_at in cancellations.iterator(chunk_size=batch_size):
+        providers[room_id] = provider_id
+        stats[room_id, timezone.localtime(created_at).date()][2] += 1
+
+    with transaction.atomic():
+        deleted, _ = RoomDailyStat.objects.filter(date__gte=start_date, date__lt=end).delete()
+        RoomDailyStat.objects.bulk_create(
+            [
+                RoomDailyStat(room_id=room_id, provider_id=providers[room_id], date=day,
+                              nights_sold=nights_sold, revenue=revenue, cancellations=cancelled)
+                for (room_id, day), (nights_sold, revenue, cancelled) in stats.items()
+            ],
+            batch_size=batch_size,
+        )
+    logger.info(f"Rebuilt room stats {start_date} to {end_date}: {len(stats)} rows ({deleted} replaced)")
+    return len(stats)
+
+
+def semester_start(day):
+    months = sorted(settings.ANALYTICS_SEMESTER_START_MONTHS)
+    earlier = [month for month in months if month <= day.month]
+    if earlier:
+        return date(day.year, earlier[-1], 1)
+    return date(day.year - 1, months[-1], 1)
+
+
+def period_start(day, period):
+    if period == 'week':
+        return day - timedelta(days=day.weekday())
+    if period == 'month':
+        return day.replace(day=1)
+    return semester_start(day)
+
+
+def next_period_start(start, period):
+    if period == 'week':
+        return start + timedelta(days=7)
+    if period == 'month':
+        return (start + timedelta(days=32)).replace(day=1)
+    # The next semester starts in the month after this one's last month
+    day = start
+    while semester_start(day) == start:
+        day = (day + timedelta(days=32)).replace(day=1)
+    return semester_start(day)
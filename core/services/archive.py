@@ -0,0 +1,91 @@
+"""
+Booking archival.
+
+Bookings whose check-out date is older than BOOKING_ARCHIVE_AFTER_DAYS move,
+with their payments, into ArchivedBooking/ArchivedPayment so the hot tables only
+hold current academic years. Reports read the archive only when the requested
+range reaches back that far (see archive_needed).
+"""
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from core.models import ArchivedBooking, ArchivedPayment, Booking, Payment
+
+logger = logging.getLogger(__name__)
+
+PAYMENT_FIELDS = ['id', 'booking_id', 'amount', 'payment_method', 'transaction_id', 'payment_date', 'status', 'refunded_at']
+
+
+def archive_cutoff():
+    """Bookings that checked out before this date belong in the archive."""
+    return timezone.localdate() - timedelta(days=settings.BOOKING_ARCHIVE_AFTER_DAYS)
+
+
+def archivable(before):
+    return Booking.objects.filter(check_out_date__lt=before)
+
+
+def archive_batch(before, batch_size):
+    """
+    Move up to batch_size bookings that checked out before `before` (oldest
+    first) and their payments into the archive, in one transaction. Rows locked
+    by another transaction are left for the next batch. Returns
+    (bookings moved, payments moved).
+    """
+    with transaction.atomic():
+        bookings = list(
+            archivable(before).select_for_update(skip_locked=True, of=('self',))
+            .order_by('check_out_date', 'id')
+            .values(
+                'id', 'student_id', 'room_id', 'room__provider_id', 'check_in_date', 'check_out_date',
+                'booking_status', 'room__price_per_night', 'room__hostel_name', 'room__room_number',
+                'student__user__username', 'student__user__email', 'total_amount', 'currency', 'created_at', 'updated_at',
+            )[:batch_size]
+        )
+        if not bookings:
+            return 0, 0
+        booking_ids = [booking['id'] for booking in bookings]
+        archived_at = timezone.now()
+
+        ArchivedBooking.objects.bulk_create([
+            ArchivedBooking(
+                id=booking['id'],
+                student_id=booking['student_id'],
+                room_id=booking['room_id'],
+                provider_id=booking['room__provider_id'],
+                check_in_date=booking['check_in_date'],
+                check_out_date=booking['check_out_date'],
+                booking_status=booking['booking_status'],
+                price_per_night=booking['room__price_per_night'],
+                hostel_name=booking['room__hostel_name'],
+                room_number=booking['room__room_number'],
+                student_username=booking['student__user__username'],
+                student_email=booking['student__user__email'],
+                total_amount=booking['total_amount'],
+                currency=booking['currency'],
+                created_at=booking['created_at'],
+                updated_at=booking['updated_at'],
+                archived_at=archived_at,
+            )
+            for booking in bookings
+        ])
+        payments = Payment.objects.filter(booking_id__in=booking_ids)
+        archived_payments = ArchivedPayment.objects.bulk_create([
+            ArchivedPayment(**payment) for payment in payments.values(*PAYMENT_FIELDS)
+        ])
+
+        payments.delete()
+        Booking.objects.filter(id__in=booking_ids).delete()
+
+    logger.info(f"Archived {len(bookings)} bookings and {len(archived_payments)} payments (check-out before {before})")
+    return len(bookings), len(archived_payments)
+
+
+def archive_needed(provider, start_date):
+    """
+    Whether a report over the provider's bookings checking out after start_date
+    (None = all time) must read the archive.
+    """
+    return start_date is None or ArchivedBooking.objects.filter(provider=provider, check_out_date__gt=start_date).exists()
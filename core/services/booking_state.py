@@ -0,0 +1,136 @@
+"""
+Booking state machine.
+
+Every booking status change goes through this module, which checks it against
+TRANSITIONS and appends a BookingTransition row in the same transaction, and
+updates the occupancy/revenue rollups (core/services/analytics.py).
+"""
+import logging
+from django.db import transaction
+from django.utils import timezone
+from core.models import Booking, BookingTransition
+from core.services.analytics import record_transition, record_transitions
+
+logger = logging.getLogger(__name__)
+
+# Allowed moves; bookings are created as 'pending'
+TRANSITIONS = {
+    'pending': {'approved', 'rejected', 'confirmed', 'cancelled', 'expired'},
+    'approved': {'confirmed', 'cancelled', 'expired'},
+    'confirmed': {'cancelled'},
+    'rejected': set(),
+    'cancelled': set(),
+    'expired': set(),
+}
+
+# Statuses that hold (or may still take) a place in the room
+ACTIVE_STATUSES = ['pending', 'approved', 'confirmed']
+
+
+class InvalidTransition(Exception):
+    pass
+
+
+def can_transition(from_status, to_status):
+    return to_status in TRANSITIONS.get(from_status, ())
+
+
+def check_transition(from_status, to_status):
+    if not can_transition(from_status, to_status):
+        if from_status != 'pending' and to_status in ('approved', 'rejected'):
+            raise InvalidTransition(f"Cannot change to {to_status} from {from_status}. Booking must be pending.")
+        raise InvalidTransition(f"Cannot change to {to_status} from {from_status}.")
+
+
+def record_created(bookings, actor=None, source=''):
+    """Log the creation of new bookings (one INSERT for all of them)."""
+    created_at = timezone.now()
+    BookingTransition.objects.bulk_create([
+        BookingTransition(
+            booking_id=booking.id,
+            room_id=booking.room_id,
+            provider_id=booking.room.provider_id,
+            from_status='',
+            to_status=booking.booking_status,
+            actor=actor,
+            source=source,
+            created_at=created_at,
+        )
+        for booking in bookings
+    ])
+
+
+def transition(booking, to_status, actor=None, source=''):
+    """
+    Move one booking to to_status and log it. Raises InvalidTransition.
+
+    The row is locked and its status read again first, so the move is checked
+    against a change made since `booking` was loaded (the webhook confirming
+    it, say) instead of overwriting it.
+    """
+    with transaction.atomic():
+        from_status = Booking.objects.select_for_update().values_list('booking_status', flat=True).get(pk=booking.pk)
+        booking.booking_status = from_status
+        check_transition(from_status, to_status)
+        booking.booking_status = to_status
+        booking.save(update_fields=['booking_status', 'updated_at'])
+        BookingTransition.objects.create(
+            booking_id=booking.id,
+            room_id=booking.room_id,
+            provider_id=booking.room.provider_id,
+            from_status=from_status,
+            to_status=to_status,
+            actor=actor,
+            source=source,
+        )
+        record_transition(
+            booking.id, booking.room_id, booking.room.provider_id,
+            booking.check_in_date, booking.check_out_date, from_status, to_status,
+        )
+    logger.info(f"Booking {booking.id}: {from_status} -> {to_status} ({source})")
+    return booking
+
+
+def transition_many(booking_ids, from_status, to_status, actor=None, source=''):
+    """
+    Move every booking in booking_ids that is still in from_status (a status,
+    or a list of them) to to_status.
+
+    Locks the rows, changes them with one UPDATE and logs them with one INSERT,
+    all in the caller's transaction. Returns the changed bookings as
+    (id, room_id, check_in_date, check_out_date) tuples.
+    """
+    from_statuses = [from_status] if isinstance(from_status, str) else list(from_status)
+    for status in from_statuses:
+        check_transition(status, to_status)
+    with transaction.atomic():
+        rows = list(
+            Booking.objects.select_for_update()
+            .filter(id__in=booking_ids, booking_status__in=from_statuses)
+            .values_list('id', 'room_id', 'room__provider_id', 'booking_status', 'check_in_date', 'check_out_date')
+        )
+        if not rows:
+            return []
+        now = timezone.now()
+        Booking.objects.filter(id__in=[row[0] for row in rows], booking_status__in=from_statuses).update(
+            booking_status=to_status, updated_at=now
+        )
+        BookingTransition.objects.bulk_create([
+            BookingTransition(
+                booking_id=booking_id,
+                room_id=room_id,
+                provider_id=provider_id,
+                from_status=status,
+                to_status=to_status,
+                actor=actor,
+                source=source,
+                created_at=now,
+            )
+            for booking_id, room_id, provider_id, status, _, _ in rows
+        ])
+        record_transitions([
+            (booking_id, room_id, provider_id, check_in, check_out, status, to_status)
+            for booking_id, room_id, provider_id, status, check_in, check_out in rows
+        ])
+    logger.info(f"{len(rows)} bookings: {'/'.join(from_statuses)} -> {to_status} ({source})")
+    return [(booking_id, room_id, check_in, check_out) for booking_id, room_id, _, _, check_in, check_out in rows]
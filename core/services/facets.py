@@ -0,0 +1,93 @@
+"""
+Facet counts for the room catalogue (GET /api/rooms/?facets=true).
+
+Each facet family is one grouped aggregate over the filtered rooms: facility
+counts are one GROUP BY over the facility table, and price buckets are one
+aggregate with a filtered COUNT per bucket. Results are cached under the
+normalized filter parameters plus a catalogue version. The version is bumped
+whenever rooms or facilities change (see core/signals.py), so stale counts
+are never served after an edit. Changes in availability caused by bookings
+age out after ROOM_FACET_CACHE_SECONDS.
+"""
+import hashlib
+import json
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+from core.models import Facility
+
+VERSION_KEY = 'room-facets:version'
+
+# Filters matched case-insensitively, so "KNUST" and "knust" share a cache entry
+CASE_INSENSITIVE_PARAMS = {'search', 'location', 'hostel_name'}
+
+
+def price_buckets():
+    """[(min, max), ...] from ROOM_FACET_PRICE_BUCKETS; the last bucket has no upper bound."""
+    edges = sorted(settings.ROOM_FACET_PRICE_BUCKETS)
+    return list(zip([0] + edges, edges + [None]))
+
+
+def facility_counts(rooms):
+    """Every facility with the number of matching rooms that have it (one grouped query)."""
+    matching = rooms.order_by().values('pk')
+    return list(
+        Facility.objects.annotate(count=Count('rooms', filter=Q(rooms__in=matching)))
+        .order_by('name')
+        .values('id', 'name', 'count')
+    )
+
+
+def price_bucket_counts(rooms):
+    """Matching rooms per price bucket, [min, max), in one aggregate query."""
+    buckets = price_buckets()
+    counts = rooms.order_by().aggregate(**{
+        f'bucket_{i}': Count('pk', filter=Q(price_per_night__gte=low) & (Q(price_per_night__lt=high) if high is not None else Q()))
+        for i, (low, high) in enumerate(buckets)
+    })
+    return [{'min': low, 'max': high, 'count': counts[f'bucket_{i}']} for i, (low, high) in enumerate(buckets)]
+
+
+def facets_version():
+    return cache.get_or_set(VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_facets():
+    """Start a new catalogue version; entries cached under the old one are no longer read."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), None)
+
+
+def filter_key(query_params, names):
+    """
+    Cache key for the filter parameters in names: empty values dropped,
+    repeated values sorted, case-insensitive filters lower-cased. Without
+    check_in, availability is for tonight, so the date is part of the key.
+    """
+    params = {}
+    for name in sorted(set(query_params) & set(names)):
+        values = sorted(
+            value.strip().casefold() if name in CASE_INSENSITIVE_PARAMS else value.strip()
+            for value in query_params.getlist(name)
+        )
+        values = [value for value in values if value]
+        if values:
+            params[name] = values
+    if 'check_in' not in params:
+        params['tonight'] = [timezone.localdate().isoformat()]
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    return f'room-facets:{facets_version()}:{digest}'
+
+
+def get_facets(rooms, query_params, names):
+    """Facility and price bucket counts for the filtered rooms, cached by the normalized filter."""
+    key = filter_key(query_params, names)
+    facets = cache.get(key)
+    if facets is None:
+        facets = {'facilities': facility_counts(rooms), 'price': price_bucket_counts(rooms)}
+        cache.set(key, facets, settings.ROOM_FACET_CACHE_SECONDS)
+    return facets
@@ -0,0 +1,67 @@
+"""
+Process-local copy of the Facility table.
+
+Facilities are a handful of rows that change a few times a year, but they are
+read by every facility list request and every room create/update. Each worker
+keeps the whole table in memory, tagged with the catalogue version held in the
+shared Django cache. A Facility save or delete bumps the version (see
+core/signals.py), and every worker reloads on its next read, so all workers
+converge after one read each. The version check is one cache lookup. The
+table is reloaded from the primary, so a lagging replica cannot leave a
+worker with a stale copy under the new version.
+
+A snapshot is also reloaded once it is FACILITY_CATALOGUE_MAX_AGE seconds old,
+whatever the version says. With a per-process cache (the LocMemCache default)
+other workers never see a bump, and this bounds how long they serve a stale
+list and reject new facility ids.
+"""
+import threading
+import time
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router
+from core.models import Facility
+
+VERSION_KEY = 'facility-catalogue:version'
+
+_lock = threading.Lock()
+# (version, facilities ordered by id, {id: facility}, monotonic load time), replaced as a whole on reload
+_snapshot = (None, (), {}, 0.0)
+
+
+def catalogue_version():
+    return cache.get_or_set(VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_catalogue():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), None)
+
+
+def _is_current(snapshot, version):
+    return snapshot[0] == version and time.monotonic() - snapshot[3] < settings.FACILITY_CATALOGUE_MAX_AGE
+
+
+def _current():
+    global _snapshot
+    version = catalogue_version()
+    snapshot = _snapshot
+    if not _is_current(snapshot, version):
+        with _lock:
+            snapshot = _snapshot
+            if not _is_current(snapshot, version):
+                facilities = tuple(Facility.objects.using(router.db_for_write(Facility)).order_by('id'))
+                snapshot = _snapshot = (version, facilities, {f.id: f for f in facilities}, time.monotonic())
+    return snapshot
+
+
+def get_facilities():
+    """Every facility, ordered by id."""
+    return _current()[1]
+
+
+def facilities_by_id():
+    """{id: Facility} for every facility."""
+    return _current()[2]
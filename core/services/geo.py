@@ -0,0 +1,123 @@
+"""
+Distance search over Room.latitude/longitude without PostGIS.
+
+within_radius first narrows the rooms to a bounding box around the point,
+which the (latitude, longitude) index answers with a range scan. It then
+computes the exact great-circle (haversine) distance in SQL for the rooms
+left inside the box, so the trigonometry runs on a few candidates instead
+of the whole table.
+"""
+import csv
+import math
+import re
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distance in km between two points given in degrees."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(lat, lng, radius_km):
+    """
+    Smallest latitude/longitude box holding every point within radius_km:
+    (min_lat, max_lat, [(min_lng, max_lng), ...]). Boxes crossing the
+    antimeridian are split in two, and boxes reaching a pole span every
+    longitude.
+    """
+    delta_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = lat - delta_lat, lat + delta_lat
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90), min(max_lat, 90), [(-180, 180)]
+
+    delta_lng = math.degrees(math.asin(math.sin(radius_km / EARTH_RADIUS_KM) / math.cos(math.radians(lat))))
+    min_lng, max_lng = lng - delta_lng, lng + delta_lng
+    if min_lng < -180:
+        return min_lat, max_lat, [(min_lng + 360, 180), (-180, max_lng)]
+    if max_lng > 180:
+        return min_lat, max_lat, [(min_lng, 180), (-180, max_lng - 360)]
+    return min_lat, max_lat, [(min_lng, max_lng)]
+
+
+def in_box(min_lat, max_lat, lng_ranges):
+    lng_q = Q()
+    for min_lng, max_lng in lng_ranges:
+        lng_q |= Q(longitude__gte=min_lng, longitude__lte=max_lng)
+    return Q(latitude__gte=min_lat, latitude__lte=max_lat) & lng_q
+
+
+def distance_km(lat, lng):
+    """Haversine distance in km from (lat, lng) to each row's coordinates, as a query expression."""
+    def half_sin_squared(delta):
+        return Power(Sin(delta / Value(2.0)), 2)
+
+    phi = Value(math.radians(lat), output_field=FloatField())
+    a = half_sin_squared(Radians(F('latitude')) - phi) + (
+        Value(math.cos(math.radians(lat)), output_field=FloatField())
+        * Cos(Radians(F('latitude')))
+        * half_sin_squared(Radians(F('longitude')) - Value(math.radians(lng), output_field=FloatField()))
+    )
+    return Value(2 * EARTH_RADIUS_KM, output_field=FloatField()) * ASin(Sqrt(a))
+
+
+def within_radius(queryset, lat, lng, radius_km):
+    """Rooms within radius_km of (lat, lng), annotated with distance_km and nearest first."""
+    return (
+        queryset.filter(in_box(*bounding_box(lat, lng, radius_km)))
+        .annotate(distance_km=distance_km(lat, lng))
+        .filter(distance_km__lte=radius_km)
+        .order_by('distance_km', 'id')
+    )
+
+
+def normalize_place(name):
+    """Case-, punctuation- and whitespace-insensitive key for gazetteer lookups, keeping comma-separated parts."""
+    parts = (' '.join(re.sub(r'[^\w\s]', ' ', part.casefold()).split()) for part in name.split(','))
+    return ', '.join(part for part in parts if part)
+
+
+def load_gazetteer(file):
+    """
+    Read a CSV gazetteer with name, latitude and longitude columns into
+    {normalized name: (lat, lng)}. Rows with missing or out-of-range
+    coordinates raise ValueError with the line number.
+    """
+    places = {}
+    reader = csv.DictReader(file)
+    fields = {(name or '').strip().lower(): name for name in reader.fieldnames or []}
+    columns = [fields.get(column) for column in ('name', 'latitude', 'longitude')]
+    if None in columns:
+        raise ValueError("The gazetteer needs name, latitude and longitude columns.")
+    name_column, lat_column, lng_column = columns
+    for row in reader:
+        try:
+            lat, lng = float(row[lat_column]), float(row[lng_column])
+        except (TypeError, ValueError):
+            raise ValueError(f"Line {reader.line_num}: latitude and longitude must be numbers.")
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+            raise ValueError(f"Line {reader.line_num}: coordinates out of range.")
+        places[normalize_place(row[name_column] or '')] = (lat, lng)
+    places.pop('', None)
+    return places
+
+
+def geocode(location, places):
+    """
+    Coordinates for a free-text location: the whole normalized string, then
+    with leading comma-separated parts dropped ("Block C, Ayeduase, Kumasi"
+    falls back to "Ayeduase, Kumasi" and then "Kumasi"). None if nothing matches.
+    """
+    parts = normalize_place(location).split(', ')
+    for i in range(len(parts)):
+        key = ', '.join(parts[i:])
+        if key in places:
+            return places[key]
+    return None
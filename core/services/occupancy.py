@@ -0,0 +1,46 @@
+"""
+Per-night room occupancy over a date window.
+
+Works from one list of stays instead of a query per day: every stay adds +1 on
+its first night and -1 the morning it checks out (a difference array), and a
+running sum over each room's array gives the occupancy of every night in
+O(stays + rooms * days).
+"""
+from datetime import timedelta
+
+
+def occupancy_by_night(stays, start_date, days):
+    """
+    stays: iterable of (room_id, check_in_date, check_out_date).
+    Returns {room_id: [guests on night start_date + i for i in range(days)]}
+    for every room that has at least one stay in the window.
+    """
+    diffs = {}
+    for room_id, check_in, check_out in stays:
+        first = max((check_in - start_date).days, 0)
+        last = min((check_out - start_date).days, days)  # exclusive: no one sleeps on check-out night
+        if first >= last:
+            continue
+        diff = diffs.get(room_id)
+        if diff is None:
+            diff = diffs[room_id] = [0] * (days + 1)
+        diff[first] += 1
+        diff[last] -= 1
+
+    occupancy = {}
+    for room_id, diff in diffs.items():
+        running = 0
+        nights = []
+        for change in diff[:days]:
+            running += change
+            nights.append(running)
+        occupancy[room_id] = nights
+    return occupancy
+
+
+def window_stays(bookings, start_date, days):
+    """Filter a Booking queryset to stays overlapping [start_date, start_date + days) as value tuples."""
+    return bookings.filter(
+        check_in_date__lt=start_date + timedelta(days=days),
+        check_out_date__gt=start_date,
+    ).values_list('room_id', 'check_in_date', 'check_out_date')
@@ -0,0 +1,107 @@
+"""
+Payment amounts and refunds.
+
+Amounts are compared in integer minor units (pesewas, kobo, cents), the unit
+Paystack sends and expects, so a booking total and a charge either match
+exactly or not at all; there is no float tolerance to tune.
+
+Payments are never deleted or rewritten: a refund marks the row 'refunded'
+and stamps refunded_at, and paying again adds a new row, so every charge and
+refund stays in the history. Revenue queries sum status='success' only
+(partial index payment_success_idx).
+"""
+import logging
+from decimal import Decimal, InvalidOperation
+from django.utils import timezone
+from core.models import Booking, Payment, StudentProfile
+
+logger = logging.getLogger(__name__)
+
+# Minor units per major unit; 100 for every currency Paystack settles in
+MINOR_UNITS = 100
+
+
+def to_minor_units(amount):
+    """
+    Exact integer minor units of a major-unit amount (Decimal, int or numeric
+    string; floats go through their shortest repr). Raises ValueError for
+    non-numbers and for amounts with fractions of a minor unit.
+    """
+    if isinstance(amount, bool):
+        raise ValueError(f"Invalid amount: {amount!r}")
+    try:
+        value = Decimal(str(amount).strip()) * MINOR_UNITS
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {amount!r}")
+    if not value.is_finite() or value != value.to_integral_value():
+        raise ValueError(f"Invalid amount: {amount!r}")
+    return int(value)
+
+
+def from_minor_units(minor):
+    """Major-unit Decimal for an integer amount in minor units."""
+    return Decimal(minor) / MINOR_UNITS
+
+
+def room_is_full(booking):
+    """Whether the other bookings holding a place (Booking.objects.occupying) leave no room for this one."""
+    taken = Booking.objects.occupying(booking.check_in_date, booking.check_out_date).filter(
+        room_id=booking.room_id
+    ).exclude(id=booking.id).count()
+    return taken >= booking.room.max_occupancy
+
+
+class PaymentRequestError(Exception):
+    """A payment initialisation request that is refused, with the HTTP status to answer with."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def check_payment_request(user, booking_id, email, amount):
+    """
+    Validate a request to start paying for a booking; shared by the sync and
+    async payment initialisation views. Returns (booking, amount in minor
+    units) or raises PaymentRequestError.
+    """
+    if not all([booking_id, email, amount]):
+        raise PaymentRequestError("Missing required fields: booking_id, email, and amount are all required.")
+
+    try:
+        booking = Booking.objects.select_related('room').get(id=booking_id)
+    except Booking.DoesNotExist:
+        raise PaymentRequestError("Booking not found. Please provide a valid booking ID.", 404)
+
+    try:
+        student_profile = StudentProfile.objects.select_related('user').get(user=user)
+    except StudentProfile.DoesNotExist:
+        raise PaymentRequestError("No student profile found. Please complete your profile to make payments.", 403)
+    if booking.student_id != student_profile.id:
+        raise PaymentRequestError("You are not authorized to pay for this booking. Only the booking owner can make payments.", 403)
+
+    if email != student_profile.user.email:
+        raise PaymentRequestError("Provided email does not match your account email. Please use the correct email.")
+
+    if room_is_full(booking):
+        raise PaymentRequestError(f"Room has reached its maximum occupancy of {booking.room.max_occupancy} for the selected dates.")
+
+    try:
+        amount_minor = to_minor_units(amount)
+    except ValueError:
+        raise PaymentRequestError("Invalid amount format. Please provide a valid number with at most two decimal places.")
+    if amount_minor != to_minor_units(booking.total_amount):
+        raise PaymentRequestError(f"Amount ({amount}) does not match the booking total ({booking.total_amount}). Please provide the exact amount.")
+
+    return booking, amount_minor
+
+
+def refund_booking_payments(booking_ids):
+    """Mark the successful payments of the given bookings as refunded with one UPDATE. Returns the count."""
+    refunded = Payment.objects.filter(booking_id__in=booking_ids, status='success').update(
+        status='refunded', refunded_at=timezone.now()
+    )
+    if refunded:
+        logger.info(f"{refunded} payments refunded")
+    return refunded
@@ -0,0 +1,108 @@
+"""
+Stay prices from Room.price_per_night and the provider's PricingRules.
+
+For each night of the stay:
+- the best matching override rule replaces the room's nightly price;
+- otherwise the best matching seasonal rule adds its percent to it;
+- the nightly price is rounded to the cent.
+The nights are summed, and the best length-of-stay rule the stay qualifies
+for takes its percent off the total. "Best" means hostel-specific before
+provider-wide, then the highest priority (then the longest minimum stay for
+length-of-stay rules).
+
+quote_rooms prices many rooms for one date range with one rules query. The
+rules are resolved into a per-night (override, percent) vector once per hostel,
+and each room is then priced from its hostel's vector, so search results cost
+one pass over the nights per hostel rather than a rules lookup per room and
+night.
+"""
+from datetime import timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from core.models import PricingRule
+
+CENT = Decimal('0.01')
+HUNDRED = Decimal(100)
+
+
+def to_cents(amount):
+    return amount.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def load_rules(provider_ids, check_in, check_out):
+    """Active rules of these providers that can apply to a stay in [check_in, check_out), in one query."""
+    return list(
+        PricingRule.objects.filter(provider_id__in=set(provider_ids), is_active=True)
+        .exclude(start_date__gte=check_out)
+        .exclude(end_date__lt=check_in)
+    )
+
+
+def rule_rank(rule):
+    return (bool(rule.hostel_name), rule.priority, rule.min_nights or 0, rule.id)
+
+
+def rules_for(rules, provider_id, hostel_name):
+    hostel = hostel_name.casefold()
+    return [
+        rule for rule in rules
+        if rule.provider_id == provider_id and (not rule.hostel_name or rule.hostel_name.casefold() == hostel)
+    ]
+
+
+def covers(rule, night):
+    return (rule.start_date is None or rule.start_date <= night) and (rule.end_date is None or night <= rule.end_date)
+
+
+def night_vector(rules, check_in, check_out):
+    """[(override price or None, seasonal percent), ...] for each night of the stay."""
+    overrides = sorted((r for r in rules if r.kind == 'override'), key=rule_rank, reverse=True)
+    seasons = sorted((r for r in rules if r.kind == 'seasonal'), key=rule_rank, reverse=True)
+    vector = []
+    night = check_in
+    while night < check_out:
+        override = next((r.nightly_price for r in overrides if covers(r, night)), None)
+        percent = next((r.percent for r in seasons if covers(r, night)), Decimal(0)) if override is None else Decimal(0)
+        vector.append((override, percent))
+        night += timedelta(days=1)
+    return vector
+
+
+def stay_discount(rules, nights):
+    """Percent taken off the stay total by the best length-of-stay rule, or 0."""
+    eligible = [r for r in rules if r.kind == 'length_of_stay' and r.min_nights <= nights]
+    return max(eligible, key=rule_rank).percent if eligible else Decimal(0)
+
+
+def price_stay(base_price, vector, discount):
+    base_price = Decimal(base_price)
+    subtotal = sum(
+        (override if override is not None else to_cents(base_price * (HUNDRED + percent) / HUNDRED))
+        for override, percent in vector
+    )
+    return to_cents(subtotal - subtotal * discount / HUNDRED)
+
+
+def quote_rooms(rooms, check_in, check_out, rules=None):
+    """
+    {room id: total price} for staying in each room from check_in to
+    check_out. Rooms need id, provider_id, hostel_name and price_per_night.
+    Pass rules from load_rules to reuse them across calls.
+    """
+    rooms = list(rooms)
+    if rules is None:
+        rules = load_rules([room.provider_id for room in rooms], check_in, check_out)
+    nights = (check_out - check_in).days
+    scopes = {}
+    quotes = {}
+    for room in rooms:
+        scope = (room.provider_id, room.hostel_name.casefold())
+        if scope not in scopes:
+            scope_rules = rules_for(rules, room.provider_id, room.hostel_name)
+            scopes[scope] = (night_vector(scope_rules, check_in, check_out), stay_discount(scope_rules, nights))
+        vector, discount = scopes[scope]
+        quotes[room.id] = price_stay(room.price_per_night, vector, discount)
+    return quotes
+
+
+def quote_room(room, check_in, check_out, rules=None):
+    return quote_rooms([room], check_in, check_out, rules)[room.id]
@@ -0,0 +1,140 @@
+import logging
+from datetime import timedelta
+from io import BytesIO
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from core.models import Room, RoomImageUpload
+
+logger = logging.getLogger(__name__)
+
+# Longest edge, in pixels, of each stored variant. Listings use 'card' and
+# 'thumbnail'; 'full' is only sent on the room detail page.
+VARIANTS = {
+    'full': 1600,
+    'card': 800,
+    'thumbnail': 320,
+}
+
+MAX_ATTEMPTS = 3
+
+
+def get_output_storage():
+    """Storage backend processed images are pushed to (settings.ROOM_IMAGE_STORAGE)."""
+    return import_string(settings.ROOM_IMAGE_STORAGE)()
+
+
+def queue_upload(room, image_file):
+    """Stage an uploaded file on local disk for the image worker and return immediately."""
+    upload = RoomImageUpload(room=room)
+    upload.file.save(image_file.name, image_file, save=False)
+    upload.save()
+    logger.info(f"Queued image upload {upload.id} for room {room.id}")
+    return upload
+
+
+def cloudinary_variants(image):
+    """
+    Variant URLs for a legacy CloudinaryField image, built once with Cloudinary
+    on-the-fly transformations so no re-upload is needed.
+    """
+    return {
+        name: image.build_url(width=max_size, height=max_size, crop='limit', quality='auto', fetch_format='auto', secure=True)
+        for name, max_size in VARIANTS.items()
+    }
+
+
+def render_variant(image, max_size):
+    """Resize (never upscale) and recompress an image as a progressive JPEG."""
+    from PIL import Image
+
+    variant = image.copy()
+    variant.thumbnail((max_size, max_size), Image.LANCZOS)
+    if variant.mode != 'RGB':
+        variant = variant.convert('RGB')
+    buffer = BytesIO()
+    variant.save(buffer, format='JPEG', quality=settings.ROOM_IMAGE_QUALITY, optimize=True, progressive=True)
+    return ContentFile(buffer.getvalue())
+
+
+def process_upload(upload):
+    # Pillow is only needed by the image worker, not by web workers
+    from PIL import Image, ImageOps
+
+    storage = get_output_storage()
+    with upload.file.open('rb') as source:
+        image = ImageOps.exif_transpose(Image.open(source))
+        image.load()
+
+    variants = {}
+    for name, max_size in VARIANTS.items():
+        path = storage.save(f"rooms/{upload.room_id}/{upload.id}-{name}.jpg", render_variant(image, max_size))
+        variants[name] = storage.url(path)
+
+    with transaction.atomic():
+        # An older upload finishing late must not replace a newer photo
+        newer = RoomImageUpload.objects.filter(room_id=upload.room_id, status='ready', id__gt=upload.id).exists()
+        if not newer:
+            Room.objects.filter(id=upload.room_id).update(image_variants=variants)
+        upload.status = 'ready'
+        upload.error = ''
+        upload.processed_at = timezone.now()
+        upload.save(update_fields=['status', 'error', 'processed_at'])
+
+    upload.file.delete(save=True)
+    logger.info(f"Processed image upload {upload.id} for room {upload.room_id}")
+    return variants
+
+
+def claim_uploads(batch_size):
+    """
+    Mark up to batch_size pending uploads as processing and return them.
+
+    Rows are locked with SKIP LOCKED so several workers can drain the queue
+    without picking up the same upload. Uploads whose claim is older than
+    ROOM_IMAGE_LEASE_SECONDS were left behind by a worker that died, and are
+    claimed again; those that already used MAX_ATTEMPTS are marked failed.
+    """
+    now = timezone.now()
+    expired = now - timedelta(seconds=settings.ROOM_IMAGE_LEASE_SECONDS)
+    with transaction.atomic():
+        # claimed_at is empty for uploads claimed before leases were recorded
+        stale = Q(status='processing') & (Q(claimed_at__lt=expired) | Q(claimed_at__isnull=True))
+        uploads = list(
+            RoomImageUpload.objects.select_for_update(skip_locked=True)
+            .filter(Q(status='pending') | stale)
+            .order_by('created_at')[:batch_size]
+        )
+        claimed = []
+        for upload in uploads:
+            if upload.status == 'processing':
+                logger.warning(f"Image upload {upload.id} lease expired after attempt {upload.attempts}")
+                if upload.attempts >= MAX_ATTEMPTS:
+                    upload.status = 'failed'
+                    upload.error = "Worker stopped while processing the upload."
+                    continue
+            upload.status = 'processing'
+            upload.attempts += 1
+            upload.claimed_at = now
+            claimed.append(upload)
+        RoomImageUpload.objects.bulk_update(uploads, ['status', 'attempts', 'error', 'claimed_at'])
+    return claimed
+
+
+def process_pending_uploads(batch_size=20):
+    """Process one batch of queued uploads. Returns (processed, failed) counts."""
+    processed = failed = 0
+    for upload in claim_uploads(batch_size):
+        try:
+            process_upload(upload)
+            processed += 1
+        except Exception as e:
+            failed += 1
+            upload.status = 'failed' if upload.attempts >= MAX_ATTEMPTS else 'pending'
+            upload.error = str(e)
+            upload.save(update_fields=['status', 'error'])
+            logger.error(f"Failed to process image upload {upload.id} (attempt {upload.attempts}): {str(e)}")
+    return processed, failed
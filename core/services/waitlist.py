@@ -0,0 +1,141 @@
+import logging
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from core.models import Booking, Room, WaitlistEntry
+from core.services.booking_state import record_created
+from core.services.pricing import load_rules, quote_room
+
+logger = logging.getLogger(__name__)
+
+
+def with_queue_position(entries):
+    """
+    Annotate a WaitlistEntry queryset with queue_position: the 1-based place of
+    each entry among waiting entries for its room with overlapping dates, in
+    joining order. One correlated count in the same query, not a query per entry.
+    """
+    ahead = (
+        WaitlistEntry.objects.filter(
+            room_id=OuterRef('room_id'),
+            status='waiting',
+            check_in_date__lt=OuterRef('check_out_date'),
+            check_out_date__gt=OuterRef('check_in_date'),
+            created_at__lt=OuterRef('created_at'),
+        )
+        .order_by()
+        .values('room_id')
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return entries.annotate(queue_position=Coalesce(Subquery(ahead), Value(0)) + 1)
+
+
+def count_overlapping(intervals, check_in, check_out):
+    return sum(1 for start, end in intervals if start < check_out and end > check_in)
+
+
+def promote_waitlist(room, check_in, check_out):
+    """
+    Turn waiting entries whose dates fit inside the freed window [check_in, check_out)
+    into pending bookings, oldest first, while the room has space for them.
+
+    Must run inside the transaction that released the capacity. Returns the
+    promoted entries.
+    """
+    # Serialises promotions (and concurrent cancellations) for this room
+    room = Room.objects.select_for_update().get(id=room.id)
+    if not room.is_listed:
+        return []
+
+    entries = list(
+        WaitlistEntry.objects.select_for_update()
+        .filter(
+            room=room,
+            status='waiting',
+            check_in_date__gte=check_in,
+            check_out_date__lte=check_out,
+        )
+        .order_by('created_at', 'id')
+    )
+    if not entries:
+        return []
+
+    taken = list(
+        Booking.objects.occupying(check_in, check_out).filter(room=room).values_list('check_in_date', 'check_out_date')
+    )
+    # Students who already hold an active booking for the room in this window
+    booked = set(
+        Booking.objects.filter(
+            room=room,
+            student_id__in={entry.student_id for entry in entries},
+            check_in_date__lt=check_out,
+            check_out_date__gt=check_in,
+            booking_status__in=['pending', 'approved', 'confirmed'],
+        ).values_list('student_id', 'check_in_date', 'check_out_date')
+    )
+
+    promoted = []
+    for entry in entries:
+        if any(student_id == entry.student_id and start < entry.check_out_date and end > entry.check_in_date
+               for student_id, start, end in booked):
+            continue
+        if count_overlapping(taken, entry.check_in_date, entry.check_out_date) >= room.max_occupancy:
+            continue
+        taken.append((entry.check_in_date, entry.check_out_date))
+        booked.add((entry.student_id, entry.check_in_date, entry.check_out_date))
+        promoted.append(entry)
+
+    if not promoted:
+        return []
+
+    rules = load_rules([room.provider_id], check_in, check_out)
+    bookings = Booking.objects.bulk_create([
+        Booking(
+            student_id=entry.student_id,
+            room=room,
+            check_in_date=entry.check_in_date,
+            check_out_date=entry.check_out_date,
+            booking_status='pending',
+            total_amount=quote_room(room, entry.check_in_date, entry.check_out_date, rules),
+        )
+        for entry in promoted
+    ])
+    promoted_at = timezone.now()
+    for entry, booking in zip(promoted, bookings):
+        entry.status = 'promoted'
+        entry.booking = booking
+        entry.promoted_at = promoted_at
+    WaitlistEntry.objects.bulk_update(promoted, ['status', 'booking', 'promoted_at'])
+    record_created(bookings, source='waitlist')
+
+    logger.info(f"Promoted {len(promoted)} waitlist entries for room {room.id} ({check_in} to {check_out})")
+    return promoted
+
+
+def merge_windows(windows):
+    """Merge overlapping or touching (check_in, check_out) ranges."""
+    merged = []
+    for check_in, check_out in sorted(windows):
+        if merged and check_in <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], check_out)
+        else:
+            merged.append([check_in, check_out])
+    return merged
+
+
+def promote_released(released):
+    """
+    Run promote_waitlist once per room and merged window for bookings that just
+    gave up their place, given as (id, room_id, check_in_date, check_out_date)
+    tuples (what transition_many returns). Must run in the releasing transaction.
+    """
+    windows = {}
+    for _, room_id, check_in, check_out in released:
+        windows.setdefault(room_id, []).append((check_in, check_out))
+    rooms = Room.objects.in_bulk(windows.keys())
+    promoted = []
+    for room_id, room_windows in windows.items():
+        for check_in, check_out in merge_windows(room_windows):
+            promoted += promote_waitlist(rooms[room_id], check_in, check_out)
+    return promoted
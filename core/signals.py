@@ -0,0 +1,34 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from core.models import Facility, Room
+from core.services.facets import invalidate_facets
+from core.services.facility_catalogue import invalidate_catalogue
+
+
+def invalidate(func):
+    """
+    Bump a cache version now, so this process sees its own change, and again
+    on commit, so copies another worker loaded before the commit are dropped.
+    """
+    func()
+    transaction.on_commit(func)
+
+
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+def room_changed(sender, **kwargs):
+    invalidate(invalidate_facets)
+
+
+@receiver(post_save, sender=Facility)
+@receiver(post_delete, sender=Facility)
+def facility_changed(sender, **kwargs):
+    invalidate(invalidate_facets)
+    invalidate(invalidate_catalogue)
+
+
+@receiver(m2m_changed, sender=Room.facilities.through)
+def room_facilities_changed(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate(invalidate_facets)
@@ -2,14 +2,21 @@
 from django.urls import path
 from core.views.auth_views import RegisterStudentView, RegisterProviderView, LoginView
 from core.views.room_view import RoomCreateView, MyRoomsView, RoomListView, ToggleRoomAvailabilityView
-from core.views.booking_view import BookingCreateView, MyBookingsView, BookingRequestsView, UpdateBookingStatusView, CancelBookingView
+from core.views.booking_view import BookingCreateView, MyBookingsView, BookingRequestsView, UpdateBookingStatusView, BulkUpdateBookingStatusView, CancelBookingView
 from core.views.payment_view import InitializePaystackPayment
 from core.views.payment_webhook import paystack_webhook
 from core.views.revenue_view import ProviderRevenueView
 from core.views.facility_view import FacilityListView
 from core.views.provider_dashboard_view import ProviderDashboardSummaryView
+from core.views.export_view import ProviderBookingExportView, ProviderPaymentExportView
+from core.views.calendar_view import ProviderOccupancyCalendarView
+from core.views.analytics_view import ProviderAnalyticsView
 from core.views.room_view import RoomDetailView
+from core.views.room_bulk_view import RoomBulkCreateView, RoomBulkUpdateView
 from core.views.password_reset_view import request_password_reset, confirm_password_reset, verify_reset_token
+from core.views.waitlist_view import WaitlistJoinView, MyWaitlistView, CancelWaitlistView
+from core.views.pricing_rule_view import PricingRuleListCreateView, PricingRuleDetailView
+from django.conf import settings
 from rest_framework.views import APIView
 from rest_framework.response import Response
 
@@ -19,26 +26,53 @@ class HomeView(APIView):
     def get(self, request):
         return Response({"message": "Welcome to the Hostel Booking System!"})
 
+# Under ASGI, the I/O-bound endpoints can be served by their async versions
+if settings.ASYNC_VIEWS:
+    # Imported only here so WSGI workers never load httpx and the async module
+    from core.views import async_views
+
+    initiate_payment_view = async_views.initialize_paystack_payment
+    paystack_webhook_view = async_views.paystack_webhook
+    request_password_reset_view = async_views.request_password_reset
+    room_list_view = async_views.room_list
+else:
+    initiate_payment_view = InitializePaystackPayment.as_view()
+    paystack_webhook_view = paystack_webhook
+    request_password_reset_view = request_password_reset
+    room_list_view = RoomListView.as_view()
+
 urlpatterns = [
     path('', HomeView.as_view(), name='home'),  # Root URL
     path("register/student/", RegisterStudentView.as_view(), name="register-student"),
     path("register/provider/", RegisterProviderView.as_view(), name="register-provider"),
     path("login/", LoginView.as_view(), name="login"),
     path("rooms/create/", RoomCreateView.as_view(), name="create-room"),
+    path("rooms/bulk/create/", RoomBulkCreateView.as_view(), name="bulk-create-rooms"),
+    path("rooms/bulk/update/", RoomBulkUpdateView.as_view(), name="bulk-update-rooms"),
     path("rooms/mine/", MyRoomsView.as_view(), name="my-rooms"),
-    path("rooms/", RoomListView.as_view(), name="room-list"),
+    path("rooms/calendar/", ProviderOccupancyCalendarView.as_view(), name="occupancy-calendar"),
+    path("rooms/", room_list_view, name="room-list"),
     path("facilities/", FacilityListView.as_view(), name="facility-list"),
     path("bookings/", BookingCreateView.as_view(), name="create-booking"),
     path('bookings/my/', MyBookingsView.as_view(), name='my-bookings'),
     path("bookings/requests/", BookingRequestsView.as_view(), name="booking-requests"),
+    path("bookings/bulk-status/", BulkUpdateBookingStatusView.as_view(), name="bulk-update-booking-status"),
     path("bookings/<int:booking_id>/status/", UpdateBookingStatusView.as_view(), name="update-booking-status"),
     path("bookings/<int:booking_id>/cancel/", CancelBookingView.as_view(), name="cancel-booking"),
+    path("waitlist/", WaitlistJoinView.as_view(), name="join-waitlist"),
+    path("waitlist/my/", MyWaitlistView.as_view(), name="my-waitlist"),
+    path("waitlist/<int:entry_id>/cancel/", CancelWaitlistView.as_view(), name="cancel-waitlist"),
+    path("pricing-rules/", PricingRuleListCreateView.as_view(), name="pricing-rules"),
+    path("pricing-rules/<int:pk>/", PricingRuleDetailView.as_view(), name="pricing-rule-detail"),
     path("rooms/<int:room_id>/toggle-availability/", ToggleRoomAvailabilityView.as_view(), name="toggle-room-availability"),
-    path('payments/initiate/', InitializePaystackPayment.as_view(), name='initiate-payment'),
-    path('webhooks/paystack/', paystack_webhook, name='paystack-webhook'),
+    path('payments/initiate/', initiate_payment_view, name='initiate-payment'),
+    path('webhooks/paystack/', paystack_webhook_view, name='paystack-webhook'),
     path("revenue/", ProviderRevenueView.as_view(), name="provider-revenue"),
     path("dashboard/provider/summary/", ProviderDashboardSummaryView.as_view(), name="provider-dashboard-summary"),
-    path('password-reset/request/', request_password_reset, name='request_password_reset'),
+    path("analytics/", ProviderAnalyticsView.as_view(), name="provider-analytics"),
+    path("exports/bookings/", ProviderBookingExportView.as_view(), name="export-bookings"),
+    path("exports/payments/", ProviderPaymentExportView.as_view(), name="export-payments"),
+    path('password-reset/request/', request_password_reset_view, name='request_password_reset'),
     path('password-reset/confirm/', confirm_password_reset, name='confirm_password_reset'),
     path('password-reset/verify/', verify_reset_token, name='verify_reset_token'),
     path('rooms/<int:pk>/', RoomDetailView.as_view(), name='room-detail'),
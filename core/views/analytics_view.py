@@ -0,0 +1,114 @@
+import logging
+from datetime import timedelta
+from decimal import Decimal
+from django.conf import settings
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.models import ProviderProfile, Room, RoomDailyStat
+from core.services.analytics import PERIODS, next_period_start, period_start
+from core.views.booking_view import IsProvider
+from core.views.mixins import ReplicaReadMixin
+
+logger = logging.getLogger(__name__)
+
+
+def bucket_stats(nights_sold, available_nights, revenue, cancellations):
+    return {
+        "nights_sold": nights_sold,
+        "available_nights": available_nights,
+        "occupancy_rate": round(nights_sold / available_nights, 4) if available_nights else 0.0,
+        "revenue": float(revenue),
+        "adr": float(round(revenue / nights_sold, 2)) if nights_sold else 0.0,
+        "cancellations": cancellations,
+    }
+
+
+class ProviderAnalyticsView(ReplicaReadMixin, APIView):
+    """
+    Occupancy and revenue per week, month or semester, summed from the daily
+    RoomDailyStat rollups (never from raw bookings or payments).
+
+    available_nights uses the rooms' current max_occupancy; ADR is revenue per
+    night sold.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsProvider]
+
+    def get(self, request):
+        try:
+            provider = ProviderProfile.objects.get(user=request.user)
+        except ProviderProfile.DoesNotExist:
+            return Response({"error": "Provider profile not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        period = request.query_params.get('period', 'month')
+        if period not in PERIODS:
+            return Response({"error": "Invalid period. Must be 'week', 'month' or 'semester'."}, status=status.HTTP_400_BAD_REQUEST)
+
+        dates = {}
+        for param in ('start_date', 'end_date'):
+            raw = request.query_params.get(param)
+            try:
+                dates[param] = parse_date(raw) if raw else None
+            except ValueError:
+                dates[param] = None
+            if raw and dates[param] is None:
+                return Response({"error": f"Invalid {param}. Use the YYYY-MM-DD format."}, status=status.HTTP_400_BAD_REQUEST)
+        end_date = dates['end_date'] or timezone.localdate()
+        start_date = dates['start_date'] or end_date - timedelta(days=364)
+        if end_date < start_date:
+            return Response({"error": "start_date must be on or before end_date."}, status=status.HTTP_400_BAD_REQUEST)
+        if (end_date - start_date).days + 1 > settings.ANALYTICS_MAX_DAYS:
+            return Response({"error": f"Analytics can cover at most {settings.ANALYTICS_MAX_DAYS} days."}, status=status.HTTP_400_BAD_REQUEST)
+
+        rooms = Room.objects.filter(provider=provider)
+        stats = RoomDailyStat.objects.filter(provider=provider, date__gte=start_date, date__lte=end_date)
+        room_id = request.query_params.get('room_id')
+        if room_id:
+            try:
+                rooms = rooms.filter(id=int(room_id))
+                stats = stats.filter(room_id=int(room_id))
+            except ValueError:
+                return Response({"error": "room_id must be a room ID."}, status=status.HTTP_400_BAD_REQUEST)
+        capacity = rooms.aggregate(total=Sum('max_occupancy'))['total'] or 0
+
+        # Weeks and months are grouped in the database; semesters are folded from months
+        trunc = TruncWeek('date') if period == 'week' else TruncMonth('date')
+        rows = stats.annotate(bucket=trunc).values('bucket').annotate(
+            nights_sold=Sum('nights_sold'), revenue=Sum('revenue'), cancellations=Sum('cancellations'),
+        ).order_by('bucket')
+        totals = {}
+        for row in rows:
+            bucket = period_start(row['bucket'], period)
+            nights_sold, revenue, cancellations = totals.get(bucket, (0, Decimal('0'), 0))
+            totals[bucket] = (nights_sold + row['nights_sold'], revenue + row['revenue'], cancellations + row['cancellations'])
+
+        buckets = []
+        bucket = period_start(start_date, period)
+        while bucket <= end_date:
+            following = next_period_start(bucket, period)
+            first, last = max(bucket, start_date), min(following - timedelta(days=1), end_date)
+            nights_sold, revenue, cancellations = totals.get(bucket, (0, Decimal('0'), 0))
+            buckets.append({
+                "start": first,
+                "end": last,
+                **bucket_stats(nights_sold, capacity * ((last - first).days + 1), revenue, cancellations),
+            })
+            bucket = following
+
+        logger.info(f"Analytics ({period}) for provider {provider.id}: {start_date} to {end_date}")
+        return Response({
+            "period": period,
+            "start_date": start_date,
+            "end_date": end_date,
+            "buckets": buckets,
+            "totals": bucket_stats(
+                sum(b["nights_sold"] for b in buckets),
+                sum(b["available_nights"] for b in buckets),
+                sum((revenue for _, revenue, _ in totals.values()), Decimal('0')),
+                sum(b["cancellations"] for b in buckets),
+            ),
+        })
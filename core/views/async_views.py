@@ -0,0 +1,254 @@
+"""
+Async versions of the I/O-bound endpoints, for running under ASGI (uvicorn).
+
+They keep the URLs, request bodies and response shapes of the sync DRF views
+and are switched on with ASYNC_VIEWS=True (see core/urls.py). While a request
+waits on Paystack, SMTP or the database, the worker's event loop keeps serving
+other connections instead of holding a whole sync worker.
+"""
+import asyncio
+import json
+import logging
+import weakref
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.utils.module_loading import import_string
+from django_ratelimit.core import is_ratelimited
+from django_ratelimit.exceptions import Ratelimited
+from rest_framework.exceptions import APIException, NotAuthenticated
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from core.db_router import enable_replica_reads, reset_replica_reads, is_primary_sticky
+from core.models.password_reset import PasswordResetToken
+from core.serializers.room_serializer import RoomListSerializer
+from core.views.password_reset_view import send_reset_email
+from core.views.payment_webhook import WEBHOOK_RATELIMIT_GROUP, verify_signature, process_charge_success
+from core.services.facets import get_facets
+from core.services.payments import PaymentRequestError, check_payment_request
+from core.views.room_view import FACET_PARAMS, RoomListView, rooms_with_availability, search_quotes, wants_facets
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+PAYSTACK_TIMEOUT = 30
+
+# One Paystack client (and connection pool) per event loop, reused across requests
+_paystack_clients = weakref.WeakKeyDictionary()
+
+# Rows fetched per round trip by the room search (prefetching needs a chunk size)
+ROOM_SEARCH_CHUNK_SIZE = 500
+
+
+def api_response(data, status=200):
+    """JSON response encoded the same way as DRF's JSONRenderer."""
+    return JsonResponse(data, status=status, encoder=JSONEncoder, safe=False)
+
+
+def error_response(exc):
+    """Render a DRF APIException the way DRF's exception handler does."""
+    detail = exc.detail if isinstance(exc.detail, (dict, list)) else {"detail": exc.detail}
+    response = api_response(detail, exc.status_code)
+    if exc.status_code == 401:
+        response['WWW-Authenticate'] = JWTAuthentication().authenticate_header(None)
+    return response
+
+
+def get_paystack_client():
+    loop = asyncio.get_running_loop()
+    client = _paystack_clients.get(loop)
+    if client is None:
+        client = _paystack_clients[loop] = httpx.AsyncClient(timeout=PAYSTACK_TIMEOUT)
+    return client
+
+
+def method_not_allowed(request):
+    return api_response({"detail": f'Method "{request.method}" not allowed.'}, 405)
+
+
+def get_request_data(request):
+    """Parsed body for JSON and form posts (the parsers the sync views accept by default)."""
+    if request.content_type == 'application/json':
+        return json.loads(request.body or b'{}')
+    return request.POST
+
+
+async def authenticate(request):
+    """
+    Authenticate the bearer token like the DRF views do. The user lookup runs in
+    a worker thread. Raises AuthenticationFailed for a bad token.
+    """
+    result = await sync_to_async(JWTAuthentication().authenticate)(request)
+    if result is not None:
+        request.user = result[0]
+    return result is not None
+
+
+@csrf_exempt
+async def initialize_paystack_payment(request):
+    if request.method != 'POST':
+        return method_not_allowed(request)
+    try:
+        if not await authenticate(request):
+            raise NotAuthenticated()
+    except APIException as e:
+        return error_response(e)
+
+    try:
+        data = get_request_data(request)
+    except ValueError as e:
+        return api_response({"detail": f"JSON parse error - {str(e)}"}, 400)
+
+    booking_id = data.get("booking_id")
+    email = data.get("email")
+    amount = data.get("amount")
+
+    try:
+        # The same checks as the sync view, run in one worker thread
+        booking, amount_minor = await sync_to_async(check_payment_request)(request.user, booking_id, email, amount)
+    except PaymentRequestError as e:
+        return api_response({"error": e.message}, e.status)
+
+    headers = {
+        "Authorization": f"Bearer {settings.PAYSTACK_SECRET_KEY}",
+        "Content-Type": "application/json"
+    }
+
+    payload = {
+        "email": email,
+        "amount": amount_minor,
+        "currency": booking.currency,
+        "metadata": {
+            "booking_id": booking_id
+        }
+    }
+
+    response = await get_paystack_client().post(f"{settings.PAYSTACK_API_URL}/transaction/initialize", json=payload, headers=headers)
+    res_data = response.json()
+
+    if response.status_code == 200:
+        return api_response(res_data["data"], 200)
+
+    return api_response({"error": f"Payment initialization failed: {res_data.get('message', 'Unknown error')}"}, 400)
+
+
+@csrf_exempt
+async def paystack_webhook(request):
+    limited = await sync_to_async(is_ratelimited)(
+        request=request, group=WEBHOOK_RATELIMIT_GROUP, key='ip', rate='10/m', method='POST', increment=True
+    )
+    if limited:
+        cls = getattr(settings, 'RATELIMIT_EXCEPTION_CLASS', Ratelimited)
+        raise (import_string(cls) if isinstance(cls, str) else cls)()
+
+    if request.method != 'POST':
+        logger.warning(f"Invalid method {request.method} for webhook")
+        return HttpResponse(status=405)
+
+    if not verify_signature(request):
+        logger.warning("Invalid Paystack signature")
+        return HttpResponse(status=400)
+
+    payload = json.loads(request.body)
+    logger.info("Webhook hit: %s", json.dumps(payload, indent=2))
+
+    if payload.get('event') == 'charge.success':
+        # The row locks and writes run in one thread, inside one transaction
+        return HttpResponse(status=await sync_to_async(process_charge_success)(payload['data']))
+
+    return HttpResponse(status=200)
+
+
+@csrf_exempt
+async def request_password_reset(request):
+    """
+    Request password reset - sends email with reset link
+    """
+    if request.method != 'POST':
+        return method_not_allowed(request)
+
+    try:
+        data = get_request_data(request)
+    except ValueError as e:
+        return api_response({"detail": f"JSON parse error - {str(e)}"}, 400)
+
+    email = data.get('email')
+
+    if not email:
+        return api_response({'error': 'Email is required'}, 400)
+
+    user = await User.objects.filter(email=email).afirst()
+    if not user:
+        return api_response({
+            'message': 'If an account with this email exists, a reset link has been sent.'
+        }, 200)
+
+    # Invalidate existing tokens
+    await PasswordResetToken.objects.filter(user=user, is_used=False).aupdate(is_used=True)
+
+    reset_token = await PasswordResetToken.objects.acreate(user=user)
+    reset_url = f"{settings.FRONTEND_URL}/reset-password?token={reset_token.token}"
+
+    # SMTP is blocking; run it outside the thread reserved for the ORM
+    try:
+        await sync_to_async(send_reset_email, thread_sensitive=False)(user, email, reset_url)
+        logger.debug(f"Password reset link sent to {email}: {reset_url}")
+        return api_response({
+            'message': 'Password reset link has been sent to your email.',
+            'reset_url': reset_url if settings.DEBUG else None
+        }, 200)
+    except Exception as e:
+        logger.error(f"Failed to send email to {email}: {str(e)}")
+        return api_response({
+            'error': f'Failed to send email: {str(e)}',
+            'reset_url': reset_url if settings.DEBUG else None
+        }, 500)
+
+
+async def room_list(request):
+    """Public room search with the same filters and search fields as RoomListView."""
+    if request.method != 'GET':
+        return method_not_allowed(request)
+    try:
+        await authenticate(request)
+    except APIException as e:
+        return error_response(e)
+
+    # Filter backends only need query_params, so wrap the request the way DRF does
+    view = RoomListView()
+    drf_request = Request(request)
+
+    def filter_rooms():
+        queryset = rooms_with_availability(drf_request).prefetch_related('facilities')
+        for backend in view.filter_backends:
+            queryset = backend().filter_queryset(drf_request, queryset, view)
+        return queryset
+
+    # Validating facility choices reads the database, so it runs in a thread
+    try:
+        queryset = await sync_to_async(filter_rooms)()
+    except APIException as e:
+        return error_response(e)
+
+    token = None
+    if not await sync_to_async(is_primary_sticky)(getattr(request, 'user', None)):
+        token = enable_replica_reads()
+    try:
+        rooms = [room async for room in queryset.aiterator(chunk_size=ROOM_SEARCH_CHUNK_SIZE)]
+        quotes = await sync_to_async(search_quotes)(rooms, drf_request.query_params)
+        facets = None
+        if wants_facets(drf_request.query_params):
+            facets = await sync_to_async(get_facets)(queryset, drf_request.query_params, FACET_PARAMS)
+    finally:
+        if token is not None:
+            reset_replica_reads(token)
+
+    results = RoomListSerializer(rooms, many=True, context={'quotes': quotes}).data
+    if facets is not None:
+        return api_response({"results": results, "facets": facets})
+    return api_response(results)
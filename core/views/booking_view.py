@@ -3,9 +3,14 @@ from rest_framework import generics, permissions, status
 from rest_framework.exceptions import PermissionDenied, NotFound
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from core.models import Booking, StudentProfile, Payment
+from core.models import Booking, StudentProfile, Room
 from core.serializers.booking_serializer import BookingSerializer
+from core.services.booking_state import InvalidTransition, record_created, transition, transition_many
+from core.services.payments import refund_booking_payments
+from core.services.waitlist import promote_released, promote_waitlist
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Prefetch
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +24,11 @@ class IsProvider(permissions.BasePermission):
     def has_permission(self, request, view):
         return request.user.is_authenticated and request.user.role == 'provider'
 
+def serialize_booking(booking):
+    """BookingSerializer data for one booking whose status just changed, with its room's current availability."""
+    booking.room = Room.objects.annotate_availability().get(pk=booking.room_id)
+    return BookingSerializer(booking).data
+
 class BookingCreateView(generics.CreateAPIView):
     queryset = Booking.objects.all()
     serializer_class = BookingSerializer
@@ -31,7 +41,8 @@ class BookingCreateView(generics.CreateAPIView):
             logger.error(f"No StudentProfile found for user {self.request.user.username}")
             raise PermissionDenied("No student profile found")
         logger.info(f"Creating booking for user {self.request.user.username} with profile {student_profile.id}")
-        serializer.save(student=student_profile)
+        booking = serializer.save(student=student_profile)
+        record_created([booking], actor=self.request.user, source='student')
 
 class MyBookingsView(generics.ListAPIView):
     serializer_class = BookingSerializer
@@ -46,7 +57,9 @@ class MyBookingsView(generics.ListAPIView):
         except StudentProfile.DoesNotExist:
             raise PermissionDenied("No student profile found")
 
-        return Booking.objects.filter(student=student_profile)
+        return Booking.objects.filter(student=student_profile).select_related('student__user').prefetch_related(
+            Prefetch('room', queryset=Room.objects.annotate_availability()), 'room__facilities'
+        )
 
 class BookingRequestsView(generics.ListAPIView):
     serializer_class = BookingSerializer
@@ -56,6 +69,8 @@ class BookingRequestsView(generics.ListAPIView):
         return Booking.objects.filter(
             room__provider__user=self.request.user,
             booking_status='pending'
+        ).select_related('student__user').prefetch_related(
+            Prefetch('room', queryset=Room.objects.annotate_availability()), 'room__facilities'
         )
 
     def list(self, request, *args, **kwargs):
@@ -71,87 +86,129 @@ class UpdateBookingStatusView(APIView):
 
     def post(self, request, booking_id):
         try:
-            booking = Booking.objects.get(id=booking_id)
+            booking = Booking.objects.select_related('room__provider').get(id=booking_id)
         except Booking.DoesNotExist:
             return Response({"error": "Booking not found. Please provide a valid booking ID."}, status=status.HTTP_404_NOT_FOUND)
 
-        if booking.room.provider.user != request.user:
+        if booking.room.provider.user_id != request.user.id:
             return Response({"error": "You are not authorized to update this booking."}, status=status.HTTP_403_FORBIDDEN)
 
         new_status = request.data.get("status")
         if new_status not in ['approved', 'rejected', 'confirmed']:
             return Response({"error": "Invalid status. Must be 'approved', 'rejected', or 'confirmed'."}, status=status.HTTP_400_BAD_REQUEST)
 
-        if booking.booking_status != 'pending' and new_status in ['approved', 'rejected']:
-            return Response({"error": f"Cannot change to {new_status} from {booking.booking_status}. Booking must be pending."}, status=status.HTTP_400_BAD_REQUEST)
-
-        booking.booking_status = new_status
-        booking.save()
+        try:
+            with transaction.atomic():
+                transition(booking, new_status, actor=request.user, source='provider')
+
+                if new_status == 'rejected':
+                    refund_booking_payments([booking.id])
+                    promote_waitlist(booking.room, booking.check_in_date, booking.check_out_date)
+        except InvalidTransition as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(serialize_booking(booking), status=status.HTTP_200_OK)
+
+class BulkUpdateBookingStatusView(APIView):
+    """
+    Approve or reject many pending bookings at once.
+
+    Ownership and current status come from one query. The transition itself is
+    a single UPDATE ... WHERE id IN (...) AND booking_status = 'pending', run on
+    the rows locked in the same transaction (see transition_many). Each id gets its own result, so a
+    bad id does not block the rest of the batch.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsProvider]
 
-        if new_status == 'rejected':
-            if hasattr(booking, 'payment'):
-                payment = booking.payment
-                payment_id = payment.id
-                payment.delete()
-                logger.info(f"Payment {payment_id} deleted for rejected booking {booking_id}")
-            booking.room.is_available = True
-            booking.room.save()
-            logger.info(f"Room {booking.room.id} set to available after rejecting booking {booking_id}")
+    def post(self, request):
+        new_status = request.data.get("status")
+        if new_status not in ['approved', 'rejected']:
+            return Response({"error": "Invalid status. Must be 'approved' or 'rejected'."}, status=status.HTTP_400_BAD_REQUEST)
+
+        booking_ids = request.data.get("booking_ids")
+        if not isinstance(booking_ids, list) or not booking_ids:
+            return Response({"error": "booking_ids must be a non-empty list of booking IDs."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(booking_ids) > settings.BOOKING_BULK_MAX_IDS:
+            return Response({"error": f"Too many bookings. At most {settings.BOOKING_BULK_MAX_IDS} can be updated per request."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            booking_ids = list(dict.fromkeys(int(booking_id) for booking_id in booking_ids))
+        except (TypeError, ValueError):
+            return Response({"error": "booking_ids must contain integer booking IDs."}, status=status.HTTP_400_BAD_REQUEST)
+
+        bookings = {
+            booking_id: (owner_id, booking_status)
+            for booking_id, owner_id, booking_status in Booking.objects.filter(id__in=booking_ids)
+            .values_list('id', 'room__provider__user_id', 'booking_status')
+        }
+
+        errors = {}
+        candidates = []
+        for booking_id in booking_ids:
+            if booking_id not in bookings:
+                errors[booking_id] = "Booking not found."
+            elif bookings[booking_id][0] != request.user.id:
+                errors[booking_id] = "You are not authorized to update this booking."
+            elif bookings[booking_id][1] != 'pending':
+                errors[booking_id] = f"Cannot change to {new_status} from {bookings[booking_id][1]}. Booking must be pending."
+            else:
+                candidates.append(booking_id)
 
-        serializer = BookingSerializer(booking)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        with transaction.atomic():
+            locked = transition_many(candidates, 'pending', new_status, actor=request.user, source='provider')
+            updated_ids = {booking_id for booking_id, _, _, _ in locked}
+
+            if new_status == 'rejected' and updated_ids:
+                refund_booking_payments(updated_ids)
+                promote_released(locked)
+
+        for booking_id in candidates:
+            if booking_id not in updated_ids:
+                errors[booking_id] = f"Cannot change to {new_status}. Booking must be pending."
+
+        logger.info(f"Provider {request.user.username} bulk {new_status} {len(updated_ids)} of {len(booking_ids)} bookings")
+        return Response({
+            "updated": len(updated_ids),
+            "results": [
+                {"id": booking_id, "success": True, "booking_status": new_status}
+                if booking_id in updated_ids else
+                {"id": booking_id, "success": False, "error": errors[booking_id]}
+                for booking_id in booking_ids
+            ]
+        }, status=status.HTTP_200_OK)
 
 class CancelBookingView(APIView):
     permission_classes = [permissions.IsAuthenticated, IsStudent]
 
     def post(self, request, booking_id):
         logger.info(f"Attempting to cancel booking {booking_id} by user {request.user.username}")
-        try:
-            booking = Booking.objects.get(id=booking_id)
-        except Booking.DoesNotExist:
-            logger.error(f"Booking {booking_id} not found")
-            raise NotFound("Booking not found.")
-
         try:
             student_profile = StudentProfile.objects.get(user=request.user)
         except StudentProfile.DoesNotExist:
             logger.error(f"No StudentProfile found for user {request.user.username}")
             raise PermissionDenied("No student profile found")
 
-        if booking.student != student_profile:
-            logger.error(f"User {request.user.username} is not authorized to cancel booking {booking_id}")
-            raise PermissionDenied("You are not allowed to cancel this booking.")
-
         with transaction.atomic():
-            if hasattr(booking, 'payment'):
-                payment = booking.payment
-                payment_id = payment.id
-                try:
-                    payment.delete()
-                    logger.info(f"Payment {payment_id} for booking {booking_id} deleted")
-                except Exception as e:
-                    logger.error(f"Failed to delete payment {payment_id} for booking {booking_id}: {str(e)}")
-                    raise
-
-            if booking.booking_status not in ['pending', 'approved', 'confirmed']:
-                logger.warning(f"Booking {booking_id} is already cancelled or rejected, ensuring payment is deleted")
+            try:
+                # Locked before refunding, so a payment the webhook is confirming
+                # either lands first and is refunded here, or waits for the cancel
+                booking = Booking.objects.select_for_update().get(id=booking_id)
+            except Booking.DoesNotExist:
+                logger.error(f"Booking {booking_id} not found")
+                raise NotFound("Booking not found.")
+
+            if booking.student_id != student_profile.id:
+                logger.error(f"User {request.user.username} is not authorized to cancel booking {booking_id}")
+                raise PermissionDenied("You are not allowed to cancel this booking.")
+
+            refund_booking_payments([booking.id])
+
+            try:
+                transition(booking, 'cancelled', actor=request.user, source='student')
+            except InvalidTransition:
+                logger.warning(f"Booking {booking_id} is already cancelled or rejected, ensuring payment is refunded")
             else:
-                booking.booking_status = 'cancelled'
-                booking.save()
                 logger.info(f"Booking {booking_id} cancelled by user {request.user.username}")
 
-            paid_bookings = Booking.objects.filter(
-                room=booking.room,
-                check_in_date__lt=booking.check_out_date,
-                check_out_date__gt=booking.check_in_date,
-                payment__status='success',
-                booking_status__in=['approved', 'confirmed']
-            ).count()
-            logger.info(f"Post-cancellation capacity for room {booking.room.id}: {paid_bookings}/{booking.room.max_occupancy}")
-            if paid_bookings < booking.room.max_occupancy:
-                booking.room.is_available = True
-                booking.room.save()
-                logger.info(f"Room {booking.room.id} set to available after cancellation of booking {booking_id}")
-
-        serializer = BookingSerializer(booking)
-        return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+            promote_waitlist(booking.room, booking.check_in_date, booking.check_out_date)
+
+        return Response(serialize_booking(booking), status=status.HTTP_200_OK)
\ No newline at end of file
@@ -0,0 +1,71 @@
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.models import Booking, ProviderProfile, Room
+from core.services.occupancy import occupancy_by_night, window_stays
+from core.views.booking_view import IsProvider
+from core.views.mixins import ReplicaReadMixin
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderOccupancyCalendarView(ReplicaReadMixin, APIView):
+    """
+    Confirmed guests per room per night for start_date..end_date (inclusive,
+    default: the next 30 nights), next to each room's max_occupancy.
+
+    Three queries whatever the window: provider, rooms, and every confirmed
+    booking overlapping the window, which core/services/occupancy.py spreads
+    over the nights.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsProvider]
+
+    def get(self, request):
+        try:
+            provider = ProviderProfile.objects.get(user=request.user)
+        except ProviderProfile.DoesNotExist:
+            return Response({"error": "Provider profile not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        dates = {}
+        for param in ('start_date', 'end_date'):
+            raw = request.query_params.get(param)
+            try:
+                dates[param] = parse_date(raw) if raw else None
+            except ValueError:
+                dates[param] = None
+            if raw and dates[param] is None:
+                return Response({"error": f"Invalid {param}. Use the YYYY-MM-DD format."}, status=status.HTTP_400_BAD_REQUEST)
+
+        start_date = dates['start_date'] or timezone.localdate()
+        end_date = dates['end_date'] or start_date + timedelta(days=29)
+        if end_date < start_date:
+            return Response({"error": "start_date must be on or before end_date."}, status=status.HTTP_400_BAD_REQUEST)
+        days = (end_date - start_date).days + 1
+        if days > settings.CALENDAR_MAX_DAYS:
+            return Response({"error": f"The calendar can cover at most {settings.CALENDAR_MAX_DAYS} days."}, status=status.HTTP_400_BAD_REQUEST)
+
+        rooms = Room.objects.filter(provider=provider).order_by('id').values_list('id', 'room_number', 'hostel_name', 'max_occupancy')
+        stays = window_stays(Booking.objects.filter(room__provider=provider, booking_status='confirmed'), start_date, days)
+        occupancy = occupancy_by_night(stays, start_date, days)
+
+        empty = [0] * days
+        logger.info(f"Occupancy calendar for provider {provider.id}: {start_date} to {end_date}")
+        return Response({
+            "start_date": start_date,
+            "end_date": end_date,
+            "rooms": [
+                {
+                    "room_id": room_id,
+                    "room_number": room_number,
+                    "hostel_name": hostel_name,
+                    "max_occupancy": max_occupancy,
+                    "occupancy": occupancy.get(room_id, empty),
+                }
+                for room_id, room_number, hostel_name, max_occupancy in rooms
+            ],
+        })
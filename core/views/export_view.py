@@ -0,0 +1,190 @@
+import csv
+import json
+import logging
+from itertools import chain
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils.dateparse import parse_date
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.models import ArchivedBooking, ArchivedPayment, Booking, Payment, ProviderProfile
+from core.services.archive import archive_needed
+from core.views.booking_view import IsProvider
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class Echo:
+    """File-like object whose write() hands the row back instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+class ProviderExportView(APIView):
+    """
+    Base view for provider exports.
+
+    Rows are read with .iterator(chunk_size=...) so the database streams them
+    through a server-side cursor and the response is written one line at a time;
+    nothing is collected into a list, whatever the size of the export.
+
+    Archived rows (see core/services/archive.py) are streamed first, and only
+    when the requested range reaches into the archive.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsProvider]
+    filename = 'export'
+    model = None
+    provider_lookup = None  # path from model to the owning ProviderProfile
+    columns = []
+    status_field = None
+    status_choices = []
+    archive_columns = None  # defaults to columns
+
+    def get_queryset(self, provider, start_date, end_date):
+        """The provider's rows of `model`, narrowed by filter_dates."""
+        queryset = self.model.objects.filter(**{self.provider_lookup: provider})
+        return self.filter_dates(queryset, start_date, end_date)
+
+    def filter_dates(self, queryset, start_date, end_date):
+        return queryset
+
+    def get_archive_queryset(self, provider, start_date, end_date):
+        """Matching archived rows, or None when the range does not reach the archive."""
+        return None
+
+    def get_row(self, values):
+        return values
+
+    def get(self, request):
+        try:
+            provider = ProviderProfile.objects.get(user=request.user)
+        except ProviderProfile.DoesNotExist:
+            return Response({"error": "Provider profile not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        export_format = request.query_params.get('export_format', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            return Response({"error": "Invalid export_format. Must be 'csv' or 'ndjson'."}, status=status.HTTP_400_BAD_REQUEST)
+
+        dates = {}
+        for param in ('start_date', 'end_date'):
+            raw = request.query_params.get(param)
+            dates[param] = parse_date(raw) if raw else None
+            if raw and dates[param] is None:
+                return Response({"error": f"Invalid {param}. Use the YYYY-MM-DD format."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if dates['start_date'] and dates['end_date'] and dates['start_date'] > dates['end_date']:
+            return Response({"error": "start_date must be on or before end_date."}, status=status.HTTP_400_BAD_REQUEST)
+
+        statuses = [s for s in request.query_params.get('status', '').split(',') if s]
+        invalid = [s for s in statuses if s not in self.status_choices]
+        if invalid:
+            return Response({"error": f"Invalid status: {', '.join(invalid)}. Must be one of {', '.join(self.status_choices)}."}, status=status.HTTP_400_BAD_REQUEST)
+
+        sources = [
+            (self.get_archive_queryset(provider, dates['start_date'], dates['end_date']), self.archive_columns or self.columns),
+            (self.get_queryset(provider, dates['start_date'], dates['end_date']), self.columns),
+        ]
+        rows = chain.from_iterable(
+            self.filter_status(queryset, statuses).order_by('id').values_list(*columns).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+            for queryset, columns in sources if queryset is not None
+        )
+        stream = self.stream_csv(rows) if export_format == 'csv' else self.stream_ndjson(rows)
+
+        logger.info(f"Streaming {self.filename} export ({export_format}) for provider {provider.id}")
+        response = StreamingHttpResponse(stream, content_type=EXPORT_FORMATS[export_format])
+        response['Content-Disposition'] = f'attachment; filename="{self.filename}.{export_format}"'
+        return response
+
+    def filter_status(self, queryset, statuses):
+        if statuses:
+            queryset = queryset.filter(**{f"{self.status_field}__in": statuses})
+        return queryset
+
+    def get_header_row(self):
+        return [column.replace('__', '_') for column in self.columns]
+
+    def stream_csv(self, rows):
+        writer = csv.writer(Echo())
+        yield writer.writerow(self.get_header_row())
+        for values in rows:
+            yield writer.writerow(self.get_row(values))
+
+    def stream_ndjson(self, rows):
+        headers = self.get_header_row()
+        for values in rows:
+            yield json.dumps(dict(zip(headers, self.get_row(values))), cls=DjangoJSONEncoder) + "\n"
+
+
+class ProviderBookingExportView(ProviderExportView):
+    filename = 'bookings'
+    model = Booking
+    provider_lookup = 'room__provider'
+    columns = [
+        'id', 'room_id', 'room__hostel_name', 'room__room_number', 'student__user__username',
+        'student__user__email', 'check_in_date', 'check_out_date', 'booking_status',
+        'room__price_per_night', 'created_at', 'total_amount', 'currency',
+    ]
+    # Same positions as columns, from the details copied in at archive time: the
+    # room or student may since have been deleted, and archived bookings keep
+    # the price they were booked at
+    archive_columns = [
+        'id', 'room_id', 'hostel_name', 'room_number', 'student_username',
+        'student_email', 'check_in_date', 'check_out_date', 'booking_status',
+        'price_per_night', 'created_at', 'total_amount', 'currency',
+    ]
+    status_field = 'booking_status'
+    status_choices = [choice for choice, _ in Booking._meta.get_field('booking_status').choices]
+
+    def get_archive_queryset(self, provider, start_date, end_date):
+        if not archive_needed(provider, start_date):
+            return None
+        return self.filter_dates(ArchivedBooking.objects.filter(provider=provider), start_date, end_date)
+
+    def filter_dates(self, queryset, start_date, end_date):
+        # Date range selects every booking whose stay overlaps the window
+        if start_date:
+            queryset = queryset.filter(check_out_date__gt=start_date)
+        if end_date:
+            queryset = queryset.filter(check_in_date__lte=end_date)
+        return queryset
+
+
+class ProviderPaymentExportView(ProviderExportView):
+    filename = 'payments'
+    model = Payment
+    provider_lookup = 'booking__room__provider'
+    columns = [
+        'id', 'booking_id', 'booking__room_id', 'booking__room__hostel_name', 'booking__room__room_number',
+        'booking__student__user__username', 'amount', 'payment_method', 'transaction_id', 'status', 'payment_date',
+        'refunded_at',
+    ]
+    archive_columns = [
+        'id', 'booking_id', 'booking__room_id', 'booking__hostel_name', 'booking__room_number',
+        'booking__student_username', 'amount', 'payment_method', 'transaction_id', 'status', 'payment_date',
+        'refunded_at',
+    ]
+    status_field = 'status'
+    status_choices = [choice for choice, _ in Payment.STATUS_CHOICES]
+
+    def get_archive_queryset(self, provider, start_date, end_date):
+        archived = ArchivedPayment.objects.filter(booking__provider=provider)
+        if start_date and not archived.filter(payment_date__date__gte=start_date).exists():
+            return None
+        return self.filter_dates(archived, start_date, end_date)
+
+    def filter_dates(self, queryset, start_date, end_date):
+        if start_date:
+            queryset = queryset.filter(payment_date__date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(payment_date__date__lte=end_date)
+        return queryset
@@ -1,7 +1,11 @@
 from rest_framework.generics import ListAPIView
-from core.models import Facility
 from core.serializers.facility_serializer import FacilitySerializer
+from core.services.facility_catalogue import get_facilities
+from core.views.mixins import ReplicaReadMixin
 
-class FacilityListView(ListAPIView):
-    queryset = Facility.objects.all()
+class FacilityListView(ReplicaReadMixin, ListAPIView):
+    """Served from the in-process facility catalogue; no database query once it is loaded."""
     serializer_class = FacilitySerializer
+
+    def get_queryset(self):
+        return get_facilities()
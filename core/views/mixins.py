@@ -0,0 +1,24 @@
+from rest_framework.permissions import SAFE_METHODS
+from core.db_router import enable_replica_reads, reset_replica_reads, is_primary_sticky
+
+
+class ReplicaReadMixin:
+    """
+    Serve a read-only view from the replica database.
+
+    Reads switch to the replica after authentication, unless the user wrote
+    recently (sticky primary) or no replica is configured.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        self._replica_token = None
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            if self._replica_token is not None:
+                reset_replica_reads(self._replica_token)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS and not is_primary_sticky(request.user):
+            self._replica_token = enable_replica_reads()
@@ -12,6 +12,31 @@ logger = logging.getLogger('core')
 
 User = get_user_model()
 
+def send_reset_email(user, email, reset_url):
+    """Send the password reset link. Blocking SMTP call, also used by the async view."""
+    send_mail(
+        subject='Password Reset Request',
+        message=f'''
+        Hello {user.username},
+        
+        You requested a password reset for your account.
+        
+        Click the link below to reset your password:
+        {reset_url}
+        
+        This link will expire in 1 hour.
+        
+        If you didn't request this, please ignore this email.
+        
+        Best regards,
+        Hostel Booking Team
+        ''',
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[email],
+        fail_silently=False,
+    )
+
+
 @api_view(['POST'])
 def request_password_reset(request):
     """
@@ -41,27 +66,7 @@ def request_password_reset(request):
     
     # Send email
     try:
-        send_mail(
-            subject='Password Reset Request',
-            message=f'''
-            Hello {user.username},
-            
-            You requested a password reset for your account.
-            
-            Click the link below to reset your password:
-            {reset_url}
-            
-            This link will expire in 1 hour.
-            
-            If you didn't request this, please ignore this email.
-            
-            Best regards,
-            Hostel Booking Team
-            ''',
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[email],
-            fail_silently=False,
-        )
+        send_reset_email(user, email, reset_url)
         logger.debug(f"Password reset link sent to {email}: {reset_url}")
         return Response({
             'message': 'Password reset link has been sent to your email.',
@@ -3,7 +3,9 @@ from django.db import transaction
 from django.views.decorators.csrf import csrf_exempt
 from django.http import HttpResponse
 from django.utils.timezone import now
-from core.models import Booking, Payment
+from core.models import Booking, Payment, Room
+from core.services.booking_state import transition
+from core.services.payments import from_minor_units, room_is_full, to_minor_units
 import hmac
 import hashlib
 from django.conf import settings
@@ -12,8 +14,84 @@ from django_ratelimit.decorators import ratelimit
 
 logger = logging.getLogger(__name__)
 
+# Explicit group so the sync and async webhook views share one rate limit counter
+WEBHOOK_RATELIMIT_GROUP = 'paystack-webhook'
+
+
+def verify_signature(request):
+    paystack_signature = request.headers.get('X-Paystack-Signature', '')
+    secret_key = settings.PAYSTACK_SECRET_KEY
+    computed_signature = hmac.new(
+        secret_key.encode('utf-8'),
+        request.body,
+        hashlib.sha512
+    ).hexdigest()
+    return hmac.compare_digest(paystack_signature, computed_signature)
+
+
+def process_charge_success(data):
+    """Record a successful charge and confirm its booking. Returns the HTTP status to answer Paystack with."""
+    reference = data['reference']
+    # Paystack reports the charge in minor units
+    amount_minor = data['amount']
+    currency = data.get('currency')
+    booking_id = data['metadata'].get('booking_id')
+
+    with transaction.atomic():
+        try:
+            booking = Booking.objects.select_for_update().get(id=booking_id)
+            logger.info(f"Processing payment for booking {booking_id}, status: {booking.booking_status}")
+
+            if booking.booking_status != 'approved':
+                logger.warning(f"Booking {booking_id} is not approved, status: {booking.booking_status}")
+                return 200
+
+            payment = booking.payments.filter(status='success').first()
+            if payment is not None:
+                logger.warning(f"Duplicate payment attempt for booking {booking_id}. Existing payment: id={payment.id}, status={payment.status}")
+                return 200
+
+            if type(amount_minor) is not int or amount_minor != to_minor_units(booking.total_amount):
+                logger.warning(f"Payment amount {amount_minor} (minor units) does not match booking total {booking.total_amount}")
+                return 400
+            if currency and currency != booking.currency:
+                logger.warning(f"Payment currency {currency} does not match booking currency {booking.currency}")
+                return 400
+
+            amount = from_minor_units(amount_minor)
+
+            # The place may have been taken since the payment was started (a waitlist
+            # promotion, another payment); the room lock serialises this with them
+            booking.room = Room.objects.select_for_update().get(id=booking.room_id)
+            full = room_is_full(booking)
+
+            # Earlier refunded payments of the booking are left untouched
+            Payment.objects.create(
+                booking=booking,
+                amount=amount,
+                payment_method='card' if data['channel'] == 'card' else 'momo',
+                transaction_id=reference,
+                status='refunded' if full else 'success',
+                payment_date=now(),
+                refunded_at=now() if full else None,
+            )
+            if full:
+                logger.warning(f"Room {booking.room_id} is full for booking {booking_id}; payment {reference} marked for refund")
+                return 200
+
+            transition(booking, 'confirmed', source='paystack')
+
+            logger.info(f"Booking {booking_id} confirmed with payment")
+
+        except Booking.DoesNotExist:
+            logger.error(f"Booking {booking_id} not found")
+            return 404
+
+    return 200
+
+
 @csrf_exempt
-@ratelimit(key='ip', rate='10/m', method='POST', block=True)
+@ratelimit(group=WEBHOOK_RATELIMIT_GROUP, key='ip', rate='10/m', method='POST', block=True)
 def paystack_webhook(request):
     was_limited = getattr(request, 'limited', False)
     if was_limited:
@@ -24,14 +102,7 @@ def paystack_webhook(request):
         logger.warning(f"Invalid method {request.method} for webhook")
         return HttpResponse(status=405)
 
-    paystack_signature = request.headers.get('X-Paystack-Signature')
-    secret_key = settings.PAYSTACK_SECRET_KEY
-    computed_signature = hmac.new(
-        secret_key.encode('utf-8'),
-        request.body,
-        hashlib.sha512
-    ).hexdigest()
-    if not hmac.compare_digest(paystack_signature, computed_signature):
+    if not verify_signature(request):
         logger.warning("Invalid Paystack signature")
         return HttpResponse(status=400)
 
@@ -41,69 +112,6 @@ def paystack_webhook(request):
     event = payload.get('event')
 
     if event == 'charge.success':
-        data = payload['data']
-        reference = data['reference']
-        amount = data['amount'] / 100
-        booking_id = data['metadata'].get('booking_id')
-
-        with transaction.atomic():
-            try:
-                booking = Booking.objects.select_for_update().get(id=booking_id)
-                logger.info(f"Processing payment for booking {booking_id}, status: {booking.booking_status}")
-
-                if booking.booking_status != 'approved':
-                    logger.warning(f"Booking {booking_id} is not approved, status: {booking.booking_status}")
-                    return HttpResponse(status=200)
-
-                if hasattr(booking, 'payment') and booking.payment.status != 'refunded':
-                    payment = booking.payment
-                    logger.warning(f"Duplicate payment attempt for booking {booking_id}. Existing payment: id={payment.id}, status={payment.status}")
-                    return HttpResponse(status=200)
-
-                if abs(float(amount) - float(booking.total_amount)) > 0.01:
-                    logger.warning(f"Payment amount {amount} does not match booking total {booking.total_amount}")
-                    return HttpResponse(status=400)
-
-                if hasattr(booking, 'payment') and booking.payment.status == 'refunded':
-                    payment = booking.payment
-                    payment_id = payment.id
-                    payment.delete()
-                    logger.info(f"Deleted refunded payment {payment_id} for booking {booking_id}")
-
-                Payment.objects.create(
-                    booking=booking,
-                    amount=amount,
-                    payment_method='card' if data['channel'] == 'card' else 'momo',
-                    transaction_id=reference,
-                    status='success',
-                    payment_date=now()
-                )
-
-                booking.booking_status = 'confirmed'
-                booking.save()
-
-                paid_bookings = Booking.objects.filter(
-                    room=booking.room,
-                    check_in_date__lt=booking.check_out_date,
-                    check_out_date__gt=booking.check_in_date,
-                    payment__status='success',
-                    booking_status__in=['approved', 'confirmed']
-                ).count()
-                logger.info(f"Checking capacity for room {booking.room.id}: {paid_bookings}/{booking.room.max_occupancy}")
-
-                if paid_bookings >= booking.room.max_occupancy:
-                    booking.room.is_available = False
-                    booking.room.save()
-                    logger.info(f"Room {booking.room.id} set to unavailable after confirming booking {booking_id}")
-                else:
-                    booking.room.is_available = True
-                    booking.room.save()
-                    logger.info(f"Room {booking.room.id} remains available after confirming booking {booking_id}")
-
-                logger.info(f"Booking {booking_id} confirmed with payment")
-
-            except Booking.DoesNotExist:
-                logger.error(f"Booking {booking_id} not found")
-                return HttpResponse(status=404)
-
-    return HttpResponse(status=200)
\ No newline at end of file
+        return HttpResponse(status=process_charge_success(payload['data']))
+
+    return HttpResponse(status=200)
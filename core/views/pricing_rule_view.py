@@ -0,0 +1,33 @@
+import logging
+from rest_framework import generics, permissions
+from core.models import PricingRule
+from core.serializers.pricing_rule_serializer import PricingRuleSerializer
+from core.views.room_bulk_view import get_provider
+from core.views.room_view import IsProvider
+
+logger = logging.getLogger(__name__)
+
+
+class PricingRuleListCreateView(generics.ListCreateAPIView):
+    """
+    The provider's pricing rules (seasonal rates, length-of-stay discounts and
+    nightly price overrides, see core/services/pricing.py). They apply to
+    bookings made after the change; existing bookings keep their quoted total.
+    """
+    serializer_class = PricingRuleSerializer
+    permission_classes = [permissions.IsAuthenticated, IsProvider]
+
+    def get_queryset(self):
+        return PricingRule.objects.filter(provider__user=self.request.user).order_by('kind', '-priority', 'id')
+
+    def perform_create(self, serializer):
+        rule = serializer.save(provider=get_provider(self.request.user))
+        logger.info(f"Provider {rule.provider_id} created pricing rule {rule.id} ({rule.kind})")
+
+
+class PricingRuleDetailView(generics.RetrieveUpdateDestroyAPIView):
+    serializer_class = PricingRuleSerializer
+    permission_classes = [permissions.IsAuthenticated, IsProvider]
+
+    def get_queryset(self):
+        return PricingRule.objects.filter(provider__user=self.request.user)
@@ -1,11 +1,14 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.db.models import Sum, Count
-from core.models import Room, Booking, Payment, ProviderProfile
+from datetime import timedelta
+from django.db.models import Sum, Count, Q
+from django.utils import timezone
+from core.models import ArchivedBooking, ArchivedPayment, Room, Booking, BookingTransition, Payment, ProviderProfile
+from core.views.mixins import ReplicaReadMixin
 
 
-class ProviderDashboardSummaryView(APIView):
+class ProviderDashboardSummaryView(ReplicaReadMixin, APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -27,19 +30,43 @@ class ProviderDashboardSummaryView(APIView):
             "confirmed": 0,
             "cancelled": 0,
         }
-        for entry in booking_counts:
+        # Archived stays are finished, so they only add to the historical counts and revenue
+        archived_counts = ArchivedBooking.objects.filter(provider=provider_profile).values('booking_status').annotate(count=Count('id'))
+        for entry in [*booking_counts, *archived_counts]:
             status = entry['booking_status']
             count = entry['count']
-            booking_stats[status] = count
+            booking_stats[status] = booking_stats.get(status, 0) + count
 
         # Total confirmed revenue
         confirmed_bookings = bookings.filter(booking_status='confirmed')
-        total_revenue = Payment.objects.filter(booking__in=confirmed_bookings).aggregate(
+        total_revenue = Payment.objects.filter(booking__in=confirmed_bookings, status='success').aggregate(
             total=Sum('amount')
         )['total'] or 0
+        total_revenue += ArchivedPayment.objects.filter(
+            booking__provider=provider_profile, booking__booking_status='confirmed', status='success'
+        ).aggregate(total=Sum('amount'))['total'] or 0
+
+        # Conversion/cancellation rates from the transition log (index on provider, to_status, created_at)
+        transitions = BookingTransition.objects.filter(provider=provider_profile)
+        days = request.query_params.get('days')
+        if days:
+            try:
+                transitions = transitions.filter(created_at__gte=timezone.now() - timedelta(days=int(days)))
+            except ValueError:
+                return Response({"error": "days must be a whole number."}, status=400)
+        counts = transitions.aggregate(
+            created=Count('id', filter=Q(from_status='')),
+            confirmed=Count('id', filter=Q(to_status='confirmed')),
+            cancelled=Count('id', filter=Q(to_status='cancelled')),
+        )
 
         return Response({
             "total_rooms": total_rooms,
             "total_revenue": float(total_revenue),
-            "bookings": booking_stats
+            "bookings": booking_stats,
+            "rates": {
+                **counts,
+                "conversion_rate": round(counts['confirmed'] / counts['created'], 4) if counts['created'] else 0.0,
+                "cancellation_rate": round(counts['cancelled'] / counts['created'], 4) if counts['created'] else 0.0,
+            }
         })
@@ -1,10 +1,13 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from core.models import Room, Booking, Payment, ProviderProfile
-from django.db.models import Sum
+from decimal import Decimal
+from core.models import ArchivedPayment, Room, ProviderProfile
+from django.db.models import DecimalField, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from core.views.mixins import ReplicaReadMixin
 
-class ProviderRevenueView(APIView):
+class ProviderRevenueView(ReplicaReadMixin, APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
@@ -17,24 +20,37 @@ class ProviderRevenueView(APIView):
         except ProviderProfile.DoesNotExist:
             return Response({"error": "Provider profile not found."}, status=404)
 
-        rooms = Room.objects.filter(provider=provider)
+        # One query: successful payments on confirmed bookings, summed per room
+        rooms = Room.objects.filter(provider=provider).annotate(
+            total_earned=Coalesce(
+                Sum(
+                    'bookings__payment__amount',
+                    filter=Q(bookings__booking_status='confirmed', bookings__payment__status='success'),
+                ),
+                Value(Decimal('0')),
+                output_field=DecimalField(max_digits=12, decimal_places=2),
+            )
+        ).order_by('id')
+
+        # All-time totals include archived stays (one grouped query on the archive)
+        archived = dict(
+            ArchivedPayment.objects.filter(
+                booking__provider=provider, booking__booking_status='confirmed', status='success'
+            ).values_list('booking__room_id').annotate(total=Sum('amount')).order_by()
+        )
 
         room_data = []
         total_revenue = 0
 
         for room in rooms:
-            # Only confirmed bookings matter for revenue
-            confirmed_bookings = Booking.objects.filter(room=room, booking_status='confirmed')
-            room_payments = Payment.objects.filter(booking__in=confirmed_bookings)
-            room_total = room_payments.aggregate(total=Sum('amount'))['total'] or 0
-
-            total_revenue += room_total
+            room.total_earned += archived.get(room.id, 0)
+            total_revenue += room.total_earned
 
             room_data.append({
                 "room_id": room.id,
                 "room_number": room.room_number,
                 "hostel_name": room.hostel_name,
-                "total_earned": float(room_total)
+                "total_earned": float(room.total_earned)
             })
 
         return Response({
@@ -0,0 +1,160 @@
+import logging
+from django.conf import settings
+from django.db import transaction
+from rest_framework import permissions, status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.parsers import JSONParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.models import Room, ProviderProfile
+from core.parsers import CSVParser
+from core.serializers.room_bulk_serializer import RoomBulkCreateSerializer, RoomBulkUpdateSerializer
+from core.services.facets import invalidate_facets
+from core.services.facility_catalogue import facilities_by_id
+from core.views.room_view import IsProvider
+
+logger = logging.getLogger(__name__)
+
+
+def get_provider(user):
+    try:
+        return ProviderProfile.objects.get(user=user)
+    except ProviderProfile.DoesNotExist:
+        raise PermissionDenied("No provider profile found for this user")
+
+
+def get_rows(request):
+    """Return the request body as a list of rows, or an error Response."""
+    rows = request.data
+    if not isinstance(rows, list) or not rows:
+        return None, Response({"error": "Send a non-empty JSON array or CSV file of rooms."}, status=status.HTTP_400_BAD_REQUEST)
+    if len(rows) > settings.ROOM_BULK_MAX_ROWS:
+        return None, Response({"error": f"Too many rows. A single request can contain at most {settings.ROOM_BULK_MAX_ROWS} rooms."}, status=status.HTTP_400_BAD_REQUEST)
+    return rows, None
+
+
+class RoomBulkCreateView(APIView):
+    """
+    Create many rooms in one request from a JSON array or a CSV file.
+
+    Every row is validated before anything is written; if any row fails the
+    whole batch is rejected with per-row errors. Valid batches are inserted with
+    one bulk_create for the rooms and one for the room/facility links.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsProvider]
+    parser_classes = [JSONParser, CSVParser]
+
+    def post(self, request):
+        provider = get_provider(request.user)
+        rows, error = get_rows(request)
+        if error:
+            return error
+
+        errors = []
+        valid_rows = []
+        for index, row in enumerate(rows):
+            serializer = RoomBulkCreateSerializer(data=row)
+            if serializer.is_valid():
+                valid_rows.append((index, serializer.validated_data))
+            else:
+                errors.append({"row": index, "errors": serializer.errors})
+
+        # Facility ids are checked against the in-process facility catalogue
+        known_ids = facilities_by_id().keys()
+        for index, data in valid_rows:
+            unknown = sorted(set(data.get('facilities', [])) - known_ids)
+            if unknown:
+                errors.append({"row": index, "errors": {"facilities": [f"Unknown facility ids: {unknown}"]}})
+
+        if errors:
+            errors.sort(key=lambda error: error['row'])
+            return Response({
+                "error": "Bulk room creation failed. No rooms were created.",
+                "details": errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        rooms = []
+        facility_ids = []
+        for _, data in valid_rows:
+            data = dict(data)
+            facility_ids.append(set(data.pop('facilities', [])))
+            rooms.append(Room(provider=provider, **data))
+
+        Through = Room.facilities.through
+        with transaction.atomic():
+            rooms = Room.objects.bulk_create(rooms, batch_size=settings.ROOM_BULK_BATCH_SIZE)
+            Through.objects.bulk_create(
+                [Through(room_id=room.id, facility_id=fid) for room, fids in zip(rooms, facility_ids) for fid in fids],
+                batch_size=settings.ROOM_BULK_BATCH_SIZE
+            )
+        # bulk_create sends no post_save signals
+        invalidate_facets()
+
+        logger.info(f"Provider {provider.id} bulk created {len(rooms)} rooms")
+        return Response({
+            "message": f"{len(rooms)} rooms created successfully.",
+            "created": [
+                {"row": index, "id": room.id, "hostel_name": room.hostel_name, "room_number": room.room_number}
+                for (index, _), room in zip(valid_rows, rooms)
+            ]
+        }, status=status.HTTP_201_CREATED)
+
+
+class RoomBulkUpdateView(APIView):
+    """
+    Update price and/or listing status of many rooms in one request.
+
+    Ownership is checked with a single query and the changes are written with
+    bulk_update. Like bulk creation, the batch is all-or-nothing.
+    """
+    permission_classes = [permissions.IsAuthenticated, IsProvider]
+    parser_classes = [JSONParser, CSVParser]
+
+    def post(self, request):
+        provider = get_provider(request.user)
+        rows, error = get_rows(request)
+        if error:
+            return error
+
+        errors = []
+        updates = {}
+        for index, row in enumerate(rows):
+            serializer = RoomBulkUpdateSerializer(data=row)
+            if not serializer.is_valid():
+                errors.append({"row": index, "errors": serializer.errors})
+            elif serializer.validated_data['id'] in updates:
+                errors.append({"row": index, "errors": {"id": ["Room appears more than once in this request."]}})
+            else:
+                updates[serializer.validated_data['id']] = (index, serializer.validated_data)
+
+        rooms = Room.objects.filter(provider=provider, id__in=updates.keys()).in_bulk()
+        for room_id, (index, _) in updates.items():
+            if room_id not in rooms:
+                errors.append({"row": index, "errors": {"id": ["Room not found or you do not have permission to modify it."]}})
+
+        if errors:
+            errors.sort(key=lambda error: error['row'])
+            return Response({
+                "error": "Bulk room update failed. No rooms were updated.",
+                "details": errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        fields = set()
+        for room_id, (_, data) in updates.items():
+            for field in ('price_per_night', 'is_listed'):
+                if field in data:
+                    setattr(rooms[room_id], field, data[field])
+                    fields.add(field)
+
+        with transaction.atomic():
+            Room.objects.bulk_update(rooms.values(), sorted(fields), batch_size=settings.ROOM_BULK_BATCH_SIZE)
+        invalidate_facets()
+
+        logger.info(f"Provider {provider.id} bulk updated {len(rooms)} rooms ({', '.join(sorted(fields))})")
+        return Response({
+            "message": f"{len(rooms)} rooms updated successfully.",
+            "updated": [
+                {"row": index, "id": room_id, "price_per_night": rooms[room_id].price_per_night, "is_listed": rooms[room_id].is_listed}
+                for room_id, (index, _) in updates.items()
+            ]
+        }, status=status.HTTP_200_OK)
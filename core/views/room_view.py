@@ -1,12 +1,20 @@
-from rest_framework.exceptions import PermissionDenied, NotFound
+from rest_framework.exceptions import PermissionDenied, NotFound, ValidationError
 from rest_framework import generics, permissions, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from core.models import Room, ProviderProfile
-from core.serializers.room_serializer import RoomSerializer
-from django_filters.rest_framework import DjangoFilterBackend, FilterSet, NumberFilter, CharFilter, BooleanFilter
+from core.models import Facility, Room, ProviderProfile
+from core.serializers.room_serializer import RoomSerializer, RoomListSerializer
+from django_filters.rest_framework import DjangoFilterBackend, FilterSet, NumberFilter, CharFilter, BooleanFilter, ModelMultipleChoiceFilter
+from django.conf import settings
+from django.db.models import Count
+from datetime import timedelta
+from django.utils.dateparse import parse_date
 from rest_framework.filters import SearchFilter
 from rest_framework.parsers import MultiPartParser, FormParser
+from core.services.facets import get_facets
+from core.services.geo import in_box, within_radius
+from core.services.pricing import quote_rooms
+from core.views.mixins import ReplicaReadMixin
 
 class IsProvider(permissions.BasePermission):
     def has_permission(self, request, view):
@@ -17,11 +25,108 @@ class RoomFilter(FilterSet):
     price_max = NumberFilter(field_name='price_per_night', lookup_expr='lte')
     location = CharFilter(field_name='location', lookup_expr='icontains')
     hostel_name = CharFilter(field_name='hostel_name', lookup_expr='icontains')
+    # Computed by Room.objects.annotate_availability() for the requested dates
     is_available = BooleanFilter(field_name='is_available')
+    is_listed = BooleanFilter(field_name='is_listed')
+    # Rooms with every selected facility (?facilities=1&facilities=3)
+    facilities = ModelMultipleChoiceFilter(queryset=Facility.objects.all(), method='filter_facilities')
+    # Distance search: rooms within radius_km of (lat, lng), nearest first.
+    # The three are applied together in filter_queryset.
+    lat = NumberFilter(method='filter_near')
+    lng = NumberFilter(method='filter_near')
+    radius_km = NumberFilter(method='filter_near')
+    # south,west,north,east in degrees
+    bbox = CharFilter(method='filter_bbox')
 
     class Meta:
         model = Room
-        fields = ['price_min', 'price_max', 'location', 'hostel_name', 'is_available']
+        fields = ['price_min', 'price_max', 'location', 'hostel_name', 'is_available', 'is_listed',
+                  'facilities', 'lat', 'lng', 'radius_km', 'bbox']
+
+    def filter_facilities(self, queryset, name, value):
+        """
+        One grouped subquery over the room/facility links: rooms whose links to
+        the selected facilities number as many as were selected. Join-per-facility
+        filtering would add a join for every selected facility.
+        """
+        if not value:
+            return queryset
+        facility_ids = {facility.id for facility in value}
+        having_all = (
+            Room.facilities.through.objects.filter(facility_id__in=facility_ids)
+            .values('room_id')
+            .annotate(matched=Count('facility_id'))
+            .filter(matched=len(facility_ids))
+            .values('room_id')
+        )
+        return queryset.filter(id__in=having_all)
+
+    def filter_near(self, queryset, name, value):
+        return queryset
+
+    def filter_bbox(self, queryset, name, value):
+        try:
+            south, west, north, east = (float(part) for part in value.split(','))
+        except ValueError:
+            raise ValidationError({"bbox": "Enter south,west,north,east in degrees."})
+        if not (-90 <= south <= north <= 90 and -180 <= west <= 180 and -180 <= east <= 180):
+            raise ValidationError({"bbox": "Coordinates are out of range."})
+        # A box whose west edge is east of its east edge crosses the antimeridian
+        lng_ranges = [(west, east)] if west <= east else [(west, 180), (-180, east)]
+        return queryset.filter(in_box(south, north, lng_ranges))
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        lat, lng, radius_km = (self.form.cleaned_data.get(name) for name in ('lat', 'lng', 'radius_km'))
+        if lat is None and lng is None and radius_km is None:
+            return queryset
+        if lat is None or lng is None:
+            raise ValidationError({"lat": "lat and lng are both required for a distance search."})
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+            raise ValidationError({"lat": "lat must be between -90 and 90 and lng between -180 and 180."})
+        if radius_km is None:
+            radius_km = settings.ROOM_SEARCH_DEFAULT_RADIUS_KM
+        if not 0 < radius_km <= settings.ROOM_SEARCH_MAX_RADIUS_KM:
+            raise ValidationError({"radius_km": f"radius_km must be above 0 and at most {settings.ROOM_SEARCH_MAX_RADIUS_KM:g}."})
+        return within_radius(queryset, float(lat), float(lng), float(radius_km))
+
+def get_availability_window(query_params):
+    """
+    Dates that room availability is computed for: the optional check_in and
+    check_out query params (YYYY-MM-DD). check_out defaults to the night after
+    check_in, and both default to tonight.
+    """
+    dates = {}
+    for name in ('check_in', 'check_out'):
+        value = query_params.get(name)
+        if value:
+            try:
+                dates[name] = parse_date(value)
+            except ValueError:
+                dates[name] = None
+            if dates[name] is None:
+                raise ValidationError({name: "Enter a valid date in YYYY-MM-DD format."})
+    if 'check_out' in dates and 'check_in' not in dates:
+        raise ValidationError({"check_in": "check_in is required when check_out is given."})
+    if 'check_out' in dates and dates['check_out'] <= dates['check_in']:
+        raise ValidationError({"check_out": "Check-out date must be after check-in date."})
+    return dates.get('check_in'), dates.get('check_out')
+
+# Query params that change which rooms are listed, and so the facet counts
+FACET_PARAMS = [*RoomFilter.base_filters, 'search', 'check_in', 'check_out']
+
+def wants_facets(query_params):
+    return query_params.get('facets', '').lower() in ('true', '1')
+
+def search_quotes(rooms, query_params):
+    """{room id: stay price} when the search has a check_in date, priced in one pass; otherwise {}."""
+    check_in, check_out = get_availability_window(query_params)
+    if check_in is None:
+        return {}
+    return quote_rooms(rooms, check_in, check_out or check_in + timedelta(days=1))
+
+def rooms_with_availability(request):
+    return Room.objects.annotate_availability(*get_availability_window(request.query_params))
 
 class RoomCreateView(generics.CreateAPIView):
     queryset = Room.objects.all()
@@ -37,7 +142,7 @@ class RoomCreateView(generics.CreateAPIView):
         serializer.save(provider=provider)
 
 class MyRoomsView(generics.ListAPIView):
-    serializer_class = RoomSerializer
+    serializer_class = RoomListSerializer
     permission_classes = [permissions.IsAuthenticated, IsProvider]
 
     def get_queryset(self):
@@ -45,16 +150,35 @@ class MyRoomsView(generics.ListAPIView):
             provider = ProviderProfile.objects.get(user=self.request.user)
         except ProviderProfile.DoesNotExist:
             raise PermissionDenied("No provider profile found")
-        return Room.objects.filter(provider=provider)
+        return rooms_with_availability(self.request).filter(provider=provider).prefetch_related('facilities')
 
-class RoomListView(generics.ListAPIView):
-    queryset = Room.objects.all()
-    serializer_class = RoomSerializer
+class RoomListView(ReplicaReadMixin, generics.ListAPIView):
+    serializer_class = RoomListSerializer
     permission_classes = []  # public
     filter_backends = [DjangoFilterBackend, SearchFilter]
     filterset_class = RoomFilter
     search_fields = ['hostel_name', 'location', 'description']
 
+    def get_queryset(self):
+        return rooms_with_availability(self.request).prefetch_related('facilities')
+
+    def list(self, request, *args, **kwargs):
+        """
+        With check_in (and check_out), each room carries quoted_total for the stay.
+        With ?facets=true, also return facility and price bucket counts for the filtered rooms.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        rooms = list(queryset)
+        results = self.get_serializer(rooms, many=True, context={
+            **self.get_serializer_context(), 'quotes': search_quotes(rooms, request.query_params),
+        }).data
+        if not wants_facets(request.query_params):
+            return Response(results)
+        return Response({
+            "results": results,
+            "facets": get_facets(queryset, request.query_params, FACET_PARAMS),
+        })
+
 class ToggleRoomAvailabilityView(APIView):
     permission_classes = [permissions.IsAuthenticated, IsProvider]
 
@@ -67,17 +191,21 @@ class ToggleRoomAvailabilityView(APIView):
         if room.provider.user != request.user:
             raise PermissionDenied("You do not have permission to modify this room")
 
-        room.is_available = not room.is_available
-        room.save()
+        room.is_listed = not room.is_listed
+        room.save(update_fields=['is_listed'])
 
+        room = Room.objects.annotate_availability().get(id=room.id)
         return Response({
             "id": room.id,
             "room_number": room.room_number,
+            "is_listed": room.is_listed,
             "is_available": room.is_available
         }, status=status.HTTP_200_OK)
     
 
-class RoomDetailView(generics.RetrieveAPIView):
-    queryset = Room.objects.all()
+class RoomDetailView(ReplicaReadMixin, generics.RetrieveAPIView):
     serializer_class = RoomSerializer
+
+    def get_queryset(self):
+        return rooms_with_availability(self.request)
     
\ No newline at end of file
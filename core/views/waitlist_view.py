@@ -0,0 +1,59 @@
+import logging
+from rest_framework import generics, permissions, status
+from rest_framework.exceptions import PermissionDenied, NotFound
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from core.models import WaitlistEntry
+from core.serializers.waitlist_serializer import WaitlistEntrySerializer
+from core.services.waitlist import with_queue_position
+from core.views.booking_view import IsStudent
+
+logger = logging.getLogger(__name__)
+
+
+class WaitlistJoinView(generics.CreateAPIView):
+    """
+    Join the waitlist for a full room. When a place frees up for dates that
+    cover the entry, a pending booking is created for the student automatically
+    (see core/services/waitlist.py), so there is no need to retry booking.
+    """
+    queryset = WaitlistEntry.objects.all()
+    serializer_class = WaitlistEntrySerializer
+    permission_classes = [permissions.IsAuthenticated, IsStudent]
+
+    def perform_create(self, serializer):
+        entry = serializer.save()
+        # Reload with its queue position for the response
+        serializer.instance = with_queue_position(WaitlistEntry.objects.select_related('room')).get(id=entry.id)
+        logger.info(f"User {self.request.user.username} joined waitlist for room {entry.room_id} as entry {entry.id}")
+
+
+class MyWaitlistView(generics.ListAPIView):
+    serializer_class = WaitlistEntrySerializer
+    permission_classes = [permissions.IsAuthenticated, IsStudent]
+
+    def get_queryset(self):
+        entries = WaitlistEntry.objects.filter(student__user=self.request.user).select_related('room')
+        return with_queue_position(entries).order_by('-created_at')
+
+
+class CancelWaitlistView(APIView):
+    permission_classes = [permissions.IsAuthenticated, IsStudent]
+
+    def post(self, request, entry_id):
+        try:
+            entry = WaitlistEntry.objects.select_related('student__user', 'room').get(id=entry_id)
+        except WaitlistEntry.DoesNotExist:
+            raise NotFound("Waitlist entry not found.")
+
+        if entry.student.user != request.user:
+            raise PermissionDenied("You are not allowed to cancel this waitlist entry.")
+
+        if entry.status != 'waiting':
+            return Response({"error": f"Cannot cancel a waitlist entry that is {entry.status}."}, status=status.HTTP_400_BAD_REQUEST)
+
+        entry.status = 'cancelled'
+        entry.save(update_fields=['status'])
+        logger.info(f"Waitlist entry {entry_id} cancelled by user {request.user.username}")
+
+        return Response(WaitlistEntrySerializer(entry).data, status=status.HTTP_200_OK)
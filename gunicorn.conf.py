@@ -0,0 +1,40 @@
+# gunicorn.conf.py
+"""
+Gunicorn settings, picked up automatically by `gunicorn` when run from the project root.
+
+    SERVER_MODE=wsgi (default)  sync workers running hostel_booking.wsgi
+    SERVER_MODE=asgi            uvicorn workers running hostel_booking.asgi; set
+                                ASYNC_VIEWS=True as well so the I/O-bound endpoints
+                                use the async views
+
+Start command:  gunicorn
+"""
+import multiprocessing
+import os
+from decouple import config
+
+SERVER_MODE = os.environ.get('SERVER_MODE', 'wsgi')
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
+
+if SERVER_MODE == 'asgi':
+    wsgi_app = 'hostel_booking.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'hostel_booking.wsgi:application'
+    worker_class = 'sync'
+
+
+def when_ready(server):
+    # Version keys and sticky-primary markers live in the Django cache; a per-process
+    # cache keeps them from reaching the other workers
+    backend = config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache')
+    if server.cfg.workers > 1 and backend.endswith('LocMemCache'):
+        server.log.warning(
+            "CACHE_BACKEND is per-process (LocMemCache) with %s workers: facility and facet changes reach "
+            "other workers only after FACILITY_CATALOGUE_MAX_AGE / ROOM_FACET_CACHE_SECONDS, and replica "
+            "stickiness is per worker. Set CACHE_BACKEND to a shared cache such as Redis.",
+            server.cfg.workers,
+        )
@@ -1,11 +1,7 @@
 import os
 from pathlib import Path
-from django.urls import path
-from decouple import config
+from decouple import Csv, config
 import dj_database_url
-import cloudinary
-import cloudinary.uploader
-import cloudinary.api
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -21,17 +17,78 @@ ALLOWED_HOSTS = [
 
 ALLOWED_HOSTS = [host for host in ALLOWED_HOSTS if host]
 
+# Connections are kept open between requests (DB_CONN_MAX_AGE seconds) and
+# health-checked before reuse, so requests don't pay for a new TLS handshake.
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=60, cast=int)
+
 DATABASES = {
-    'default': dj_database_url.parse(config('DATABASE_URL'))
+    'default': dj_database_url.parse(
+        config('DATABASE_URL'),
+        conn_max_age=DB_CONN_MAX_AGE,
+        conn_health_checks=True,
+    )
 }
 
+# Optional read replica. Read-only catalogue and reporting views are served from it
+# (see core/db_router.py); everything else, and any user who has just written,
+# stays on the primary for REPLICA_STICKY_SECONDS.
+DATABASE_REPLICA_URL = config('DATABASE_REPLICA_URL', default='')
+if DATABASE_REPLICA_URL:
+    DATABASES['replica'] = dj_database_url.parse(
+        DATABASE_REPLICA_URL,
+        conn_max_age=DB_CONN_MAX_AGE,
+        conn_health_checks=True,
+    )
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+
+DATABASE_ROUTERS = ['core.db_router.PrimaryReplicaRouter']
+REPLICA_STICKY_SECONDS = config('REPLICA_STICKY_SECONDS', default=10, cast=int)
+
+# Optional psycopg 3 connection pool (one pool per worker process). Django does not
+# allow persistent connections together with the pool, so CONN_MAX_AGE is reset to 0.
+DB_POOL = config('DB_POOL', default=False, cast=bool)
+for database in DATABASES.values():
+    if DB_POOL and database['ENGINE'] == 'django.db.backends.postgresql':
+        database['CONN_MAX_AGE'] = 0
+        database.setdefault('OPTIONS', {})['pool'] = {
+            'min_size': config('DB_POOL_MIN_SIZE', default=2, cast=int),
+            'max_size': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+            'timeout': config('DB_POOL_TIMEOUT', default=10, cast=int),
+        }
+
+# Shared cache (e.g. django.core.cache.backends.redis.RedisCache) so state such as
+# sticky-primary markers is visible to every worker. Defaults to per-process memory.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='hostel-booking'),
+    }
+}
+
+# Seconds a worker serves its in-memory facility catalogue before reloading it even
+# without a version bump; the bound on staleness when the cache is not shared
+FACILITY_CATALOGUE_MAX_AGE = config('FACILITY_CATALOGUE_MAX_AGE', default=60, cast=int)
+
 # Cloudinary Configuration
-cloudinary.config(
-    cloud_name=config('CLOUDINARY_CLOUD_NAME'),
-    api_key=config('CLOUDINARY_API_KEY'),
-    api_secret=config('CLOUDINARY_API_SECRET'),
-    secure=True
-)
+# Read by the cloudinary SDK the first time it is used, so nothing Cloudinary-related
+# is imported or configured while settings load.
+CLOUDINARY = {
+    'cloud_name': config('CLOUDINARY_CLOUD_NAME'),
+    'api_key': config('CLOUDINARY_API_KEY'),
+    'api_secret': config('CLOUDINARY_API_SECRET'),
+    'secure': True,
+}
+
+# Same credentials for django-cloudinary-storage (used by ROOM_IMAGE_STORAGE)
+CLOUDINARY_STORAGE = {
+    'CLOUD_NAME': CLOUDINARY['cloud_name'],
+    'API_KEY': CLOUDINARY['api_key'],
+    'API_SECRET': CLOUDINARY['api_secret'],
+    'SECURE': True,
+}
+
+# Swagger/ReDoc docs. The schema view is only built on the first docs request.
+ENABLE_SWAGGER = config('ENABLE_SWAGGER', default=True, cast=bool)
 
 INSTALLED_APPS = [
     'django.contrib.admin',
@@ -47,9 +104,11 @@ INSTALLED_APPS = [
     'django_filters',
     'core',
     'corsheaders',
-    'drf_yasg',
 ]
 
+if ENABLE_SWAGGER:
+    INSTALLED_APPS.append('drf_yasg')
+
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -58,6 +117,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.StickyPrimaryMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -82,6 +142,11 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'hostel_booking.wsgi.application'
 
+# Serve payment initiation, the Paystack webhook, password reset requests and room
+# search with the async views in core/views/async_views.py. Only useful under ASGI
+# (SERVER_MODE=asgi in gunicorn.conf.py); under WSGI they would run one at a time.
+ASYNC_VIEWS = config('ASYNC_VIEWS', default=False, cast=bool)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -179,8 +244,67 @@ LOGGING = {
 }
 
 PAYSTACK_SECRET_KEY = config('PAYSTACK_SECRET_KEY')
+PAYSTACK_API_URL = config('PAYSTACK_API_URL', default='https://api.paystack.co')
+# ISO 4217 code stored on new bookings and sent to Paystack (amounts go in its minor unit)
+BOOKING_CURRENCY = config('BOOKING_CURRENCY', default='GHS')
 FRONTEND_URL = config('FRONTEND_URL')
 
+# Maximum number of rooms accepted by the bulk create/update endpoints
+ROOM_BULK_MAX_ROWS = config('ROOM_BULK_MAX_ROWS', default=500, cast=int)
+# Rows per INSERT/UPDATE statement written by the bulk room endpoints
+ROOM_BULK_BATCH_SIZE = config('ROOM_BULK_BATCH_SIZE', default=500, cast=int)
+
+# Maximum number of bookings accepted by the bulk approve/reject endpoint
+BOOKING_BULK_MAX_IDS = config('BOOKING_BULK_MAX_IDS', default=500, cast=int)
+
+# Unpaid bookings are expired by `python manage.py expire_bookings` (run from cron) once
+# this many hours have passed since they were created. 0 disables expiry for that status.
+BOOKING_EXPIRY_HOURS = {
+    'pending': config('BOOKING_PENDING_EXPIRY_HOURS', default=72, cast=int),
+    'approved': config('BOOKING_APPROVED_EXPIRY_HOURS', default=120, cast=int),
+}
+BOOKING_EXPIRY_BATCH_SIZE = config('BOOKING_EXPIRY_BATCH_SIZE', default=500, cast=int)
+
+# `python manage.py archive_bookings` moves bookings (and their payments) whose check-out
+# date is more than this many days ago into the archive tables
+BOOKING_ARCHIVE_AFTER_DAYS = config('BOOKING_ARCHIVE_AFTER_DAYS', default=540, cast=int)
+BOOKING_ARCHIVE_BATCH_SIZE = config('BOOKING_ARCHIVE_BATCH_SIZE', default=1000, cast=int)
+
+# Longest window the provider occupancy calendar returns, in days
+CALENDAR_MAX_DAYS = config('CALENDAR_MAX_DAYS', default=366, cast=int)
+
+# Analytics rollups: months in which a semester starts (default: January and August),
+# longest window one analytics request may cover, and the window the nightly
+# `python manage.py rebuild_room_stats` recomputes around today
+ANALYTICS_SEMESTER_START_MONTHS = config('ANALYTICS_SEMESTER_START_MONTHS', default='1,8', cast=Csv(int))
+ANALYTICS_MAX_DAYS = config('ANALYTICS_MAX_DAYS', default=1096, cast=int)
+ANALYTICS_REBUILD_DAYS_BACK = config('ANALYTICS_REBUILD_DAYS_BACK', default=30, cast=int)
+ANALYTICS_REBUILD_DAYS_AHEAD = config('ANALYTICS_REBUILD_DAYS_AHEAD', default=365, cast=int)
+
+# Unfiltered admin changelists of tables with at least this many rows show PostgreSQL's
+# row estimate instead of running COUNT(*)
+ADMIN_ESTIMATED_COUNT_MIN = config('ADMIN_ESTIMATED_COUNT_MIN', default=100000, cast=int)
+
+# Room distance search (?lat=&lng=&radius_km=): radius used when none is given, and the
+# largest radius accepted, in km
+ROOM_SEARCH_DEFAULT_RADIUS_KM = config('ROOM_SEARCH_DEFAULT_RADIUS_KM', default=2, cast=float)
+ROOM_SEARCH_MAX_RADIUS_KM = config('ROOM_SEARCH_MAX_RADIUS_KM', default=50, cast=float)
+
+# Room search facets (?facets=true): upper edges of the price buckets, and how long counts
+# are cached. Room and facility edits invalidate the cache immediately; availability changes
+# from bookings show up once the entry expires.
+ROOM_FACET_PRICE_BUCKETS = config('ROOM_FACET_PRICE_BUCKETS', default='100,200,300,500', cast=Csv(int))
+ROOM_FACET_CACHE_SECONDS = config('ROOM_FACET_CACHE_SECONDS', default=300, cast=int)
+
+# Room photos are staged under MEDIA_ROOT/room_uploads/ and processed in the background
+# by `python manage.py process_room_images --loop`, which pushes the resized variants here
+ROOM_IMAGE_STORAGE = config('ROOM_IMAGE_STORAGE', default='cloudinary_storage.storage.MediaCloudinaryStorage')
+ROOM_IMAGE_QUALITY = config('ROOM_IMAGE_QUALITY', default=82, cast=int)
+# Seconds a worker may hold a claimed upload. Uploads left in 'processing' longer
+# (the worker crashed or was killed) are claimed again; keep it well above the
+# time one photo takes to process
+ROOM_IMAGE_LEASE_SECONDS = config('ROOM_IMAGE_LEASE_SECONDS', default=600, cast=int)
+
 # Media files (keep for backward compatibility, but Cloudinary will handle uploads)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
\ No newline at end of file
@@ -0,0 +1,40 @@
+# hostel_booking/swagger.py
+"""
+Lazily built Swagger/ReDoc views.
+
+drf_yasg and the schema view are only imported and constructed the first time
+a docs URL is requested, so worker boot and management commands skip them.
+"""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_docs_view(ui=None):
+    from rest_framework import permissions
+    from drf_yasg import openapi
+    from drf_yasg.views import get_schema_view
+
+    schema_view = get_schema_view(
+        openapi.Info(
+            title="Hostel Booking API",
+            default_version='v1',
+            description="API documentation for Hostel Booking system",
+        ),
+        public=True,
+        permission_classes=[permissions.AllowAny],
+    )
+    if ui is None:
+        return schema_view.without_ui(cache_timeout=0)
+    return schema_view.with_ui(ui, cache_timeout=0)
+
+
+def schema(request, *args, **kwargs):
+    return get_docs_view()(request, *args, **kwargs)
+
+
+def swagger_ui(request, *args, **kwargs):
+    return get_docs_view('swagger')(request, *args, **kwargs)
+
+
+def redoc_ui(request, *args, **kwargs):
+    return get_docs_view('redoc')(request, *args, **kwargs)
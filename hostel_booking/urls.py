@@ -1,6 +1,6 @@
 # hostel_booking/urls.py
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, re_path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
@@ -8,36 +8,16 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('core.urls')),
     path('', include('core.urls')),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)# hostel_booking/urls.py
-from django.contrib import admin
-from django.urls import path, re_path, include
-from django.conf import settings
-from django.conf.urls.static import static
+]
 
-# Swagger imports
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
+# Swagger endpoints (drf_yasg is imported on the first docs request, not at startup)
+if settings.ENABLE_SWAGGER:
+    from hostel_booking import swagger
 
-# Swagger configuration
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Hostel Booking API",
-        default_version='v1',
-        description="API documentation for Hostel Booking system",
-    ),
-    public=True,
-    permission_classes=[permissions.AllowAny],
-)
-
-urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('api/', include('core.urls')),
-    path('', include('core.urls')),
+    urlpatterns += [
+        re_path(r'^swagger(?P<format>\.json|\.yaml)$', swagger.schema, name='schema-json'),
+        path('swagger/', swagger.swagger_ui, name='schema-ui'),
+        path('redoc/', swagger.redoc_ui, name='schema-redoc'),
+    ]
 
-    # Swagger endpoints
-    re_path(r'^swagger(?P<format>\.json|\.yaml)$',
-            schema_view.without_ui(cache_timeout=0), name='schema-json'),
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,95 @@
+from datetime import date, timedelta
+from django.contrib.admin.models import LogEntry
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from core.admin import EstimatedCountPaginator
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, BookingTransition, Payment
+
+
+class AdminTestMixin:
+    def setUp(self):
+        admin_user = User.objects.create_superuser(username='admin', email='admin@example.com', password='password')
+        self.client.force_login(admin_user)
+        provider_user = User.objects.create_user(username='provider', email='provider@example.com', password='password', role='provider')
+        provider_profile = ProviderProfile.objects.create(
+            user=provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.room = Room.objects.create(room_number='101', hostel_name='Test Hostel', price_per_night=100.00, max_occupancy=50, provider=provider_profile)
+        self.provider_profile = provider_profile
+        self.created = 0
+
+    def add_paid_bookings(self, count):
+        for _ in range(count):
+            i = self.created = self.created + 1
+            user = User.objects.create_user(username=f'student{i}', email=f'student{i}@example.com', password='password', role='student')
+            student = StudentProfile.objects.create(user=user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test')
+            check_in = date.today() + timedelta(days=i)
+            booking = Booking.objects.create(student=student, room=self.room, check_in_date=check_in, check_out_date=check_in + timedelta(days=2))
+            Payment.objects.create(booking=booking, amount=200, payment_method='card', transaction_id=f'ref-{i}', status='success')
+
+
+class AdminChangelistTests(AdminTestMixin, TestCase):
+    def changelist_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelists_do_not_query_per_row(self):
+        self.add_paid_bookings(2)
+        baseline = {url: self.changelist_queries(url) for url in (
+            '/admin/core/booking/', '/admin/core/payment/', '/admin/core/studentprofile/', '/admin/core/room/',
+        )}
+
+        self.add_paid_bookings(10)
+
+        for url, queries in baseline.items():
+            self.assertEqual(self.changelist_queries(url), queries, url)
+
+    def test_estimated_paginator_counts_exactly_off_postgres(self):
+        self.add_paid_bookings(3)
+        paginator = EstimatedCountPaginator(Booking.objects.order_by('-id'), 100)
+        self.assertEqual(paginator.count, 3)
+
+
+class AdminActionTests(AdminTestMixin, TestCase):
+    def run_action(self, model, action, ids, query='', **extra):
+        return self.client.post(f'/admin/core/{model}/{query}', {'action': action, '_selected_action': ids, **extra}, follow=True)
+
+    def test_room_actions_are_single_updates_with_audit(self):
+        rooms = [self.room] + [
+            Room.objects.create(room_number=str(i), hostel_name='Block B', price_per_night=80, max_occupancy=2, provider=self.provider_profile)
+            for i in range(3)
+        ]
+        ids = [room.id for room in rooms]
+
+        # Unlisting from the "listed" filter still logs every room
+        self.run_action('room', 'unlist_rooms', ids, query='?is_listed__exact=1')
+        self.assertFalse(Room.objects.filter(is_listed=True).exists())
+        self.assertEqual(LogEntry.objects.count(), 4)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.run_action('room', 'set_price', ids, price_per_night='120.50')
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE "core_room"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(set(Room.objects.values_list('price_per_night', flat=True)), {120.5})
+
+        response = self.run_action('room', 'set_price', ids, price_per_night='-1')
+        self.assertContains(response, 'Invalid price')
+        self.assertEqual(set(Room.objects.values_list('price_per_night', flat=True)), {120.5})
+
+    def test_cancel_bookings_refunds_and_logs(self):
+        self.add_paid_bookings(3)
+        bookings = list(Booking.objects.order_by('id'))
+        Booking.objects.filter(id=bookings[0].id).update(booking_status='confirmed')
+        Booking.objects.filter(id=bookings[2].id).update(booking_status='rejected')
+
+        response = self.run_action('booking', 'cancel_bookings', [b.id for b in bookings])
+
+        self.assertContains(response, 'Cancelled 2 booking(s) and refunded 2 payment(s). 1 were already cancelled, rejected or expired.')
+        self.assertEqual(Booking.objects.filter(booking_status='cancelled').count(), 2)
+        self.assertEqual(Payment.objects.filter(status='refunded').count(), 2)
+        self.assertEqual(BookingTransition.objects.filter(to_status='cancelled', source='admin').count(), 2)
+        self.assertEqual(LogEntry.objects.count(), 2)
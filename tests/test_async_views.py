@@ -0,0 +1,121 @@
+import hashlib
+import hmac
+import json
+from datetime import date, timedelta
+from unittest import mock
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import mail
+from django.test import TestCase, AsyncRequestFactory
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, Payment
+from core.models.password_reset import PasswordResetToken
+from core.views import async_views
+
+
+class AsyncViewTests(TestCase):
+    """The async views must answer exactly like the sync views they replace under ASGI."""
+
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+        self.student_user = User.objects.create_user(
+            username='student', email='student@example.com', password='password', role='student'
+        )
+        self.student_profile = StudentProfile.objects.create(
+            user=self.student_user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test Program'
+        )
+        self.provider_user = User.objects.create_user(
+            username='provider', email='provider@example.com', password='password', role='provider'
+        )
+        self.provider_profile = ProviderProfile.objects.create(
+            user=self.provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.room = Room.objects.create(
+            room_number='101', hostel_name='Test Hostel', price_per_night=100.00,
+            max_occupancy=2, provider=self.provider_profile, location='Legon'
+        )
+        Room.objects.create(
+            room_number='102', hostel_name='Other Hostel', price_per_night=300.00,
+            max_occupancy=1, provider=self.provider_profile, location='Accra'
+        )
+        check_in = date.today() + timedelta(days=7)
+        self.booking = Booking.objects.create(
+            student=self.student_profile, room=self.room, check_in_date=check_in,
+            check_out_date=check_in + timedelta(days=2), booking_status='approved'
+        )
+        self.auth = {'Authorization': f'Bearer {AccessToken.for_user(self.student_user)}'}
+
+    def mock_paystack(self, status_code, body):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(json.loads(request.content))
+            return httpx.Response(status_code, json=body)
+
+        transport = httpx.MockTransport(handler)
+        real_client = httpx.AsyncClient
+        patcher = mock.patch.object(
+            async_views.httpx, 'AsyncClient', lambda **kwargs: real_client(transport=transport, **kwargs)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return requests_seen
+
+    async def test_payment_initiation(self):
+        sent = self.mock_paystack(200, {'status': True, 'data': {'authorization_url': 'https://paystack.test/abc'}})
+        request = self.factory.post('/api/payments/initiate/', {
+            'booking_id': self.booking.id, 'email': 'student@example.com', 'amount': '200.00',
+        }, content_type='application/json', headers=self.auth)
+
+        response = await async_views.initialize_paystack_payment(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), {'authorization_url': 'https://paystack.test/abc'})
+        self.assertEqual(sent, [{'email': 'student@example.com', 'amount': 20000, 'currency': 'GHS', 'metadata': {'booking_id': self.booking.id}}])
+
+    async def test_payment_initiation_validation(self):
+        request = self.factory.post('/api/payments/initiate/', {}, content_type='application/json')
+        self.assertEqual((await async_views.initialize_paystack_payment(request)).status_code, 401)
+
+        request = self.factory.post('/api/payments/initiate/', {
+            'booking_id': self.booking.id, 'email': 'student@example.com', 'amount': '150',
+        }, content_type='application/json', headers=self.auth)
+        response = await async_views.initialize_paystack_payment(request)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('does not match the booking total', json.loads(response.content)['error'])
+
+    async def test_webhook_confirms_booking(self):
+        body = json.dumps({'event': 'charge.success', 'data': {
+            'reference': 'ref-1', 'amount': 20000, 'channel': 'card', 'metadata': {'booking_id': self.booking.id},
+        }}).encode()
+        signature = hmac.new(settings.PAYSTACK_SECRET_KEY.encode(), body, hashlib.sha512).hexdigest()
+        request = self.factory.post('/api/webhooks/paystack/', body, content_type='application/json',
+                                    headers={'X-Paystack-Signature': signature})
+
+        response = await async_views.paystack_webhook(request)
+
+        self.assertEqual(response.status_code, 200)
+        await self.booking.arefresh_from_db()
+        self.assertEqual(self.booking.booking_status, 'confirmed')
+        self.assertTrue(await Payment.objects.filter(booking=self.booking, status='success').aexists())
+
+    async def test_password_reset_request(self):
+        request = self.factory.post('/api/password-reset/request/', {'email': 'student@example.com'},
+                                    content_type='application/json')
+
+        response = await async_views.request_password_reset(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 1)
+        token = await PasswordResetToken.objects.aget(user=self.student_user, is_used=False)
+        self.assertIn(token.token, mail.outbox[0].body)
+
+    async def test_room_search_matches_sync_view(self):
+        client = APIClient()
+        for query in ['', '?search=legon', '?price_max=200', '?hostel_name=other&price_min=100']:
+            expected = (await sync_to_async(client.get)(f'/api/rooms/{query}')).json()
+            response = await async_views.room_list(self.factory.get(f'/api/rooms/{query}'))
+            self.assertEqual(json.loads(response.content), expected, query)
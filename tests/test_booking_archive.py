@@ -0,0 +1,119 @@
+import json
+from datetime import date, timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+from core.services.archive import archive_needed
+from core.models import (
+    User, StudentProfile, ProviderProfile, Room, Booking, Payment, WaitlistEntry, ArchivedBooking, ArchivedPayment,
+)
+
+
+class ArchiveBookingsTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.provider_user = User.objects.create_user(username='provider', email='provider@example.com', password='password', role='provider')
+        self.provider = provider_profile = ProviderProfile.objects.create(
+            user=self.provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.room = Room.objects.create(
+            room_number='101', hostel_name='Test Hostel', price_per_night=100.00,
+            max_occupancy=5, provider=provider_profile
+        )
+        user = User.objects.create_user(username='student', email='student@example.com', password='password', role='student')
+        self.student = StudentProfile.objects.create(user=user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test')
+
+        self.old = self.create_paid_booking(date.today() - timedelta(days=800))
+        self.recent = self.create_paid_booking(date.today() - timedelta(days=30))
+        self.entry = WaitlistEntry.objects.create(
+            student=self.student, room=self.room, check_in_date=self.old.check_in_date,
+            check_out_date=self.old.check_out_date, status='promoted', booking=self.old
+        )
+
+    def create_paid_booking(self, check_in):
+        booking = Booking.objects.create(
+            student=self.student, room=self.room, check_in_date=check_in,
+            check_out_date=check_in + timedelta(days=3), booking_status='confirmed'
+        )
+        Payment.objects.create(booking=booking, amount=300, payment_method='card', transaction_id=f'ref-{booking.id}', status='success')
+        return booking
+
+    def archive(self, *args):
+        out = StringIO()
+        call_command('archive_bookings', *args, stdout=out)
+        return out.getvalue()
+
+    def test_moves_old_bookings_and_payments(self):
+        output = self.archive('--batch-size', '1')
+
+        self.assertIn("Archived 1 booking(s) and 1 payment(s)", output)
+        self.assertEqual(list(Booking.objects.values_list('id', flat=True)), [self.recent.id])
+        self.assertEqual(Payment.objects.count(), 1)
+        archived = ArchivedBooking.objects.get(id=self.old.id)
+        self.assertEqual((archived.provider_id, archived.price_per_night, archived.total_amount), (self.room.provider_id, 100, 300))
+        self.assertEqual(ArchivedPayment.objects.get().booking_id, self.old.id)
+        self.entry.refresh_from_db()
+        self.assertIsNone(self.entry.booking_id)
+
+    def test_dry_run_moves_nothing(self):
+        output = self.archive('--dry-run')
+
+        self.assertIn("Would archive 1 booking(s) and 1 payment(s)", output)
+        self.assertEqual(Booking.objects.count(), 2)
+        self.assertFalse(ArchivedBooking.objects.exists())
+
+    def test_reports_include_archive_only_when_needed(self):
+        self.archive()
+        self.client.force_authenticate(self.provider_user)
+
+        response = self.client.get('/api/exports/bookings/', {'export_format': 'ndjson'})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([row['id'] for row in rows], [self.old.id, self.recent.id])
+        self.assertEqual(rows[0]['total_amount'], '300.00')
+
+        start_date = date.today() - timedelta(days=90)
+        response = self.client.get('/api/exports/bookings/', {'export_format': 'ndjson', 'start_date': start_date})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([row['id'] for row in rows], [self.recent.id])
+
+        response = self.client.get('/api/revenue/')
+        self.assertEqual(response.data['total_revenue'], 600.0)
+        response = self.client.get('/api/dashboard/provider/summary/')
+        self.assertEqual((response.data['total_revenue'], response.data['bookings']['confirmed']), (600.0, 2))
+
+    def export(self, kind):
+        response = self.client.get(f'/api/exports/{kind}/', {'export_format': 'ndjson'})
+        return [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+
+    def test_exports_keep_archived_rows_of_deleted_rooms_and_students(self):
+        self.archive()
+        room_id = self.room.id
+        self.student.user.delete()
+        self.room.delete()
+        self.client.force_authenticate(self.provider_user)
+
+        bookings = self.export('bookings')
+        self.assertEqual([row['id'] for row in bookings], [self.old.id])
+        self.assertEqual(
+            [bookings[0][column] for column in ('room_id', 'room_hostel_name', 'room_room_number', 'student_user_username', 'student_user_email')],
+            [room_id, 'Test Hostel', '101', 'student', 'student@example.com'],
+        )
+        payments = self.export('payments')
+        self.assertEqual([(row['booking_id'], row['booking_room_hostel_name'], row['booking_student_user_username']) for row in payments],
+                         [(self.old.id, 'Test Hostel', 'student')])
+
+    def test_archive_needed_per_provider(self):
+        self.archive()
+        other_user = User.objects.create_user(username='other', email='other@example.com', password='password', role='provider')
+        other = ProviderProfile.objects.create(
+            user=other_user, business_name='Other Hostel', contact_person='Jane Doe',
+            email='other@example.com', phone_number='0987654321', address='1 Other St', bank_details='Bank'
+        )
+        start_date = self.old.check_out_date - timedelta(days=1)
+
+        self.assertTrue(archive_needed(self.provider, start_date))
+        self.assertFalse(archive_needed(other, start_date))
+        self.assertTrue(archive_needed(other, None))
+
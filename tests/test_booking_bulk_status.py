@@ -0,0 +1,75 @@
+from datetime import date, timedelta
+from django.test import TestCase
+from rest_framework.test import APIClient
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, Payment
+
+
+class BulkBookingStatusTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.provider_user = self.create_provider('provider')
+        self.other_provider_user = self.create_provider('other')
+        self.room = Room.objects.create(
+            room_number='101', hostel_name='Test Hostel', price_per_night=100.00,
+            max_occupancy=50, provider=self.provider_user.provider_profile
+        )
+        other_room = Room.objects.create(
+            room_number='201', hostel_name='Other Hostel', price_per_night=100.00,
+            max_occupancy=1, provider=self.other_provider_user.provider_profile
+        )
+        check_in = date.today() + timedelta(days=7)
+        self.bookings = []
+        for i in range(5):
+            user = User.objects.create_user(username=f'student{i}', email=f'student{i}@example.com', password='password', role='student')
+            student = StudentProfile.objects.create(user=user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test')
+            self.bookings.append(Booking.objects.create(
+                student=student, room=self.room, check_in_date=check_in, check_out_date=check_in + timedelta(days=3)
+            ))
+        self.bookings[3].booking_status = 'confirmed'
+        self.bookings[3].save()
+        self.other_booking = Booking.objects.create(
+            student=self.bookings[0].student, room=other_room, check_in_date=check_in, check_out_date=check_in + timedelta(days=3)
+        )
+        self.client.force_authenticate(self.provider_user)
+
+    def create_provider(self, username):
+        user = User.objects.create_user(username=username, email=f'{username}@example.com', password='password', role='provider')
+        ProviderProfile.objects.create(
+            user=user, business_name=username, contact_person='John Doe', email=f'{username}@example.com',
+            phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        return user
+
+    def post(self, booking_ids, new_status):
+        return self.client.post('/api/bookings/bulk-status/', {'booking_ids': booking_ids, 'status': new_status}, format='json')
+
+    def test_bulk_approve_returns_per_id_results(self):
+        ids = [b.id for b in self.bookings] + [self.other_booking.id, 999999]
+        # Ownership, lock, update, transition log insert (plus savepoints), whatever the batch size
+        with self.assertNumQueries(8):
+            response = self.post(ids, 'approved')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['updated'], 4)
+        results = {result['id']: result for result in response.data['results']}
+        self.assertEqual([r['id'] for r in response.data['results']], ids)
+        self.assertTrue(all(results[b.id]['success'] for b in self.bookings if b.booking_status == 'pending'))
+        self.assertIn('must be pending', results[self.bookings[3].id]['error'])
+        self.assertIn('not authorized', results[self.other_booking.id]['error'])
+        self.assertEqual(results[999999]['error'], 'Booking not found.')
+
+        self.assertEqual(Booking.objects.filter(room=self.room, booking_status='approved').count(), 4)
+        self.assertEqual(Booking.objects.get(id=self.other_booking.id).booking_status, 'pending')
+
+    def test_bulk_reject_refunds_payments(self):
+        Payment.objects.create(booking=self.bookings[0], amount=300, payment_method='card', transaction_id='ref', status='success')
+        response = self.post([self.bookings[0].id, self.bookings[1].id], 'rejected')
+
+        self.assertEqual(response.data['updated'], 2)
+        self.assertEqual(Booking.objects.filter(booking_status='rejected').count(), 2)
+        self.assertEqual(Payment.objects.get().status, 'refunded')
+
+    def test_validation(self):
+        self.assertEqual(self.post([self.bookings[0].id], 'confirmed').status_code, 400)
+        self.assertEqual(self.post([], 'approved').status_code, 400)
+        self.assertEqual(self.post(['abc'], 'approved').status_code, 400)
@@ -0,0 +1,78 @@
+from datetime import date, timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, BookingTransition, Payment, WaitlistEntry
+
+
+@override_settings(BOOKING_EXPIRY_HOURS={'pending': 72, 'approved': 120})
+class ExpireBookingsTests(TestCase):
+    def setUp(self):
+        provider_user = User.objects.create_user(username='provider', email='provider@example.com', password='password', role='provider')
+        provider_profile = ProviderProfile.objects.create(
+            user=provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.room = Room.objects.create(
+            room_number='101', hostel_name='Test Hostel', price_per_night=100.00,
+            max_occupancy=1, provider=provider_profile
+        )
+        self.students = []
+        for i in range(3):
+            user = User.objects.create_user(username=f'student{i}', email=f'student{i}@example.com', password='password', role='student')
+            self.students.append(StudentProfile.objects.create(user=user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test'))
+        self.check_in = date.today() + timedelta(days=14)
+
+    def create_booking(self, student, booking_status, hours_old):
+        return Booking.objects.create(
+            student=student, room=self.room, check_in_date=self.check_in, check_out_date=self.check_in + timedelta(days=3),
+            booking_status=booking_status, created_at=timezone.now() - timedelta(hours=hours_old)
+        )
+
+    def run_command(self, *args):
+        out = StringIO()
+        call_command('expire_bookings', *args, stdout=out)
+        return out.getvalue()
+
+    def test_expires_stale_unpaid_bookings(self):
+        stale_pending = self.create_booking(self.students[0], 'pending', 100)
+        fresh_pending = self.create_booking(self.students[1], 'pending', 10)
+        approved = self.create_booking(self.students[2], 'approved', 100)  # within the approved window
+
+        output = self.run_command('--batch-size', '1')
+
+        self.assertIn("Expired 1 booking(s) (1 pending, 0 approved), freeing 3 room-night(s)", output)
+        self.assertEqual(Booking.objects.get(id=stale_pending.id).booking_status, 'expired')
+        self.assertEqual(Booking.objects.get(id=fresh_pending.id).booking_status, 'pending')
+        self.assertEqual(Booking.objects.get(id=approved.id).booking_status, 'approved')
+        self.assertTrue(BookingTransition.objects.filter(booking=stale_pending, to_status='expired', source='system').exists())
+
+    def test_paid_bookings_are_kept(self):
+        booking = self.create_booking(self.students[0], 'approved', 200)
+        Payment.objects.create(booking=booking, amount=300, payment_method='card', transaction_id='ref', status='success')
+
+        self.run_command()
+
+        self.assertEqual(Booking.objects.get(id=booking.id).booking_status, 'approved')
+
+    def test_dry_run_changes_nothing(self):
+        booking = self.create_booking(self.students[0], 'pending', 100)
+
+        output = self.run_command('--dry-run')
+
+        self.assertIn("Would expire 1 booking(s)", output)
+        self.assertEqual(Booking.objects.get(id=booking.id).booking_status, 'pending')
+
+    def test_expired_waitlist_booking_promotes_next_entry(self):
+        stay = {'check_in_date': self.check_in, 'check_out_date': self.check_in + timedelta(days=3)}
+        first = self.create_booking(self.students[0], 'pending', 100)
+        WaitlistEntry.objects.create(student=self.students[0], room=self.room, status='promoted', booking=first, **stay)
+        waiting = WaitlistEntry.objects.create(student=self.students[1], room=self.room, **stay)
+
+        output = self.run_command()
+
+        self.assertIn("promoted 1 waitlist entry", output)
+        waiting.refresh_from_db()
+        self.assertEqual(waiting.status, 'promoted')
+        self.assertEqual(waiting.booking.booking_status, 'pending')
@@ -29,7 +29,7 @@ class BookingSerializerTests(TestCase):
         )
         self.room = Room.objects.create(
             room_number='101', hostel_name='Test Hostel', price_per_night=100.00,
-            max_occupancy=2, provider=self.provider_profile, is_available=True
+            max_occupancy=2, provider=self.provider_profile, is_listed=True
         )
 
     def create_booking(self, check_in, check_out, student=None, payment_status='success'):
@@ -0,0 +1,89 @@
+from datetime import date, timedelta
+from django.test import TestCase
+from rest_framework.test import APIClient
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, BookingTransition
+from core.services.booking_state import InvalidTransition, transition
+
+
+class BookingStateTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.provider_user = User.objects.create_user(
+            username='provider', email='provider@example.com', password='password', role='provider'
+        )
+        self.provider_profile = ProviderProfile.objects.create(
+            user=self.provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.student_user = User.objects.create_user(
+            username='student', email='student@example.com', password='password', role='student'
+        )
+        StudentProfile.objects.create(
+            user=self.student_user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test Program'
+        )
+        self.room = Room.objects.create(
+            room_number='101', hostel_name='Test Hostel', price_per_night=100.00,
+            max_occupancy=5, provider=self.provider_profile
+        )
+
+    def create_booking(self, days_ahead):
+        self.client.force_authenticate(self.student_user)
+        check_in = date.today() + timedelta(days=days_ahead)
+        response = self.client.post('/api/bookings/', {
+            'room_id': self.room.id, 'check_in_date': check_in, 'check_out_date': check_in + timedelta(days=2),
+        }, format='json')
+        self.assertEqual(response.status_code, 201, response.data)
+        return Booking.objects.get(id=response.data['id'])
+
+    def test_transitions_are_logged(self):
+        booking = self.create_booking(5)
+        self.client.force_authenticate(self.provider_user)
+        self.client.post(f'/api/bookings/{booking.id}/status/', {'status': 'approved'}, format='json')
+        self.client.force_authenticate(self.student_user)
+        self.client.post(f'/api/bookings/{booking.id}/cancel/')
+
+        history = list(booking.transitions.order_by('created_at', 'id').values_list('from_status', 'to_status', 'source'))
+        self.assertEqual(history, [('', 'pending', 'student'), ('pending', 'approved', 'provider'), ('approved', 'cancelled', 'student')])
+
+    def test_invalid_transitions_are_rejected(self):
+        booking = self.create_booking(5)
+        transition(booking, 'rejected')
+        with self.assertRaises(InvalidTransition):
+            transition(booking, 'confirmed')
+
+        self.client.force_authenticate(self.provider_user)
+        response = self.client.post(f'/api/bookings/{booking.id}/status/', {'status': 'confirmed'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(BookingTransition.objects.filter(booking=booking).count(), 2)
+
+    def test_transition_checks_the_status_in_the_database(self):
+        booking = self.create_booking(5)
+        stale = Booking.objects.get(id=booking.id)
+        transition(booking, 'approved')
+        # The webhook confirms the booking after `stale` was loaded
+        transition(booking, 'confirmed', source='paystack')
+
+        transition(stale, 'cancelled', source='student')
+        self.assertEqual(booking.transitions.order_by('-id').values_list('from_status', 'to_status').first(), ('confirmed', 'cancelled'))
+
+        other = self.create_booking(10)
+        stale = Booking.objects.get(id=other.id)
+        transition(other, 'rejected')
+        with self.assertRaises(InvalidTransition):
+            transition(stale, 'approved')
+        self.assertEqual(stale.booking_status, 'rejected')
+        other.refresh_from_db()
+        self.assertEqual(other.booking_status, 'rejected')
+
+    def test_dashboard_rates_come_from_log(self):
+        bookings = [self.create_booking(days) for days in (5, 10, 15, 20)]
+        transition(bookings[0], 'confirmed')
+        transition(bookings[1], 'cancelled')
+        # Deleting a booking does not rewrite history
+        bookings[2].delete()
+
+        self.client.force_authenticate(self.provider_user)
+        rates = self.client.get('/api/dashboard/provider/summary/').data['rates']
+        self.assertEqual(rates, {
+            'created': 4, 'confirmed': 1, 'cancelled': 1, 'conversion_rate': 0.25, 'cancellation_rate': 0.25,
+        })
@@ -0,0 +1,79 @@
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, Payment
+from core.services.payments import to_minor_units
+from core.views.payment_view import InitializePaystackPayment
+from core.views.payment_webhook import process_charge_success
+
+
+class BookingTotalTests(TestCase):
+    def setUp(self):
+        provider_user = User.objects.create_user(username='provider', email='provider@example.com', password='password', role='provider')
+        provider = ProviderProfile.objects.create(
+            user=provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.student_user = User.objects.create_user(username='student', email='student@example.com', password='password', role='student')
+        self.student = StudentProfile.objects.create(user=self.student_user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test')
+        self.room = Room.objects.create(room_number='101', hostel_name='Test Hostel', price_per_night=Decimal('33.33'), max_occupancy=2, provider=provider)
+        self.booking = Booking.objects.create(
+            student=self.student, room=self.room, check_in_date=date(2026, 11, 1),
+            check_out_date=date(2026, 11, 4), booking_status='approved'
+        )
+
+    def test_minor_units_are_exact(self):
+        self.assertEqual(to_minor_units('99.99'), 9999)
+        self.assertEqual(to_minor_units(Decimal('99.990')), 9999)
+        self.assertEqual(to_minor_units(99.99), 9999)
+        self.assertEqual(to_minor_units(100), 10000)
+        for amount in ('99.999', 0.1 + 0.2, 'abc', 'NaN', 'Infinity', True, None):
+            with self.assertRaises(ValueError):
+                to_minor_units(amount)
+
+    @override_settings(BOOKING_CURRENCY='NGN')
+    def test_total_and_currency_snapshot_at_creation(self):
+        self.assertEqual((self.booking.total_amount, self.booking.currency), (Decimal('99.99'), 'GHS'))
+        booking = Booking.objects.create(
+            student=self.student, room=self.room, check_in_date=date(2026, 12, 1), check_out_date=date(2026, 12, 2)
+        )
+        self.assertEqual(booking.currency, 'NGN')
+
+        Room.objects.filter(id=self.room.id).update(price_per_night=500)
+        booking = Booking.objects.get(id=self.booking.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(booking.total_amount, Decimal('99.99'))
+
+    def initiate(self, amount):
+        request = APIRequestFactory().post('/api/payments/initiate/', {
+            'booking_id': self.booking.id, 'email': 'student@example.com', 'amount': amount,
+        }, format='json')
+        force_authenticate(request, self.student_user)
+        return InitializePaystackPayment.as_view()(request)
+
+    def test_payment_initiation_sends_minor_units(self):
+        for amount in ('99.989', '100.00', 'ten'):
+            self.assertEqual(self.initiate(amount).status_code, 400, amount)
+
+        with mock.patch('core.views.payment_view.requests.post') as post:
+            post.return_value.status_code = 200
+            post.return_value.json.return_value = {'data': {'reference': 'ref-1'}}
+            response = self.initiate(99.99)
+
+        self.assertEqual(response.status_code, 200)
+        sent = post.call_args.kwargs['json']
+        self.assertEqual((sent['amount'], sent['currency']), (9999, 'GHS'))
+
+    def test_webhook_compares_minor_units(self):
+        charge = {'reference': 'ref-1', 'channel': 'card', 'metadata': {'booking_id': self.booking.id}}
+
+        self.assertEqual(process_charge_success({**charge, 'amount': 9998}), 400)
+        self.assertEqual(process_charge_success({**charge, 'amount': 9999, 'currency': 'NGN'}), 400)
+        self.assertFalse(Payment.objects.exists())
+
+        self.assertEqual(process_charge_success({**charge, 'amount': 9999, 'currency': 'GHS'}), 200)
+        self.assertEqual(Payment.objects.get(booking=self.booking).amount, Decimal('99.99'))
+        self.booking.refresh_from_db()
+        self.assertEqual(self.booking.booking_status, 'confirmed')
@@ -0,0 +1,84 @@
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connections
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from core.db_router import REPLICA
+from core.models import User, ProviderProfile, Room, Facility
+
+
+class ReplicaRoutingTests(TestCase):
+    """
+    Uses two SQLite databases: the test 'default' database as the primary and a
+    second in-memory SQLite database as the replica. Rows are only written to
+    the primary, so anything served from the replica comes back empty.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # Point the replica alias at a fresh in-memory database (whether or not
+        # DATABASE_REPLICA_URL is set) once the test runner has set up its own.
+        cls.saved_replica_settings = connections.settings.get(REPLICA)
+        if cls.saved_replica_settings is not None:
+            connections[REPLICA].close()
+            del connections[REPLICA]
+        default = connections.settings['default']
+        connections.settings[REPLICA] = {**default, 'NAME': ':memory:', 'TEST': {**default['TEST'], 'NAME': ':memory:'}}
+        call_command('migrate', database=REPLICA, verbosity=0)
+        cls.databases = {'default', REPLICA}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections[REPLICA].close()
+        del connections[REPLICA]
+        if cls.saved_replica_settings is None:
+            del connections.settings[REPLICA]
+        else:
+            connections.settings[REPLICA] = cls.saved_replica_settings
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.provider_user = User.objects.create_user(
+            username='provider', email='provider@example.com', password='password', role='provider'
+        )
+        self.provider_profile = ProviderProfile.objects.create(
+            user=self.provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.room = Room.objects.create(
+            room_number='101', hostel_name='Test Hostel', price_per_night=100.00,
+            max_occupancy=2, provider=self.provider_profile
+        )
+        self.facility = Facility.objects.create(name='Wi-Fi')
+
+    def test_catalogue_reads_from_replica(self):
+        self.assertEqual(self.client.get('/api/rooms/').json(), [])
+        # Facilities come from the in-process catalogue, which always loads from the primary
+        self.assertEqual(self.client.get('/api/facilities/').json(), [{'id': self.facility.id, 'name': 'Wi-Fi'}])
+        self.assertEqual(self.client.get(f'/api/rooms/{self.room.id}/').status_code, 404)
+
+    def test_other_reads_stay_on_primary(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.provider_user)}')
+        response = self.client.get('/api/rooms/mine/')
+        self.assertEqual([room['id'] for room in response.data], [self.room.id])
+
+    def test_writes_go_to_primary_and_make_user_sticky(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.provider_user)}')
+        # Reporting comes from the replica, where this provider does not exist yet
+        self.assertEqual(self.client.get('/api/revenue/').status_code, 404)
+
+        response = self.client.post(f'/api/rooms/{self.room.id}/toggle-availability/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Room.objects.using('default').get(id=self.room.id).is_listed)
+
+        # Read-your-writes: the same user is now served from the primary
+        self.assertEqual(self.client.get('/api/revenue/').status_code, 200)
+        self.assertEqual([room['id'] for room in self.client.get('/api/rooms/').json()], [self.room.id])
+
+        # Anonymous visitors still read from the replica
+        self.client.credentials()
+        self.assertEqual(self.client.get('/api/rooms/').json(), [])
@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+from datetime import date
+from django.test import TestCase
+from rest_framework.test import APIClient
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, Payment
+
+
+class ProviderExportTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.provider_user, provider = self.create_provider('provider')
+        _, other_provider = self.create_provider('other')
+        self.room = Room.objects.create(room_number='101', hostel_name='Test Hostel', price_per_night=100, max_occupancy=5, provider=provider)
+        other_room = Room.objects.create(room_number='1', hostel_name='Other Hostel', price_per_night=100, max_occupancy=5, provider=other_provider)
+
+        self.student_user = User.objects.create_user(username='student', email='student@example.com', password='password', role='student')
+        self.student = StudentProfile.objects.create(user=self.student_user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test')
+
+        self.august = self.create_booking(self.room, date(2026, 8, 1), date(2026, 8, 5), 'confirmed', 'success')
+        self.october = self.create_booking(self.room, date(2026, 10, 1), date(2026, 10, 3), 'cancelled', 'refunded')
+        self.pending = self.create_booking(self.room, date(2026, 11, 1), date(2026, 11, 2), 'pending')
+        self.other = self.create_booking(other_room, date(2026, 8, 1), date(2026, 8, 5), 'confirmed', 'success')
+
+        self.client.force_authenticate(self.provider_user)
+
+    def create_provider(self, username):
+        user = User.objects.create_user(username=username, email=f'{username}@example.com', password='password', role='provider')
+        profile = ProviderProfile.objects.create(
+            user=user, business_name=f'{username} Hostel', contact_person='John Doe',
+            email=f'{username}@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        return user, profile
+
+    def create_booking(self, room, check_in, check_out, booking_status, payment_status=None):
+        booking = Booking.objects.create(
+            student=self.student, room=room, check_in_date=check_in, check_out_date=check_out, booking_status=booking_status
+        )
+        if payment_status:
+            payment = Payment.objects.create(
+                booking=booking, amount=booking.total_amount, payment_method='card',
+                transaction_id=f'ref-{booking.id}', status=payment_status
+            )
+            # payment_date is auto_now_add; pay on the check-in day
+            Payment.objects.filter(id=payment.id).update(payment_date=f'{check_in}T12:00Z')
+        return booking
+
+    def payment(self, booking):
+        return Payment.objects.get(booking=booking).id
+
+    def export(self, kind, **params):
+        response = self.client.get(f'/api/exports/{kind}/', params)
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content).decode()
+
+    def ndjson_ids(self, kind, **params):
+        return [json.loads(line)['id'] for line in self.export(kind, export_format='ndjson', **params).splitlines()]
+
+    def test_csv_bookings(self):
+        response = self.client.get('/api/exports/bookings/')
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="bookings.csv"')
+
+        rows = list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(rows[0][:5], ['id', 'room_id', 'room_hostel_name', 'room_room_number', 'student_user_username'])
+        self.assertEqual(rows[0][-2:], ['total_amount', 'currency'])
+        self.assertEqual([int(row[0]) for row in rows[1:]], [self.august.id, self.october.id, self.pending.id])
+        self.assertEqual(rows[1][2:6], ['Test Hostel', '101', 'student', 'student@example.com'])
+        self.assertEqual(rows[1][-2:], ['400.00', 'GHS'])
+
+    def test_ndjson_payments(self):
+        lines = self.export('payments', export_format='ndjson').splitlines()
+        rows = [json.loads(line) for line in lines]
+
+        self.assertEqual([row['booking_id'] for row in rows], [self.august.id, self.october.id])
+        self.assertEqual((rows[0]['amount'], rows[0]['status']), ('400.00', 'success'))
+        self.assertEqual(rows[1]['status'], 'refunded')
+
+    def test_date_and_status_filters(self):
+        # Stays overlapping the window, whatever their check-in date
+        self.assertEqual(self.ndjson_ids('bookings', start_date='2026-08-04', end_date='2026-10-01'), [self.august.id, self.october.id])
+        self.assertEqual(self.ndjson_ids('bookings', start_date='2026-08-05'), [self.october.id, self.pending.id])
+        self.assertEqual(self.ndjson_ids('bookings', status='pending,cancelled'), [self.october.id, self.pending.id])
+
+        self.assertEqual(self.ndjson_ids('payments', start_date='2026-09-01'), [self.payment(self.october)])
+        self.assertEqual(self.ndjson_ids('payments', status='success'), [self.payment(self.august)])
+
+    def test_invalid_parameters(self):
+        for params, message in (
+            ({'export_format': 'xlsx'}, "Invalid export_format"),
+            ({'start_date': '01/08/2026'}, "Invalid start_date"),
+            ({'start_date': '2026-09-01', 'end_date': '2026-08-01'}, "start_date must be on or before end_date"),
+            ({'status': 'confirmed,paid'}, "Invalid status: paid"),
+        ):
+            response = self.client.get('/api/exports/bookings/', params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertIn(message, response.json()['error'])
+
+    def test_provider_scope(self):
+        self.assertNotIn(self.other.id, self.ndjson_ids('bookings'))
+        self.assertEqual(self.ndjson_ids('payments'), [self.payment(self.august), self.payment(self.october)])
+
+        self.client.force_authenticate(self.student_user)
+        self.assertEqual(self.client.get('/api/exports/bookings/').status_code, 403)
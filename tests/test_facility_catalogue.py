@@ -0,0 +1,59 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from core.models import Facility
+from core.serializers.room_serializer import RoomSerializer
+from core.services.facility_catalogue import VERSION_KEY
+
+
+class FacilityCatalogueTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.wifi = Facility.objects.create(name='Wi-Fi')
+        self.desk = Facility.objects.create(name='Desk')
+
+    def names(self):
+        return [facility['name'] for facility in self.client.get('/api/facilities/').json()]
+
+    def test_list_is_served_from_memory_until_a_facility_changes(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.names(), ['Wi-Fi', 'Desk'])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.names(), ['Wi-Fi', 'Desk'])
+
+        Facility.objects.create(name='Locker')
+        with self.assertNumQueries(1):
+            self.assertEqual(self.names(), ['Wi-Fi', 'Desk', 'Locker'])
+
+    def test_workers_reload_when_the_shared_version_changes(self):
+        self.names()
+        # A change made by another worker: no signal here, only its version bump
+        Facility.objects.filter(id=self.desk.id).update(name='Study Desk')
+        self.assertEqual(self.names(), ['Wi-Fi', 'Desk'])
+
+        cache.incr(VERSION_KEY)
+        self.assertEqual(self.names(), ['Wi-Fi', 'Study Desk'])
+
+    def test_snapshot_expires_without_a_version_bump(self):
+        self.names()
+        # With a per-process cache other workers' bumps never arrive; age bounds the staleness
+        Facility.objects.filter(id=self.desk.id).update(name='Study Desk')
+        self.assertEqual(self.names(), ['Wi-Fi', 'Desk'])
+
+        with override_settings(FACILITY_CATALOGUE_MAX_AGE=0):
+            self.assertEqual(self.names(), ['Wi-Fi', 'Study Desk'])
+
+    def test_room_serializer_checks_facilities_without_queries(self):
+        self.names()
+        room = {'room_number': '101', 'hostel_name': 'Test Hostel', 'price_per_night': '100.00', 'max_occupancy': 2}
+
+        with self.assertNumQueries(0):
+            serializer = RoomSerializer(data={**room, 'facilities': [self.wifi.id, self.desk.id]})
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data['facilities'], [self.wifi, self.desk])
+
+        with self.assertNumQueries(0):
+            serializer = RoomSerializer(data={**room, 'facilities': [999]})
+            self.assertFalse(serializer.is_valid())
+        self.assertIn('facilities', serializer.errors)
@@ -0,0 +1,61 @@
+from datetime import date, timedelta
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking
+from core.services.occupancy import occupancy_by_night
+
+
+class OccupancyByNightTests(SimpleTestCase):
+    def test_stays_are_clipped_to_the_window(self):
+        start = date(2026, 1, 10)
+        stays = [
+            (1, date(2026, 1, 5), date(2026, 1, 12)),   # started before the window
+            (1, date(2026, 1, 11), date(2026, 1, 13)),
+            (1, date(2026, 1, 13), date(2026, 2, 1)),   # runs past the window
+            (2, date(2026, 1, 1), date(2026, 1, 10)),   # checked out on the first day
+        ]
+        self.assertEqual(occupancy_by_night(stays, start, 5), {1: [1, 2, 1, 1, 1]})
+
+
+class OccupancyCalendarViewTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.provider_user = User.objects.create_user(username='provider', email='provider@example.com', password='password', role='provider')
+        provider_profile = ProviderProfile.objects.create(
+            user=self.provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.room = Room.objects.create(room_number='101', hostel_name='Test Hostel', price_per_night=100.00, max_occupancy=2, provider=provider_profile)
+        self.empty_room = Room.objects.create(room_number='102', hostel_name='Test Hostel', price_per_night=100.00, max_occupancy=1, provider=provider_profile)
+        user = User.objects.create_user(username='student', email='student@example.com', password='password', role='student')
+        student = StudentProfile.objects.create(user=user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test')
+
+        self.start = date.today() + timedelta(days=10)
+        for offset, booking_status in ((0, 'confirmed'), (1, 'confirmed'), (2, 'pending')):
+            Booking.objects.create(
+                student=student, room=self.room, booking_status=booking_status,
+                check_in_date=self.start + timedelta(days=offset), check_out_date=self.start + timedelta(days=offset + 2),
+            )
+        self.client.force_authenticate(self.provider_user)
+
+    def test_returns_confirmed_occupancy_per_night(self):
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/rooms/calendar/', {
+                'start_date': self.start, 'end_date': self.start + timedelta(days=3),
+            })
+
+        self.assertEqual(response.status_code, 200)
+        rooms = {room['room_id']: room for room in response.data['rooms']}
+        self.assertEqual(rooms[self.room.id]['occupancy'], [1, 2, 1, 0])
+        self.assertEqual(rooms[self.room.id]['max_occupancy'], 2)
+        self.assertEqual(rooms[self.empty_room.id]['occupancy'], [0, 0, 0, 0])
+
+    def test_validates_window(self):
+        self.assertEqual(self.client.get('/api/rooms/calendar/').status_code, 200)
+        self.assertEqual(self.client.get('/api/rooms/calendar/', {'start_date': 'soon'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/rooms/calendar/', {
+            'start_date': self.start, 'end_date': self.start - timedelta(days=1),
+        }).status_code, 400)
+        self.assertEqual(self.client.get('/api/rooms/calendar/', {
+            'start_date': self.start, 'end_date': self.start + timedelta(days=400),
+        }).status_code, 400)
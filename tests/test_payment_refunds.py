@@ -0,0 +1,118 @@
+import json
+from datetime import date, timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, Payment
+from core.views.payment_webhook import process_charge_success
+
+
+class PaymentRefundTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.provider_user = User.objects.create_user(
+            username='provider', email='provider@example.com', password='password', role='provider'
+        )
+        provider_profile = ProviderProfile.objects.create(
+            user=self.provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.student_user = User.objects.create_user(
+            username='student', email='student@example.com', password='password', role='student'
+        )
+        self.student = StudentProfile.objects.create(
+            user=self.student_user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test Program'
+        )
+        self.room = Room.objects.create(
+            room_number='101', hostel_name='Test Hostel', price_per_night=100.00,
+            max_occupancy=5, provider=provider_profile
+        )
+
+    def create_paid_booking(self, days_ahead=7, amount=300):
+        check_in = date.today() + timedelta(days=days_ahead)
+        booking = Booking.objects.create(
+            student=self.student, room=self.room, check_in_date=check_in,
+            check_out_date=check_in + timedelta(days=3), booking_status='confirmed'
+        )
+        Payment.objects.create(booking=booking, amount=amount, payment_method='card', transaction_id=f'ref-{booking.id}', status='success')
+        return booking
+
+    def test_cancel_marks_payment_refunded(self):
+        booking = self.create_paid_booking()
+        self.client.force_authenticate(self.student_user)
+        response = self.client.post(f'/api/bookings/{booking.id}/cancel/')
+
+        self.assertEqual(response.status_code, 200)
+        payment = Payment.objects.get(booking=booking)
+        self.assertEqual(payment.status, 'refunded')
+        self.assertIsNotNone(payment.refunded_at)
+
+    def test_revenue_only_counts_successful_payments(self):
+        self.create_paid_booking(7)
+        refunded = self.create_paid_booking(20)
+        Payment.objects.filter(booking=refunded).update(status='refunded')
+
+        self.client.force_authenticate(self.provider_user)
+        # Provider, per-room totals, archived totals
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/revenue/')
+
+        self.assertEqual(response.data['total_revenue'], 300.0)
+        self.assertEqual(response.data['rooms'][0]['total_earned'], 300.0)
+
+    def test_repayment_keeps_refunded_payment(self):
+        booking = self.create_paid_booking()
+        refunded_at = timezone.now()
+        Payment.objects.filter(booking=booking).update(status='refunded', refunded_at=refunded_at)
+        Booking.objects.filter(id=booking.id).update(booking_status='approved')
+        charge = {'reference': 'new-ref', 'amount': 30000, 'channel': 'card', 'metadata': {'booking_id': booking.id}}
+
+        self.assertEqual(process_charge_success(charge), 200)
+        # A second notification for the same booking is a duplicate
+        self.assertEqual(process_charge_success(dict(charge, reference='other-ref')), 200)
+
+        self.assertEqual(
+            list(Payment.objects.filter(booking=booking).order_by('id').values_list('transaction_id', 'status', 'refunded_at')),
+            [(f'ref-{booking.id}', 'refunded', refunded_at), ('new-ref', 'success', None)],
+        )
+        self.assertEqual(Booking.objects.get(id=booking.id).booking_status, 'confirmed')
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Payment.objects.create(booking=booking, amount=300, payment_method='card', transaction_id='third', status='success')
+
+    def test_reconcile_streams_discrepancies(self):
+        self.create_paid_booking(7)
+        wrong_amount = self.create_paid_booking(20, amount=250)
+        cancelled = self.create_paid_booking(40)
+        Booking.objects.filter(id=cancelled.id).update(booking_status='cancelled')
+        refunded = self.create_paid_booking(60)
+        Payment.objects.filter(booking=refunded).update(status='refunded')
+
+        out = StringIO()
+        call_command('reconcile_payments', format='ndjson', stdout=out, stderr=StringIO())
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+
+        self.assertEqual(
+            sorted((row['issue'], row['booking_id']) for row in rows),
+            sorted([
+                ('paid_inactive_booking', cancelled.id),
+                ('confirmed_without_payment', refunded.id),
+                ('amount_mismatch', wrong_amount.id),
+            ])
+        )
+
+    def test_reconcile_reports_each_unpaid_booking_once(self):
+        booking = self.create_paid_booking(7)
+        Payment.objects.filter(booking=booking).update(status='failed')
+        retry = Payment.objects.create(booking=booking, amount=300, payment_method='momo', transaction_id='retry', status='failed')
+
+        out = StringIO()
+        call_command('reconcile_payments', format='ndjson', stdout=out, stderr=StringIO())
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+
+        self.assertEqual([(row['issue'], row['booking_id'], row['payment_id']) for row in rows],
+                         [('confirmed_without_payment', booking.id, retry.id)])
+        self.assertEqual((rows[0]['payment_status'], rows[0]['transaction_id']), ('failed', 'retry'))
+
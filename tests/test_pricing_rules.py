@@ -0,0 +1,90 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from django.test import TestCase
+from rest_framework.test import APIClient
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, PricingRule
+from core.services.pricing import quote_room, quote_rooms
+from core.views.payment_webhook import process_charge_success
+
+
+class PricingRuleTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.provider_user = User.objects.create_user(username='provider', email='provider@example.com', password='password', role='provider')
+        self.provider = ProviderProfile.objects.create(
+            user=self.provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.room = Room.objects.create(room_number='101', hostel_name='Test Hostel', price_per_night=100, max_occupancy=2, provider=self.provider)
+        self.annex = Room.objects.create(room_number='1', hostel_name='Annex', price_per_night=80, max_occupancy=2, provider=self.provider)
+
+        christmas = date(2026, 12, 24)
+        for rule in (
+            dict(kind='seasonal', start_date=date(2026, 12, 20), end_date=date(2026, 12, 31), percent=20),
+            dict(kind='override', start_date=christmas, end_date=christmas, nightly_price=500),
+            dict(kind='override', hostel_name='Test Hostel', start_date=christmas, end_date=christmas, nightly_price=150),
+            dict(kind='length_of_stay', min_nights=7, percent=10),
+            dict(kind='length_of_stay', min_nights=28, percent=20),
+            dict(kind='seasonal', percent=-50, is_active=False),
+        ):
+            PricingRule.objects.create(provider=self.provider, **rule)
+
+    def test_rules_combine_per_night_and_per_stay(self):
+        check_in, check_out = date(2026, 12, 19), date(2026, 12, 27)
+
+        with self.assertNumQueries(1):
+            quotes = quote_rooms([self.room, self.annex], check_in, check_out)
+
+        # 100 + 4 x 120 (season) + 150 (hostel override) + 2 x 120, less 10% for a week's stay
+        self.assertEqual(quotes[self.room.id], Decimal('873.00'))
+        # 80 + 4 x 96 + 500 (provider-wide override) + 2 x 96, less 10%
+        self.assertEqual(quotes[self.annex.id], Decimal('1040.40'))
+        self.assertEqual(quote_room(self.room, date(2026, 11, 1), date(2026, 11, 3)), Decimal('200.00'))
+        self.assertEqual(quote_room(self.room, date(2026, 11, 1), date(2026, 11, 29)), Decimal('2240.00'))
+
+    def test_booking_keeps_its_quote(self):
+        user = User.objects.create_user(username='student', email='student@example.com', password='password', role='student')
+        StudentProfile.objects.create(user=user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test')
+        self.client.force_authenticate(user)
+
+        response = self.client.post('/api/bookings/', {
+            'room_id': self.room.id, 'check_in_date': '2026-12-23', 'check_out_date': '2026-12-25',
+        }, format='json')
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(response.data['total_amount'], '270.00')
+        booking = Booking.objects.get(id=response.data['id'])
+        self.assertEqual(booking.total_amount, Decimal('270.00'))
+
+        # Later price changes do not touch the booking, and the amount check needs no room
+        Room.objects.filter(id=self.room.id).update(price_per_night=1000)
+        booking.booking_status = 'approved'
+        booking.save()
+        status = process_charge_success({
+            'reference': 'ref-1', 'amount': 27000, 'channel': 'card', 'metadata': {'booking_id': booking.id},
+        })
+        self.assertEqual(status, 200)
+        booking.refresh_from_db()
+        self.assertEqual(booking.booking_status, 'confirmed')
+
+    def test_search_results_carry_quotes(self):
+        response = self.client.get('/api/rooms/', {'check_in': '2026-12-24', 'check_out': '2026-12-25'})
+        quotes = {room['id']: room['quoted_total'] for room in response.json()}
+        self.assertEqual(quotes, {self.room.id: '150.00', self.annex.id: '500.00'})
+
+        response = self.client.get('/api/rooms/')
+        self.assertEqual({room['quoted_total'] for room in response.json()}, {None})
+
+    def test_provider_manages_rules(self):
+        self.client.force_authenticate(self.provider_user)
+
+        response = self.client.post('/api/pricing-rules/', {'kind': 'length_of_stay', 'percent': '15'}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('min_nights', response.data)
+
+        response = self.client.post('/api/pricing-rules/', {'kind': 'length_of_stay', 'percent': '15', 'min_nights': 90}, format='json')
+        self.assertEqual(response.status_code, 201)
+        rule_id = response.data['id']
+        self.assertEqual(self.client.patch(f'/api/pricing-rules/{rule_id}/', {'percent': '150'}, format='json').status_code, 400)
+        self.assertEqual(self.client.patch(f'/api/pricing-rules/{rule_id}/', {'percent': '25'}, format='json').status_code, 200)
+        self.assertEqual(len(self.client.get('/api/pricing-rules/').data), 7)
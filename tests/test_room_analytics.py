@@ -0,0 +1,108 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, Payment, RoomDailyStat
+from core.services.analytics import next_period_start, period_start
+from core.services.booking_state import transition, transition_many
+
+
+@override_settings(ANALYTICS_SEMESTER_START_MONTHS=[1, 8])
+class RoomAnalyticsTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.provider_user = User.objects.create_user(username='provider', email='provider@example.com', password='password', role='provider')
+        provider_profile = ProviderProfile.objects.create(
+            user=self.provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.room = Room.objects.create(room_number='101', hostel_name='Test Hostel', price_per_night=100.00, max_occupancy=2, provider=provider_profile)
+        self.students = []
+        for i in range(2):
+            user = User.objects.create_user(username=f'student{i}', email=f'student{i}@example.com', password='password', role='student')
+            self.students.append(StudentProfile.objects.create(user=user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test'))
+
+    def confirm_paid_booking(self, student, check_in, nights, amount):
+        booking = Booking.objects.create(
+            student=student, room=self.room, booking_status='approved',
+            check_in_date=check_in, check_out_date=check_in + timedelta(days=nights),
+        )
+        Payment.objects.create(booking=booking, amount=amount, payment_method='card', transaction_id=f'ref-{booking.id}', status='success')
+        transition(booking, 'confirmed', source='paystack')
+        return booking
+
+    def snapshot(self):
+        return sorted(RoomDailyStat.objects.filter(nights_sold__gt=0).values_list('date', 'nights_sold', 'revenue'))
+
+    def test_transitions_keep_rollups_current(self):
+        check_in = date(2026, 3, 30)
+        booking = self.confirm_paid_booking(self.students[0], check_in, 3, 100)
+        self.confirm_paid_booking(self.students[1], check_in + timedelta(days=1), 1, 50)
+
+        self.assertEqual(self.snapshot(), [
+            (check_in, 1, Decimal('33.34')), (check_in + timedelta(days=1), 2, Decimal('83.33')), (check_in + timedelta(days=2), 1, Decimal('33.33')),
+        ])
+
+        booking.payments.update(status='refunded')
+        transition(booking, 'cancelled', source='student')
+        self.assertEqual(self.snapshot(), [(check_in + timedelta(days=1), 1, 50)])
+        self.assertEqual(RoomDailyStat.objects.get(date=date.today()).cancellations, 1)
+
+    def test_bulk_transitions_are_set_based(self):
+        bookings = [
+            self.confirm_paid_booking(self.students[i % 2], date(2026, 3, 1) + timedelta(days=3 * i), 4, 100 + i)
+            for i in range(8)
+        ]
+
+        def cancel(batch):
+            with CaptureQueriesContext(connection) as queries:
+                transition_many([booking.id for booking in batch], 'confirmed', 'cancelled', source='admin')
+            return len(queries)
+
+        first = cancel(bookings[:3])
+        incremental = self.snapshot()
+        call_command('rebuild_room_stats', '--start', '2026-03-01', '--end', '2026-03-31', stdout=StringIO())
+        self.assertEqual(self.snapshot(), incremental)
+
+        self.assertEqual(cancel(bookings[3:]), first)
+        self.assertEqual(self.snapshot(), [])
+        self.assertEqual(RoomDailyStat.objects.get(date=date.today()).cancellations, 8)
+
+    def test_rebuild_matches_incremental(self):
+        self.confirm_paid_booking(self.students[0], date(2026, 3, 30), 3, 100)
+        self.confirm_paid_booking(self.students[1], date(2026, 3, 31), 5, 420)
+        incremental = self.snapshot()
+
+        RoomDailyStat.objects.all().delete()
+        call_command('rebuild_room_stats', '--start', '2026-03-01', '--end', '2026-04-30', stdout=StringIO())
+
+        self.assertEqual(self.snapshot(), incremental)
+
+    def test_semester_buckets(self):
+        self.assertEqual(period_start(date(2026, 10, 19), 'semester'), date(2026, 8, 1))
+        self.assertEqual(next_period_start(date(2026, 8, 1), 'semester'), date(2027, 1, 1))
+        self.assertEqual(next_period_start(date(2026, 1, 1), 'semester'), date(2026, 8, 1))
+
+    def test_endpoint_sums_rollups(self):
+        self.confirm_paid_booking(self.students[0], date(2026, 1, 30), 4, 400)  # two nights in January, two in February
+        self.client.force_authenticate(self.provider_user)
+
+        # Provider, capacity, rollups
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/analytics/', {'period': 'month', 'start_date': '2026-01-01', 'end_date': '2026-02-28'})
+
+        self.assertEqual(response.status_code, 200)
+        january, february = response.data['buckets']
+        self.assertEqual((january['nights_sold'], january['available_nights'], january['revenue'], january['adr']), (2, 62, 200.0, 100.0))
+        self.assertEqual((february['nights_sold'], february['available_nights']), (2, 56))
+        self.assertEqual(response.data['totals']['occupancy_rate'], round(4 / 118, 4))
+
+        response = self.client.get('/api/analytics/', {'period': 'semester', 'start_date': '2026-01-01', 'end_date': '2026-12-31'})
+        self.assertEqual([(b['start'], b['end'], b['nights_sold']) for b in response.data['buckets']], [
+            (date(2026, 1, 1), date(2026, 7, 31), 4), (date(2026, 8, 1), date(2026, 12, 31), 0),
+        ])
+        self.assertEqual(self.client.get('/api/analytics/', {'period': 'year'}).status_code, 400)
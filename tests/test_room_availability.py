@@ -0,0 +1,88 @@
+from datetime import date, timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, Payment
+from core.serializers.room_serializer import RoomSerializer
+
+
+class RoomAvailabilityTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.provider_user = User.objects.create_user(
+            username='provider', email='provider@example.com', password='password', role='provider'
+        )
+        self.provider_profile = ProviderProfile.objects.create(
+            user=self.provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.student_user = student_user = User.objects.create_user(
+            username='student', email='student@example.com', password='password', role='student'
+        )
+        self.student_profile = StudentProfile.objects.create(
+            user=student_user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test Program'
+        )
+        self.room = Room.objects.create(
+            room_number='101', hostel_name='Test Hostel', price_per_night=100.00,
+            max_occupancy=1, provider=self.provider_profile
+        )
+        self.next_month = date.today() + timedelta(days=30)
+        booking = Booking.objects.create(
+            student=self.student_profile, room=self.room, check_in_date=self.next_month,
+            check_out_date=self.next_month + timedelta(days=5), booking_status='confirmed'
+        )
+        Payment.objects.create(booking=booking, amount=500, payment_method='card', transaction_id='ref', status='success')
+
+    def list_rooms(self, query=''):
+        response = self.client.get(f'/api/rooms/{query}')
+        self.assertEqual(response.status_code, 200, response.content)
+        return {room['id']: room['is_available'] for room in response.json()}
+
+    def test_availability_depends_on_dates(self):
+        self.assertEqual(self.list_rooms(), {self.room.id: True})
+        self.assertEqual(self.list_rooms(f'?check_in={self.next_month + timedelta(days=2)}'), {self.room.id: False})
+        self.assertEqual(self.list_rooms(f'?check_in={self.next_month + timedelta(days=5)}&check_out={self.next_month + timedelta(days=7)}'), {self.room.id: True})
+
+        self.assertEqual(self.list_rooms(f'?check_in={self.next_month}&is_available=true'), {})
+        self.assertEqual(self.list_rooms('?is_available=true'), {self.room.id: True})
+        self.assertEqual(self.client.get('/api/rooms/?check_in=tomorrow').status_code, 400)
+
+        response = self.client.get(f'/api/rooms/{self.room.id}/?check_in={self.next_month}')
+        self.assertFalse(response.data['is_available'])
+        self.assertTrue(response.data['is_listed'])
+
+    def test_unlisting_is_separate_from_capacity(self):
+        self.client.force_authenticate(self.provider_user)
+        response = self.client.post(f'/api/rooms/{self.room.id}/toggle-availability/')
+        self.assertEqual(response.data, {"id": self.room.id, "room_number": '101', "is_listed": False, "is_available": False})
+        self.assertEqual(self.list_rooms(), {self.room.id: False})
+
+        # Capacity changes never write to the room row
+        self.client.post(f'/api/rooms/{self.room.id}/toggle-availability/')
+        Booking.objects.update(booking_status='cancelled')
+        self.room.refresh_from_db()
+        self.assertTrue(self.room.is_listed)
+        self.assertEqual(self.list_rooms(f'?check_in={self.next_month}'), {self.room.id: True})
+
+    def test_nested_rooms_are_annotated_by_the_views(self):
+        self.client.force_authenticate(self.student_user)
+
+        def my_bookings():
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get('/api/bookings/my/')
+            self.assertEqual(response.status_code, 200)
+            return len(queries), [booking['room']['is_available'] for booking in response.json()]
+
+        queries, available = my_bookings()
+        self.assertEqual(available, [True])
+        for i in range(5):
+            check_in = self.next_month + timedelta(days=10 + i)
+            Booking.objects.create(student=self.student_profile, room=self.room, check_in_date=check_in, check_out_date=check_in + timedelta(days=1))
+        self.assertEqual(my_bookings(), (queries, [True] * 6))
+
+        # Without the annotation the serializer falls back to the listing switch instead of querying
+        room = Room.objects.get(id=self.room.id)
+        with self.assertNumQueries(0):
+            self.assertTrue(RoomSerializer().get_is_available(room))
+
@@ -0,0 +1,144 @@
+from decimal import Decimal
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from core.models import User, ProviderProfile, Room, Facility
+from core.services.facility_catalogue import facilities_by_id
+
+
+class RoomBulkTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.provider_user, self.provider = self.create_provider('provider')
+        _, self.other_provider = self.create_provider('other')
+        self.wifi = Facility.objects.create(name='WiFi')
+        self.laundry = Facility.objects.create(name='Laundry')
+        self.client.force_authenticate(self.provider_user)
+
+    def create_provider(self, username):
+        user = User.objects.create_user(username=username, email=f'{username}@example.com', password='password', role='provider')
+        profile = ProviderProfile.objects.create(
+            user=user, business_name=f'{username} Hostel', contact_person='John Doe',
+            email=f'{username}@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        return user, profile
+
+    def room_rows(self, count, start=1):
+        return [
+            {'room_number': str(number), 'hostel_name': 'Bulk Hostel', 'price_per_night': '50.00', 'max_occupancy': 2}
+            for number in range(start, start + count)
+        ]
+
+    def test_create_from_json(self):
+        rows = self.room_rows(2)
+        rows[0]['facilities'] = [self.wifi.id, self.laundry.id]
+
+        response = self.client.post('/api/rooms/bulk/create/', rows, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        created = response.json()['created']
+        self.assertEqual([(row['row'], row['room_number']) for row in created], [(0, '1'), (1, '2')])
+        room = Room.objects.get(id=created[0]['id'])
+        self.assertEqual(room.provider, self.provider)
+        self.assertEqual(set(room.facilities.values_list('name', flat=True)), {'WiFi', 'Laundry'})
+
+    def test_create_from_csv(self):
+        body = (
+            '\ufeffroom_number,hostel_name,price_per_night,max_occupancy,facilities\n'
+            f'A1,CSV Hostel,45.50,3,{self.wifi.id};{self.laundry.id}\n'
+            'A2, CSV Hostel ,60,1,\n'
+        )
+        response = self.client.post('/api/rooms/bulk/create/', body, content_type='text/csv')
+
+        self.assertEqual(response.status_code, 201)
+        rooms = Room.objects.filter(hostel_name='CSV Hostel').order_by('room_number')
+        self.assertEqual([(r.room_number, r.price_per_night, r.facilities.count()) for r in rooms],
+                         [('A1', Decimal('45.50'), 2), ('A2', Decimal('60.00'), 0)])
+
+    def test_per_row_errors_reject_the_batch(self):
+        rows = self.room_rows(4)
+        del rows[1]['max_occupancy']
+        rows[2]['price_per_night'] = '-1'
+        rows[3]['facilities'] = [self.wifi.id, 9999]
+
+        response = self.client.post('/api/rooms/bulk/create/', rows, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        details = response.json()['details']
+        self.assertEqual([detail['row'] for detail in details], [1, 2, 3])
+        self.assertIn('max_occupancy', details[0]['errors'])
+        self.assertIn('price_per_night', details[1]['errors'])
+        self.assertEqual(details[2]['errors']['facilities'], ["Unknown facility ids: [9999]"])
+        self.assertFalse(Room.objects.exists())
+
+    @override_settings(ROOM_BULK_MAX_ROWS=3)
+    def test_row_limit(self):
+        response = self.client.post('/api/rooms/bulk/create/', self.room_rows(4), format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("at most 3 rooms", response.json()['error'])
+
+        response = self.client.post('/api/rooms/bulk/update/', [{'id': n, 'is_listed': False} for n in range(4)], format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.post('/api/rooms/bulk/create/', [], format='json').status_code, 400)
+
+    def test_update_own_rooms_only(self):
+        own = Room.objects.create(room_number='1', hostel_name='Mine', price_per_night=50, max_occupancy=2, provider=self.provider)
+        other = Room.objects.create(room_number='1', hostel_name='Theirs', price_per_night=50, max_occupancy=2, provider=self.other_provider)
+
+        response = self.client.post('/api/rooms/bulk/update/', [
+            {'id': own.id, 'price_per_night': '70.00'},
+            {'id': other.id, 'is_listed': False},
+        ], format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['details'], [
+            {'row': 1, 'errors': {'id': ["Room not found or you do not have permission to modify it."]}},
+        ])
+        other.refresh_from_db()
+        self.assertTrue(other.is_listed)
+
+        response = self.client.post('/api/rooms/bulk/update/', 'id,price_per_night,is_listed\n'
+                                    f'{own.id},70.00,false\n', content_type='text/csv')
+        self.assertEqual(response.status_code, 200)
+        own.refresh_from_db()
+        self.assertEqual((own.price_per_night, own.is_listed), (Decimal('70.00'), False))
+
+    def count_queries(self, url, rows):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, rows, format='json')
+        self.assertIn(response.status_code, (200, 201))
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        facilities_by_id()  # the first catalogue read after setUp loads it
+        create = '/api/rooms/bulk/create/'
+        with_facilities = lambda rows: [dict(row, facilities=[self.wifi.id]) for row in rows]
+        self.assertEqual(self.count_queries(create, with_facilities(self.room_rows(2))),
+                         self.count_queries(create, with_facilities(self.room_rows(20, start=100))))
+
+        ids = list(Room.objects.values_list('id', flat=True))
+        update = '/api/rooms/bulk/update/'
+        self.assertEqual(self.count_queries(update, [{'id': pk, 'price_per_night': '60.00'} for pk in ids[:2]]),
+                         self.count_queries(update, [{'id': pk, 'price_per_night': '65.00'} for pk in ids]))
+
+    def test_csv_partial_updates(self):
+        rooms = [
+            Room.objects.create(room_number=str(n), hostel_name='Mine', price_per_night=50, max_occupancy=2, provider=self.provider)
+            for n in (1, 2)
+        ]
+
+        response = self.client.post('/api/rooms/bulk/update/', 'id,price_per_night,is_listed\n'
+                                    f'{rooms[0].id},80.00,\n'
+                                    f'{rooms[1].id},,false\n', content_type='text/csv')
+
+        self.assertEqual(response.status_code, 200, response.json())
+        for room in rooms:
+            room.refresh_from_db()
+        self.assertEqual([(room.price_per_night, room.is_listed) for room in rooms],
+                         [(Decimal('80.00'), True), (Decimal('50.00'), False)])
+
+        response = self.client.post('/api/rooms/bulk/update/', 'id,price_per_night,is_listed\n'
+                                    f'{rooms[0].id},,\n', content_type='text/csv')
+        self.assertEqual(response.status_code, 400)
+
@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from core.models import User, ProviderProfile, Room, Facility
+
+
+@override_settings(ROOM_FACET_PRICE_BUCKETS=[100, 200])
+class RoomFacetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        provider_user = User.objects.create_user(username='provider', email='provider@example.com', password='password', role='provider')
+        provider = ProviderProfile.objects.create(
+            user=provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.wifi = Facility.objects.create(name='Wi-Fi')
+        self.ac = Facility.objects.create(name='Air Conditioning')
+        self.rooms = []
+        for number, price, location, facilities in (
+            ('1', 80, 'KNUST', [self.wifi]),
+            ('2', 150, 'KNUST', [self.wifi, self.ac]),
+            ('3', 250, 'KNUST', [self.ac]),
+            ('4', 150, 'Legon', [self.wifi]),
+        ):
+            room = Room.objects.create(room_number=number, hostel_name='Test Hostel', price_per_night=price,
+                                       max_occupancy=2, provider=provider, location=location)
+            room.facilities.set(facilities)
+            self.rooms.append(room)
+
+    def get(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/rooms/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.json(), len(queries)
+
+    def test_counts_follow_the_filters(self):
+        data, _ = self.get({'facets': 'true', 'location': 'knust', 'facilities': [self.wifi.id]})
+
+        self.assertEqual(sorted(room['id'] for room in data['results']), [self.rooms[0].id, self.rooms[1].id])
+        self.assertEqual(data['facets']['facilities'], [
+            {'id': self.ac.id, 'name': 'Air Conditioning', 'count': 1},
+            {'id': self.wifi.id, 'name': 'Wi-Fi', 'count': 2},
+        ])
+        self.assertEqual(data['facets']['price'], [
+            {'min': 0, 'max': 100, 'count': 1}, {'min': 100, 'max': 200, 'count': 1}, {'min': 200, 'max': None, 'count': 0},
+        ])
+
+    def test_counts_are_cached_by_normalized_filter(self):
+        _, first = self.get({'facets': 'true', 'location': 'KNUST', 'price_min': '100'})
+        # Same filter in another order and case: served from the cache, without the two facet queries
+        data, second = self.get({'price_min': '100', 'location': ' knust', 'facets': '1', 'page_hint': 'x'})
+        self.assertEqual(second, first - 2)
+        self.assertEqual([f['count'] for f in data['facets']['facilities']], [2, 1])
+
+        self.rooms[2].facilities.remove(self.ac)
+        data, third = self.get({'facets': 'true', 'location': 'KNUST', 'price_min': '100'})
+        self.assertEqual(third, first)
+        self.assertEqual([f['count'] for f in data['facets']['facilities']], [1, 1])
+
+    def test_plain_listing_is_unchanged(self):
+        data, _ = self.get({'location': 'legon'})
+        self.assertEqual([room['id'] for room in data], [self.rooms[3].id])
@@ -0,0 +1,52 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+from core.models import User, ProviderProfile, Room, Facility
+
+
+class RoomFacilityFilterTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        provider_user = User.objects.create_user(username='provider', email='provider@example.com', password='password', role='provider')
+        self.provider = ProviderProfile.objects.create(
+            user=provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.wifi = Facility.objects.create(name='Wi-Fi')
+        self.ac = Facility.objects.create(name='Air Conditioning')
+        self.desk = Facility.objects.create(name='Desk')
+        self.created = 0
+
+    def add_rooms(self, count, facilities):
+        rooms = []
+        for _ in range(count):
+            self.created += 1
+            room = Room.objects.create(room_number=str(self.created), hostel_name='Test Hostel', price_per_night=100,
+                                       max_occupancy=2, provider=self.provider)
+            room.facilities.set(facilities)
+            rooms.append(room)
+        return rooms
+
+    def test_rooms_must_have_all_selected_facilities(self):
+        both = self.add_rooms(1, [self.wifi, self.ac, self.desk])
+        self.add_rooms(1, [self.wifi])
+        self.add_rooms(1, [self.ac, self.desk])
+
+        response = self.client.get('/api/rooms/', {'facilities': [self.wifi.id, self.ac.id]})
+
+        self.assertEqual(response.status_code, 200)
+        rooms = response.json()
+        self.assertEqual([room['id'] for room in rooms], [both[0].id])
+        self.assertEqual(sorted(f['name'] for f in rooms[0]['facilities']), ['Air Conditioning', 'Desk', 'Wi-Fi'])
+        self.assertEqual(self.client.get('/api/rooms/', {'facilities': [999]}).status_code, 400)
+
+    def test_query_count_does_not_grow_with_results(self):
+        self.add_rooms(2, [self.wifi, self.ac])
+        # Facility choices, rooms, prefetched facilities
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/rooms/', {'facilities': [self.wifi.id, self.ac.id]})
+        self.assertEqual(len(response.json()), 2)
+
+        self.add_rooms(20, [self.wifi, self.ac, self.desk])
+        with self.assertNumQueries(3):
+            response = self.client.get('/api/rooms/', {'facilities': [self.wifi.id, self.ac.id]})
+        self.assertEqual(len(response.json()), 22)
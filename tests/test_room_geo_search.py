@@ -0,0 +1,90 @@
+import os
+import tempfile
+from io import StringIO
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APIClient
+from core.models import User, ProviderProfile, Room
+from core.services.geo import bounding_box, geocode, haversine_km, normalize_place
+
+CAMPUS = (6.6745, -1.5716)
+
+
+class GeoHelperTests(SimpleTestCase):
+    def test_bounding_box_contains_the_circle(self):
+        min_lat, max_lat, [(min_lng, max_lng)] = bounding_box(*CAMPUS, 2)
+        self.assertAlmostEqual(haversine_km(min_lat, CAMPUS[1], *CAMPUS), 2, places=6)
+        self.assertAlmostEqual(haversine_km(max_lat, CAMPUS[1], *CAMPUS), 2, places=6)
+        self.assertGreater(haversine_km(CAMPUS[0], min_lng, *CAMPUS), 2 - 1e-6)
+        self.assertGreater(haversine_km(CAMPUS[0], max_lng, *CAMPUS), 2 - 1e-6)
+
+    def test_bounding_box_splits_at_the_antimeridian(self):
+        _, _, lng_ranges = bounding_box(0, 179.99, 5)
+        self.assertEqual(len(lng_ranges), 2)
+        self.assertEqual(lng_ranges[0][1], 180)
+        self.assertEqual(lng_ranges[1][0], -180)
+
+    def test_geocode_falls_back_to_broader_place(self):
+        places = {normalize_place('Ayeduase, Kumasi'): (6.67, -1.56), normalize_place('Kumasi'): (6.69, -1.62)}
+        self.assertEqual(geocode('Block C,  AYEDUASE ,Kumasi.', places), (6.67, -1.56))
+        self.assertEqual(geocode('Bomso; Kumasi', places), None)
+        self.assertEqual(geocode('Bomso, Kumasi', places), (6.69, -1.62))
+
+
+class RoomGeoSearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        provider_user = User.objects.create_user(username='provider', email='provider@example.com', password='password', role='provider')
+        self.provider = ProviderProfile.objects.create(
+            user=provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+
+    def add_room(self, number, location='', latitude=None, longitude=None):
+        return Room.objects.create(
+            room_number=number, hostel_name='Test Hostel', price_per_night=100, max_occupancy=2,
+            provider=self.provider, location=location, latitude=latitude, longitude=longitude,
+        )
+
+    def test_radius_search_returns_nearest_first(self):
+        far = self.add_room('far', latitude=6.6745, longitude=-1.5500)     # ~2.4 km east
+        near = self.add_room('near', latitude=6.6790, longitude=-1.5716)   # ~0.5 km north
+        middle = self.add_room('middle', latitude=6.6745, longitude=-1.5570)  # ~1.6 km east
+        self.add_room('unplaced')
+
+        response = self.client.get('/api/rooms/', {'lat': CAMPUS[0], 'lng': CAMPUS[1], 'radius_km': 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([room['id'] for room in response.json()], [near.id, middle.id])
+        self.assertAlmostEqual(response.json()[0]['distance_km'], haversine_km(6.6790, -1.5716, *CAMPUS), places=3)
+
+        response = self.client.get('/api/rooms/', {'lat': CAMPUS[0], 'lng': CAMPUS[1], 'radius_km': 3})
+        self.assertEqual([room['id'] for room in response.json()], [near.id, middle.id, far.id])
+
+    def test_bbox_and_validation(self):
+        inside = self.add_room('inside', latitude=6.67, longitude=-1.57)
+        self.add_room('outside', latitude=5.60, longitude=-0.19)
+
+        response = self.client.get('/api/rooms/', {'bbox': '6.6,-1.6,6.7,-1.5'})
+        self.assertEqual([room['id'] for room in response.json()], [inside.id])
+
+        for params in ({'lat': 6.67}, {'lat': 95, 'lng': 0}, {'lat': 6.67, 'lng': -1.57, 'radius_km': 500}, {'bbox': '1,2,3'}):
+            self.assertEqual(self.client.get('/api/rooms/', params).status_code, 400, params)
+
+    def test_geocode_rooms_from_gazetteer(self):
+        room = self.add_room('101', location='Block C, Ayeduase, Kumasi')
+        placed = self.add_room('102', location='Ayeduase, Kumasi', latitude=1, longitude=1)
+        unknown = self.add_room('103', location='Somewhere Else')
+
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as f:
+            f.write('Name,Latitude,Longitude\n"Ayeduase, Kumasi",6.67,-1.56\n')
+        self.addCleanup(os.remove, f.name)
+        out = StringIO()
+        call_command('geocode_rooms', f.name, stdout=out)
+
+        for r in (room, placed, unknown):
+            r.refresh_from_db()
+        self.assertEqual((room.latitude, room.longitude), (6.67, -1.56))
+        self.assertEqual((placed.latitude, placed.longitude), (1, 1))
+        self.assertIsNone(unknown.latitude)
+        self.assertIn('Geocoded 1 room(s); 1 room(s) had no gazetteer match', out.getvalue())
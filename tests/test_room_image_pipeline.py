@@ -0,0 +1,116 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from io import BytesIO
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+from core.models import User, ProviderProfile, Room, RoomImageUpload
+from core.serializers.room_serializer import RoomSerializer, RoomListSerializer
+from core.services.room_images import claim_uploads, process_pending_uploads
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT,
+    ROOM_IMAGE_STORAGE='django.core.files.storage.FileSystemStorage',
+)
+class RoomImagePipelineTests(TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.provider_user = User.objects.create_user(
+            username='provider', email='provider@example.com', password='password', role='provider'
+        )
+        self.provider_profile = ProviderProfile.objects.create(
+            user=self.provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+
+    def make_image(self, size=(3000, 2000)):
+        buffer = BytesIO()
+        Image.new('RGB', size, color=(200, 120, 40)).save(buffer, format='PNG')
+        return SimpleUploadedFile('photo.png', buffer.getvalue(), content_type='image/png')
+
+    def create_room(self):
+        serializer = RoomSerializer(data={
+            'room_number': '101', 'hostel_name': 'Test Hostel', 'price_per_night': '100.00',
+            'max_occupancy': 2, 'image_upload': self.make_image(),
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        return serializer.save(provider=self.provider_profile)
+
+    def test_upload_is_queued_not_processed_in_request(self):
+        room = self.create_room()
+        upload = RoomImageUpload.objects.get(room=room)
+        self.assertEqual(upload.status, 'pending')
+        self.assertTrue(os.path.exists(upload.file.path))
+        self.assertIsNone(RoomSerializer(room).data['image'])
+
+    def test_worker_publishes_resized_variants(self):
+        room = self.create_room()
+        self.assertEqual(process_pending_uploads(), (1, 0))
+
+        room.refresh_from_db()
+        upload = RoomImageUpload.objects.get(room=room)
+        self.assertEqual(upload.status, 'ready')
+        self.assertFalse(upload.file)
+        self.assertEqual(set(room.image_variants), {'full', 'card', 'thumbnail'})
+        self.assertEqual(RoomSerializer(room).data['image'], room.image_variants['full'])
+
+        listing = RoomListSerializer(room).data
+        self.assertEqual(listing['image'], room.image_variants['card'])
+        self.assertEqual(listing['thumbnail'], room.image_variants['thumbnail'])
+        self.assertNotIn('image_variants', listing)
+
+        for name, max_size in (('full', 1600), ('card', 800), ('thumbnail', 320)):
+            path = os.path.join(MEDIA_ROOT, f"rooms/{room.id}/{upload.id}-{name}.jpg")
+            with Image.open(path) as image:
+                self.assertEqual(image.format, 'JPEG')
+                self.assertEqual(max(image.size), max_size)
+
+    def test_unreadable_upload_is_retried_then_failed(self):
+        room = Room.objects.create(
+            room_number='102', hostel_name='Test Hostel', price_per_night=100.00,
+            max_occupancy=2, provider=self.provider_profile
+        )
+        upload = RoomImageUpload(room=room)
+        upload.file.save('broken.png', SimpleUploadedFile('broken.png', b'not an image'))
+
+        for _ in range(3):
+            self.assertEqual(process_pending_uploads(), (0, 1))
+        upload.refresh_from_db()
+        self.assertEqual(upload.status, 'failed')
+        self.assertEqual(upload.attempts, 3)
+        self.assertEqual(process_pending_uploads(), (0, 0))
+
+    @override_settings(ROOM_IMAGE_LEASE_SECONDS=600)
+    def test_abandoned_upload_is_reclaimed_after_its_lease(self):
+        room = self.create_room()
+        # A worker claims the upload and dies before finishing it
+        [upload] = claim_uploads(10)
+        self.assertEqual(process_pending_uploads(), (0, 0))
+
+        RoomImageUpload.objects.filter(id=upload.id).update(claimed_at=timezone.now() - timedelta(seconds=601))
+        self.assertEqual(process_pending_uploads(), (1, 0))
+        upload.refresh_from_db()
+        self.assertEqual((upload.status, upload.attempts), ('ready', 2))
+        room.refresh_from_db()
+        self.assertTrue(room.image_variants)
+
+    def test_abandoned_upload_fails_after_max_attempts(self):
+        room = self.create_room()
+        RoomImageUpload.objects.filter(room=room).update(
+            status='processing', attempts=3, claimed_at=timezone.now() - timedelta(hours=1)
+        )
+        self.assertEqual(process_pending_uploads(), (0, 0))
+        upload = RoomImageUpload.objects.get(room=room)
+        self.assertEqual((upload.status, upload.attempts), ('failed', 3))
+        self.assertIn('Worker stopped', upload.error)
+
@@ -0,0 +1,161 @@
+from datetime import date, timedelta
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from core.models import User, StudentProfile, ProviderProfile, Room, Booking, Payment, WaitlistEntry
+from core.views.payment_webhook import process_charge_success
+
+
+class WaitlistTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.provider_user = User.objects.create_user(
+            username='provider', email='provider@example.com', password='password', role='provider'
+        )
+        self.provider_profile = ProviderProfile.objects.create(
+            user=self.provider_user, business_name='Test Hostel', contact_person='John Doe',
+            email='provider@example.com', phone_number='0987654321', address='123 Test St', bank_details='Bank'
+        )
+        self.room = Room.objects.create(
+            room_number='101', hostel_name='Test Hostel', price_per_night=100.00,
+            max_occupancy=1, provider=self.provider_profile
+        )
+        self.students = [self.create_student(f'student{i}') for i in range(3)]
+        self.check_in = date.today() + timedelta(days=10)
+        self.check_out = self.check_in + timedelta(days=5)
+        self.booking = Booking.objects.create(
+            student=self.students[0], room=self.room, check_in_date=self.check_in,
+            check_out_date=self.check_out, booking_status='confirmed'
+        )
+        Payment.objects.create(
+            booking=self.booking, amount=500, payment_method='card', transaction_id='ref', status='success'
+        )
+
+    def create_student(self, username):
+        user = User.objects.create_user(username=username, email=f'{username}@example.com', password='password', role='student')
+        return StudentProfile.objects.create(user=user, phone_number='1234567890', date_of_birth='2000-01-01', program='Test')
+
+    def join(self, student, check_in, check_out):
+        self.client.force_authenticate(student.user)
+        return self.client.post('/api/waitlist/', {
+            'room_id': self.room.id, 'check_in_date': check_in, 'check_out_date': check_out,
+        }, format='json')
+
+    def test_join_only_when_full(self):
+        response = self.join(self.students[1], self.check_in, self.check_out)
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(response.data['position'], 1)
+        self.assertEqual(self.join(self.students[1], self.check_in, self.check_out).status_code, 400)
+
+        later = self.check_out + timedelta(days=1)
+        response = self.join(self.students[2], later, later + timedelta(days=2))
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('book it directly', str(response.data['room_id']))
+
+    def test_cancellation_promotes_oldest_fitting_entry(self):
+        inside = self.join(self.students[1], self.check_in + timedelta(days=1), self.check_out - timedelta(days=1)).data
+        second = self.join(self.students[2], self.check_in + timedelta(days=1), self.check_out - timedelta(days=2)).data
+        outside = WaitlistEntry.objects.create(
+            student=self.students[2], room=self.room,
+            check_in_date=self.check_in - timedelta(days=1), check_out_date=self.check_out,
+        )
+
+        self.client.force_authenticate(self.students[0].user)
+        self.assertEqual(self.client.post(f'/api/bookings/{self.booking.id}/cancel/').status_code, 200)
+
+        promoted = WaitlistEntry.objects.get(id=inside['id'])
+        self.assertEqual(promoted.status, 'promoted')
+        self.assertEqual(promoted.booking.booking_status, 'pending')
+        self.assertEqual(promoted.booking.student, self.students[1])
+        # Only one place was freed, and it is held by the promoted booking until it is paid
+        self.assertEqual(WaitlistEntry.objects.get(id=second['id']).status, 'waiting')
+        self.assertEqual(WaitlistEntry.objects.get(id=outside.id).status, 'waiting')
+
+        # The provider rejecting the promoted booking frees the place again
+        self.client.force_authenticate(self.provider_user)
+        response = self.client.post(f'/api/bookings/{promoted.booking.id}/status/', {'status': 'rejected'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        entry = WaitlistEntry.objects.get(id=second['id'])
+        self.assertEqual(entry.status, 'promoted')
+        self.assertEqual(entry.booking.student, self.students[2])
+
+    def test_cancel_entry(self):
+        entry = self.join(self.students[1], self.check_in, self.check_out).data
+        self.client.force_authenticate(self.students[2].user)
+        self.assertEqual(self.client.post(f"/api/waitlist/{entry['id']}/cancel/").status_code, 403)
+
+        self.client.force_authenticate(self.students[1].user)
+        response = self.client.post(f"/api/waitlist/{entry['id']}/cancel/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'cancelled')
+        self.assertEqual([e['status'] for e in self.client.get('/api/waitlist/my/').data], ['cancelled'])
+
+        self.client.force_authenticate(self.students[0].user)
+        self.client.post(f'/api/bookings/{self.booking.id}/cancel/')
+        self.assertFalse(Booking.objects.filter(student=self.students[1]).exists())
+
+    def test_positions_are_computed_in_the_list_query(self):
+        self.join(self.students[1], self.check_in, self.check_out)
+        self.join(self.students[2], self.check_in, self.check_out)
+        inside = self.join(self.students[2], self.check_in + timedelta(days=1), self.check_out - timedelta(days=1)).data
+        self.assertEqual(inside['position'], 3)
+
+        def my_positions(student):
+            self.client.force_authenticate(student.user)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get('/api/waitlist/my/')
+            return len(queries), [entry['position'] for entry in response.json()]
+
+        queries, positions = my_positions(self.students[1])
+        self.assertEqual(positions, [1])
+        self.assertEqual(my_positions(self.students[2]), (queries, [3, 2]))
+
+    def test_promoted_booking_holds_its_place_everywhere(self):
+        self.join(self.students[1], self.check_in, self.check_out)
+        self.client.force_authenticate(self.students[0].user)
+        self.client.post(f'/api/bookings/{self.booking.id}/cancel/')
+        self.assertEqual(WaitlistEntry.objects.get(student=self.students[1]).status, 'promoted')
+
+        # The unpaid promoted booking still fills the room for booking and listing
+        dates = {'check_in': self.check_in, 'check_out': self.check_out}
+        self.assertFalse(self.client.get(f'/api/rooms/{self.room.id}/', dates).json()['is_available'])
+        self.client.force_authenticate(self.students[2].user)
+        response = self.client.post('/api/bookings/', {
+            'room_id': self.room.id, 'check_in_date': self.check_in, 'check_out_date': self.check_out,
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('maximum occupancy', str(response.json()['room_id']))
+        self.assertEqual(self.join(self.students[2], self.check_in, self.check_out).status_code, 201)
+
+    def test_promoted_place_cannot_be_paid_for_by_another_booking(self):
+        competing = Booking.objects.create(
+            student=self.students[2], room=self.room, check_in_date=self.check_in,
+            check_out_date=self.check_out, booking_status='approved'
+        )
+        self.join(self.students[1], self.check_in, self.check_out)
+        self.client.force_authenticate(self.students[0].user)
+        self.client.post(f'/api/bookings/{self.booking.id}/cancel/')
+        self.assertEqual(WaitlistEntry.objects.get(student=self.students[1]).status, 'promoted')
+
+        # A bearer token, which the async payment view (ASYNC_VIEWS) also accepts
+        self.client.force_authenticate(None)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.students[2].user)}')
+        response = self.client.post('/api/payments/initiate/', {
+            'booking_id': competing.id, 'email': 'student2@example.com', 'amount': str(competing.total_amount),
+        }, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('maximum occupancy', response.json()['error'])
+
+        # A charge started before the promotion is not confirmed, and its payment is marked for refund
+        self.assertEqual(process_charge_success({
+            'reference': 'late', 'amount': int(competing.total_amount * 100), 'channel': 'card',
+            'metadata': {'booking_id': competing.id},
+        }), 200)
+        competing.refresh_from_db()
+        self.assertEqual(competing.booking_status, 'approved')
+        payment = competing.payments.get()
+        self.assertEqual(payment.status, 'refunded')
+        self.assertIsNotNone(payment.refunded_at)
+